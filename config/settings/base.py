@@ -96,12 +96,9 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    # Custom middleware
-    "shared.middleware.CorrelationIdMiddleware",
-    "shared.middleware.TenantContextMiddleware",
-    "shared.middleware.SubscriptionContextMiddleware",
-    "shared.middleware.UsageTrackingMiddleware",
-    "shared.middleware.AuditLoggingMiddleware",
+    # Custom middleware: correlation ID, tenant and subscription context,
+    # usage tracking and audit logging in one pass
+    "shared.middleware.RequestContextMiddleware",
 ]
 
 # =============================================================================
@@ -153,7 +150,8 @@ CACHES = {
 
 CHANNEL_LAYERS = {
     "default": {
-        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        # channels_redis layer adding batched sends for notification fan-out
+        "BACKEND": "shared.notifications.layers.BatchingRedisChannelLayer",
         "CONFIG": {
             "hosts": [str(env.redis_url)],
             "capacity": 1500,
@@ -162,6 +160,20 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Opt-in notification service features, applied by SharedConfig at startup
+REALTIME_NOTIFICATIONS = {
+    # Skip notifications for users and groups with no open connection. Only
+    # safe where sends and WebSocket connections share a process, unless
+    # presence is shared too.
+    "PRESENCE_TRACKING": False,
+    # Mirror connection presence to Redis for every process to consult
+    "SHARE_PRESENCE": False,
+    # Send from a background thread, coalescing bursts per channel group
+    "BATCHING": False,
+    # Seconds an identical notification is suppressed for, or None to disable
+    "DEDUP_TTL": None,
+}
+
 # =============================================================================
 # Authentication Backends
 # =============================================================================
@@ -16,10 +16,13 @@ from rest_framework_simplejwt.tokens import AccessToken
 
 import structlog
 
+from shared.consumers.base import MultiNotifyMixin
+from shared.notifications.presence import subscriber_presence
+
 logger = structlog.get_logger()
 
 
-class NotificationConsumer(AsyncJsonWebsocketConsumer):
+class NotificationConsumer(MultiNotifyMixin, AsyncJsonWebsocketConsumer):
     """WebSocket consumer for real-time notifications.
 
     Authenticates users via JWT token and subscribes them to
@@ -75,6 +78,7 @@ class NotificationConsumer(AsyncJsonWebsocketConsumer):
         await self.channel_layer.group_add(self.group_name, self.channel_name)
 
         await self.accept()
+        await subscriber_presence.aadd_user(self.user_id)
 
         logger.info(
             "websocket_connected",
@@ -100,6 +104,7 @@ class NotificationConsumer(AsyncJsonWebsocketConsumer):
         """
         if self.group_name:
             await self.channel_layer.group_discard(self.group_name, self.channel_name)
+            await subscriber_presence.aremove_user(self.user_id)
 
             logger.info(
                 "websocket_disconnected",
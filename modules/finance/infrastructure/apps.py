@@ -10,3 +10,8 @@ class FinanceInfrastructureConfig(AppConfig):
     label = "finance"
     verbose_name = "Finance"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        """Register signal handlers when app is ready."""
+        # Import signals to register them
+        import modules.finance.infrastructure.signals  # noqa: F401
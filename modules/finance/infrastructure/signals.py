@@ -0,0 +1,31 @@
+"""Signal handlers for finance models."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from shared.permissions import invalidate_account_count
+
+if TYPE_CHECKING:
+    from modules.finance.infrastructure.models import Account
+
+# Signals pass every argument by keyword, so the unused ``sender`` cannot be
+# renamed and is left to the catch-all keyword arguments instead.
+
+
+@receiver(post_save, sender="finance.Account")
+def invalidate_account_count_on_create(
+    instance: Account, created: bool, **_kwargs: Any
+) -> None:
+    """Drop the tenant's cached account count when an account is created."""
+    if created:
+        invalidate_account_count(instance.tenant_id)
+
+
+@receiver(post_delete, sender="finance.Account")
+def invalidate_account_count_on_delete(instance: Account, **_kwargs: Any) -> None:
+    """Drop the tenant's cached account count when an account is deleted."""
+    invalidate_account_count(instance.tenant_id)
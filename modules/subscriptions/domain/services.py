@@ -6,12 +6,15 @@ subscription features and usage limits.
 
 from __future__ import annotations
 
+import threading
+import time
 import uuid
 from dataclasses import dataclass, field
-from datetime import date, datetime
-from typing import TYPE_CHECKING, Any
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from django.core.cache import cache
+from django.db.models import F
 from django.utils import timezone
 
 from modules.subscriptions.domain.enums import (
@@ -23,6 +26,9 @@ from modules.subscriptions.domain.enums import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import date
+
     from modules.accounts.infrastructure.models import User
     from modules.subscriptions.infrastructure.models import Subscription, SubscriptionTier
 
@@ -95,6 +101,15 @@ class PermissionService:
     CACHE_TTL = 300  # 5 minutes
     CACHE_PREFIX = "perm_ctx"
 
+    # Per-process copy in front of the shared cache, so most lookups skip the
+    # cache round-trip. Kept short because invalidate_cache only clears the
+    # copy in the process that calls it.
+    LOCAL_CACHE_TTL = 30  # seconds
+    LOCAL_CACHE_MAX_SIZE = 10_000
+
+    _local_cache: ClassVar[dict[uuid.UUID, tuple[float, PermissionContext]]] = {}
+    _local_cache_lock = threading.Lock()
+
     @classmethod
     def _get_cache_key(cls, user_id: uuid.UUID) -> str:
         """Generate cache key for a user's permission context.
@@ -111,7 +126,8 @@ class PermissionService:
     def get_user_context(cls, user: User) -> PermissionContext:
         """Get the permission context for a user.
 
-        Loads from cache if available, otherwise builds from database.
+        Loads from the per-process cache, then the shared cache if
+        available, otherwise builds from database.
 
         Args:
             user: The user to get context for.
@@ -119,16 +135,42 @@ class PermissionService:
         Returns:
             The user's permission context.
         """
+        now = time.monotonic()
+        local = cls._local_cache.get(user.id)
+        if local is not None and local[0] > now:
+            return local[1]
+
         cache_key = cls._get_cache_key(user.id)
-        cached = cache.get(cache_key)
+        context = cache.get(cache_key)
 
-        if cached is not None:
-            return cached
+        if context is None:
+            context = cls._build_context(user)
+            cache.set(cache_key, context, cls.CACHE_TTL)
 
-        context = cls._build_context(user)
-        cache.set(cache_key, context, cls.CACHE_TTL)
+        cls._store_local(user.id, context, now)
         return context
 
+    @classmethod
+    def _store_local(
+        cls, user_id: uuid.UUID, context: PermissionContext, now: float
+    ) -> None:
+        """Keep a permission context in the per-process cache.
+
+        Args:
+            user_id: The user's ID.
+            context: The user's permission context.
+            now: Current time.monotonic() value.
+        """
+        with cls._local_cache_lock:
+            local_cache = cls._local_cache
+            if len(local_cache) >= cls.LOCAL_CACHE_MAX_SIZE:
+                # Drop expired entries; start over if they were all fresh
+                for key in [k for k, v in local_cache.items() if v[0] <= now]:
+                    del local_cache[key]
+                if len(local_cache) >= cls.LOCAL_CACHE_MAX_SIZE:
+                    local_cache.clear()
+            local_cache[user_id] = (now + cls.LOCAL_CACHE_TTL, context)
+
     @classmethod
     def _build_context(cls, user: User) -> PermissionContext:
         """Build permission context from user's subscription.
@@ -213,14 +255,25 @@ class PermissionService:
     def invalidate_cache(cls, user_id: uuid.UUID) -> None:
         """Invalidate the cached permission context for a user.
 
-        Call this when a user's subscription changes.
+        Call this when a user's subscription changes. The shared cache is
+        cleared for every process, but the per-process copy only in this
+        one: other processes may serve the old context for up to
+        ``LOCAL_CACHE_TTL`` seconds.
 
         Args:
             user_id: The user's ID.
         """
+        with cls._local_cache_lock:
+            cls._local_cache.pop(user_id, None)
         cache_key = cls._get_cache_key(user_id)
         cache.delete(cache_key)
 
+    @classmethod
+    def clear_local_cache(cls) -> None:
+        """Drop every permission context cached by this process."""
+        with cls._local_cache_lock:
+            cls._local_cache.clear()
+
 
 class UsageLimitService:
     """Service for tracking and enforcing usage limits."""
@@ -235,8 +288,12 @@ class UsageLimitService:
 
         Returns:
             The current usage count.
+
+        Periodic counts include the increments this process has buffered
+        but not yet written, so limit checks see them before the next flush.
         """
         from modules.subscriptions.infrastructure.models import UsageRecord
+        from modules.subscriptions.infrastructure.usage_buffer import usage_buffer
 
         today = timezone.now().date()
 
@@ -250,15 +307,16 @@ class UsageLimitService:
             # Lifetime count - use model counts directly
             return cls._get_lifetime_count(user, usage_type)
 
+        pending = usage_buffer.pending(user.id, usage_type)
         try:
             record = UsageRecord.objects.get(
                 user=user,
                 usage_type=usage_type,
                 period_start=period_start,
             )
-            return record.count
+            return record.count + pending
         except UsageRecord.DoesNotExist:
-            return 0
+            return pending
 
     @classmethod
     def _get_lifetime_count(cls, user: User, usage_type: str) -> int:
@@ -302,21 +360,11 @@ class UsageLimitService:
         """
         from modules.subscriptions.infrastructure.models import UsageRecord
 
-        today = timezone.now().date()
-
-        if usage_type == UsageType.TRANSACTIONS_MONTHLY.value:
-            period_start = today.replace(day=1)
-            # Calculate period end (last day of month)
-            if today.month == 12:
-                period_end = today.replace(year=today.year + 1, month=1, day=1)
-            else:
-                period_end = today.replace(month=today.month + 1, day=1)
-        elif usage_type == UsageType.API_CALLS_DAILY.value:
-            period_start = today
-            period_end = today
-        else:
+        period = cls._get_period(usage_type, timezone.now().date())
+        if period is None:
             # For lifetime counts, we don't track in UsageRecord
             return cls._get_lifetime_count(user, usage_type)
+        period_start, period_end = period
 
         record, created = UsageRecord.objects.get_or_create(
             user=user,
@@ -334,6 +382,69 @@ class UsageLimitService:
 
         return record.count
 
+    @classmethod
+    def bulk_increment(cls, increments: Mapping[tuple[uuid.UUID, str], int]) -> None:
+        """Apply several buffered usage increments.
+
+        Each count is added in the database with an F() expression, so
+        concurrent flushes from other processes are not lost. Lifetime usage
+        types are not tracked in UsageRecord and are skipped.
+
+        Args:
+            increments: Amount to add per (user ID, usage type).
+        """
+        from modules.subscriptions.infrastructure.models import UsageRecord
+
+        now = timezone.now()
+        today = now.date()
+
+        for (user_id, usage_type), count in increments.items():
+            period = cls._get_period(usage_type, today)
+            if period is None:
+                continue
+            period_start, period_end = period
+
+            records = UsageRecord.objects.filter(
+                user_id=user_id,
+                usage_type=usage_type,
+                period_start=period_start,
+            )
+            if records.update(count=F("count") + count, updated_at=now):
+                continue
+
+            _, created = UsageRecord.objects.get_or_create(
+                user_id=user_id,
+                usage_type=usage_type,
+                period_start=period_start,
+                defaults={"count": count, "period_end": period_end},
+            )
+            if not created:
+                # Created concurrently since the update above
+                records.update(count=F("count") + count, updated_at=now)
+
+    @staticmethod
+    def _get_period(usage_type: str, today: date) -> tuple[date, date] | None:
+        """Get the tracking period containing a day for a usage type.
+
+        Args:
+            usage_type: The type of usage.
+            today: The day to get the period for.
+
+        Returns:
+            Tuple of (period_start, period_end), or None for lifetime counts.
+        """
+        if usage_type == UsageType.TRANSACTIONS_MONTHLY.value:
+            period_start = today.replace(day=1)
+            # Calculate period end (last day of month)
+            if today.month == 12:
+                period_end = today.replace(year=today.year + 1, month=1, day=1)
+            else:
+                period_end = today.replace(month=today.month + 1, day=1)
+            return period_start, period_end
+        if usage_type == UsageType.API_CALLS_DAILY.value:
+            return today, today
+        return None
+
     @classmethod
     def can_perform_action(cls, user: User, limit_key: str) -> tuple[bool, str | None]:
         """Check if a user can perform an action based on their limits.
@@ -0,0 +1,141 @@
+"""Buffered usage tracking.
+
+Usage is counted per request, but writing each increment to the database
+puts a round-trip on every tracked request. The buffer adds increments up
+in memory and a background thread writes them in batches, one update per
+user and usage type per flush.
+
+Increments reach the database up to one flush interval late. Limit checks
+add the increments this process still holds (see ``pending``), but those
+buffered by other processes only count once flushed, so a limit can be
+overshot by what the other processes track within one interval. Pending
+increments are flushed at interpreter exit; a process killed outright
+(e.g. SIGKILL) loses up to one interval of counts.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from django.db import close_old_connections
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+class UsageBuffer:
+    """Accumulates usage increments and flushes them periodically.
+
+    Increments are summed per (user ID, usage type) under a lock. A worker
+    thread swaps the counter out every ``interval`` seconds and passes it to
+    ``flush_func``. Pending increments are also flushed at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        flush_func: Callable[[Mapping[tuple[uuid.UUID, str], int]], None],
+        interval: float = 1.0,
+    ):
+        """Initialize usage buffer.
+
+        Args:
+            flush_func: Function writing summed increments to storage.
+            interval: Seconds between background flushes.
+        """
+        self.flush_func = flush_func
+        self.interval = interval
+        self._counts: Counter[tuple[uuid.UUID, str]] = Counter()
+        # Increments handed to flush_func and not yet written
+        self._in_flight: Counter[tuple[uuid.UUID, str]] = Counter()
+        self._counts_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def add(self, user_id: uuid.UUID, usage_type: str, count: int = 1) -> None:
+        """Buffer a usage increment.
+
+        Args:
+            user_id: The user the usage belongs to.
+            usage_type: The type of usage.
+            count: The amount to increment by.
+        """
+        self._ensure_started()
+        with self._counts_lock:
+            self._counts[(user_id, usage_type)] += count
+
+    def pending(self, user_id: uuid.UUID, usage_type: str) -> int:
+        """Get the increments buffered for a user that are not yet written.
+
+        Args:
+            user_id: The user the usage belongs to.
+            usage_type: The type of usage.
+
+        Returns:
+            The amount not yet reflected in storage.
+        """
+        key = (user_id, usage_type)
+        with self._counts_lock:
+            return self._counts[key] + self._in_flight[key]
+
+    def flush(self) -> None:
+        """Write everything currently buffered from the calling thread."""
+        with self._counts_lock:
+            counts, self._counts = self._counts, Counter()
+            self._in_flight += counts
+        if not counts:
+            return
+        try:
+            self.flush_func(counts)
+        finally:
+            with self._counts_lock:
+                self._in_flight -= counts
+
+    def _ensure_started(self) -> None:
+        """Start the background flusher thread on first use."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="usage-buffer",
+                    daemon=True,
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        """Flusher loop: write buffered increments every interval."""
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception as e:
+                # The batch is dropped, as a failed per-request write was
+                logger.error(
+                    "Failed to flush usage increments",
+                    extra={"error": str(e)},
+                    exc_info=True,
+                )
+            finally:
+                # This thread holds its own database connection
+                close_old_connections()
+
+
+def _bulk_increment(increments: Mapping[tuple[uuid.UUID, str], int]) -> None:
+    """Write increments through UsageLimitService."""
+    from modules.subscriptions.domain.services import UsageLimitService
+
+    UsageLimitService.bulk_increment(increments)
+
+
+# Singleton instance
+usage_buffer = UsageBuffer(_bulk_increment)
@@ -10,3 +10,13 @@ class SharedConfig(AppConfig):
     name = "shared"
     label = "shared"
     verbose_name = "Shared Utilities"
+
+    def ready(self) -> None:
+        """Connect domain event handlers and configure notifications."""
+        from django.conf import settings
+
+        from shared.events.handlers import register_event_handlers
+        from shared.notifications.service import configure_notifications
+
+        register_event_handlers()
+        configure_notifications(getattr(settings, "REALTIME_NOTIFICATIONS", {}))
@@ -1,6 +1,10 @@
 """WebSocket consumers for real-time updates."""
 
-from shared.consumers.base import AuthenticatedConsumer
+from shared.consumers.base import (
+    AuthenticatedConsumer,
+    ConcurrentDispatchMixin,
+    MultiNotifyMixin,
+)
 from shared.consumers.finance import FinanceConsumer
 from shared.consumers.health import (
     BackpressureHandler,
@@ -14,9 +18,11 @@ from shared.consumers.social import SocialConsumer
 __all__ = [
     "AuthenticatedConsumer",
     "BackpressureHandler",
+    "ConcurrentDispatchMixin",
     "ConnectionState",
     "FinanceConsumer",
     "HealthMonitor",
+    "MultiNotifyMixin",
     "SocialConsumer",
     "backpressure_handler",
     "health_monitor",
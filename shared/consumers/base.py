@@ -2,19 +2,168 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+from collections import OrderedDict
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from typing import Any
 from urllib.parse import parse_qs
 
+from channels.consumer import get_handler_name
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.tokens import AccessToken
 
+from shared.notifications.presence import subscriber_presence
+from shared.notifications.types import NotificationChannel
+
 logger = logging.getLogger(__name__)
 
+# Frame encoder: compact separators and raw UTF-8 text keep frames small, and
+# one shared instance avoids building an encoder per json.dumps call with
+# non-default options
+_frame_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# Channel templates keyed by user ID that a user may always subscribe to
+USER_CHANNEL_TEMPLATES = (
+    NotificationChannel.USER_NOTIFICATIONS,
+    NotificationChannel.FINANCE_UPDATES,
+    NotificationChannel.SOCIAL_UPDATES,
+)
+
+
+# Frames collected while unpacking a batch. A context variable rather than an
+# attribute, so handlers running concurrently on the same consumer never
+# collect each other's frames.
+_frame_buffer_var: ContextVar[list[dict[str, Any]] | None] = ContextVar(
+    "frame_buffer", default=None
+)
+
+
+class MultiNotifyMixin:
+    """Unpacks coalesced ``multi.notify`` channel layer messages.
+
+    Each inner message is dispatched to its regular handler. The frames those
+    handlers send are collected and forwarded to the client as a single
+    ``{"type": "multi", "payload": [...]}`` frame.
+    """
+
+    async def send_json(self, content: dict[str, Any], close: bool = False) -> None:
+        """Send a JSON frame, or collect it while unpacking a batch."""
+        frame_buffer = _frame_buffer_var.get()
+        if frame_buffer is not None and not close:
+            frame_buffer.append(content)
+            return
+        await super().send_json(content, close=close)  # type: ignore[misc]
+
+    async def multi_notify(self, event: dict[str, Any]) -> None:
+        """Handle a batch of messages from the channel layer."""
+        frames: list[dict[str, Any]] = []
+        token = _frame_buffer_var.set(frames)
+        try:
+            for message in event.get("messages", []):
+                if self._is_repeat_notification(message):
+                    continue
+                handler = getattr(self, get_handler_name(message), None)
+                if handler is not None:
+                    await handler(message)
+        finally:
+            _frame_buffer_var.reset(token)
+
+        if frames:
+            await self.send_json({"type": "multi", "payload": frames})
+
+    def _is_repeat_notification(self, message: dict[str, Any]) -> bool:  # noqa: ARG002
+        """Check if a message repeats a notification already delivered.
+
+        Nothing is a repeat here; consumers that deduplicate override this.
+        """
+        return False
+
+
+class ConcurrentDispatchMixin:
+    """Handles client and channel layer messages without blocking each other.
+
+    Channels awaits each handler before reading the next message, so a slow
+    client request (e.g. a subscription check hitting the database) holds
+    back every notification queued for the connection. Here client messages
+    and channel layer messages each run as tasks in their own lane: a lane
+    handles its messages one at a time and in order, but the two lanes run
+    concurrently. At most ``max_concurrent_dispatch`` messages are in flight;
+    reading waits for a free slot beyond that.
+
+    Connect and disconnect are still handled inline, and messages in flight
+    are cancelled before a disconnect is handled.
+    """
+
+    max_concurrent_dispatch: int = 64
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize dispatch lanes."""
+        super().__init__(*args, **kwargs)
+        self._dispatch_slots = asyncio.Semaphore(self.max_concurrent_dispatch)
+        self._client_lane = asyncio.Lock()
+        self._layer_lane = asyncio.Lock()
+        self._dispatch_tasks: set[asyncio.Task[None]] = set()
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        """Run the consumer, cancelling messages in flight when it stops."""
+        try:
+            await super().__call__(scope, receive, send)  # type: ignore[misc]
+        finally:
+            self._cancel_dispatch_tasks()
+
+    async def dispatch(self, message: dict[str, Any]) -> None:
+        """Schedule a message on its lane, or handle lifecycle events inline."""
+        message_type = message["type"]
+        if message_type == "websocket.connect":
+            await super().dispatch(message)  # type: ignore[misc]
+            return
+        if message_type == "websocket.disconnect":
+            self._cancel_dispatch_tasks()
+            await super().dispatch(message)  # type: ignore[misc]
+            return
 
-class AuthenticatedConsumer(AsyncJsonWebsocketConsumer):
+        lane = (
+            self._client_lane
+            if message_type == "websocket.receive"
+            else self._layer_lane
+        )
+        await self._dispatch_slots.acquire()
+        task = asyncio.create_task(self._dispatch_in_lane(lane, message))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch_in_lane(
+        self, lane: asyncio.Lock, message: dict[str, Any]
+    ) -> None:
+        """Handle a message once its lane is free, logging any failure."""
+        try:
+            async with lane:
+                await super().dispatch(message)  # type: ignore[misc]
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.error(
+                "WebSocket message handler failed",
+                extra={
+                    "message_type": message.get("type"),
+                    "consumer": self.__class__.__name__,
+                },
+                exc_info=True,
+            )
+        finally:
+            self._dispatch_slots.release()
+
+    def _cancel_dispatch_tasks(self) -> None:
+        """Cancel every message still in flight."""
+        for task in self._dispatch_tasks:
+            task.cancel()
+
+
+class AuthenticatedConsumer(MultiNotifyMixin, AsyncJsonWebsocketConsumer):
     """Base consumer with JWT authentication support.
 
     Subclasses should implement:
@@ -26,12 +175,56 @@ class AuthenticatedConsumer(AsyncJsonWebsocketConsumer):
     user_id: str | None = None
     tenant_id: str | None = None
     connected_at: datetime | None = None
+    connected_at_iso: str | None = None
     last_ping: datetime | None = None
 
+    # Channels scoped to the connected user, resolved on first use
+    _user_channels: frozenset[str] | None = None
+    # User ID recorded in subscriber presence, released on disconnect
+    _presence_user_id: str | None = None
+    # (message type, notification ID) pairs recently delivered to this
+    # connection, oldest first
+    _seen_notifications: OrderedDict[tuple[str, str], None] | None = None
+
     # Configuration
     require_auth: bool = True
     ping_interval: int = 30  # seconds
     max_message_size: int = 64 * 1024  # 64KB
+    max_seen_notifications: int = 256
+
+    @classmethod
+    async def encode_json(cls, content: dict[str, Any]) -> str:
+        """Encode an outgoing frame as compact JSON."""
+        return _frame_encoder.encode(content)
+
+    async def dispatch(self, message: dict[str, Any]) -> None:
+        """Dispatch a message, dropping notifications already delivered."""
+        if self._is_repeat_notification(message):
+            return
+        await super().dispatch(message)
+
+    def _is_repeat_notification(self, message: dict[str, Any]) -> bool:
+        """Check if a message repeats a notification already delivered.
+
+        A notification sent to several groups this connection has joined
+        arrives once per group. Copies of the same message type are dropped
+        after the first; distinct types sharing a notification ID (e.g. an
+        account update and a finance update) are all delivered.
+        """
+        notification_id = message.get("notification_id")
+        if notification_id is None:
+            return False
+
+        key = (message["type"], notification_id)
+        seen = self._seen_notifications
+        if seen is None:
+            seen = self._seen_notifications = OrderedDict()
+        if key in seen:
+            return True
+        seen[key] = None
+        if len(seen) > self.max_seen_notifications:
+            seen.popitem(last=False)
+        return False
 
     async def connect(self) -> None:
         """Handle WebSocket connection."""
@@ -41,6 +234,7 @@ class AuthenticatedConsumer(AsyncJsonWebsocketConsumer):
                 return
 
         self.connected_at = datetime.now(timezone.utc)
+        self.connected_at_iso = self.connected_at.isoformat()
         self.last_ping = self.connected_at
 
         # Subscribe to groups
@@ -49,11 +243,15 @@ class AuthenticatedConsumer(AsyncJsonWebsocketConsumer):
 
         await self.accept()
 
+        if self.user_id:
+            await subscriber_presence.aadd_user(self.user_id)
+            self._presence_user_id = self.user_id
+
         # Send connection confirmation
         await self.send_json({
             "type": "connection.established",
             "user_id": self.user_id,
-            "connected_at": self.connected_at.isoformat(),
+            "connected_at": self.connected_at_iso,
         })
 
         logger.info(
@@ -71,6 +269,10 @@ class AuthenticatedConsumer(AsyncJsonWebsocketConsumer):
         for group in await self.get_groups():
             await self.channel_layer.group_discard(group, self.channel_name)
 
+        if self._presence_user_id is not None:
+            await subscriber_presence.aremove_user(self._presence_user_id)
+            self._presence_user_id = None
+
         logger.info(
             "WebSocket disconnected",
             extra={
@@ -201,9 +403,23 @@ class AuthenticatedConsumer(AsyncJsonWebsocketConsumer):
             True if subscription is allowed.
         """
         # By default, only allow user-specific channels
-        if self.user_id and self.user_id in channel:
-            return True
-        return False
+        return channel in self.get_user_channels()
+
+    def get_user_channels(self) -> frozenset[str]:
+        """Get the channel names owned by the connected user.
+
+        Returns:
+            Exact channel names, so ownership checks are a set lookup
+            rather than a substring search on the user ID.
+        """
+        if self._user_channels is None:
+            if not self.user_id:
+                return frozenset()
+            self._user_channels = frozenset(
+                template.format(user_id=self.user_id)
+                for template in USER_CHANNEL_TEMPLATES
+            )
+        return self._user_channels
 
     # Message handlers for channel layer events
     async def notification_message(self, event: dict[str, Any]) -> None:
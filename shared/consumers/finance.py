@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, ClassVar
 
-from shared.consumers.base import AuthenticatedConsumer
+from shared.consumers.base import AuthenticatedConsumer, ConcurrentDispatchMixin
 from shared.notifications.types import NotificationChannel
 
 logger = logging.getLogger(__name__)
 
 
-class FinanceConsumer(AuthenticatedConsumer):
+class FinanceConsumer(ConcurrentDispatchMixin, AuthenticatedConsumer):
     """WebSocket consumer for finance-related real-time updates.
 
     Provides real-time updates for:
@@ -23,6 +23,13 @@ class FinanceConsumer(AuthenticatedConsumer):
     Connect via: ws://host/ws/finance/?token=<jwt_access_token>
     """
 
+    # Client message type -> handler method, each taking the message content
+    _MESSAGE_HANDLERS: ClassVar[dict[str, str]] = {
+        "subscribe_account": "_subscribe_to_account",
+        "unsubscribe_account": "_unsubscribe_from_account",
+        "get_status": "_send_status",
+    }
+
     # Track subscribed accounts
     subscribed_accounts: set[str]
 
@@ -45,21 +52,17 @@ class FinanceConsumer(AuthenticatedConsumer):
 
     async def handle_message(self, content: dict[str, Any]) -> None:
         """Handle incoming messages from client."""
-        message_type = content.get("type", "")
-
-        if message_type == "subscribe_account":
-            await self._subscribe_to_account(content.get("account_id"))
-        elif message_type == "unsubscribe_account":
-            await self._unsubscribe_from_account(content.get("account_id"))
-        elif message_type == "get_status":
-            await self._send_status()
-        else:
+        handler_name = self._MESSAGE_HANDLERS.get(content.get("type", ""))
+        if handler_name is None:
             await super().handle_message(content)
+            return
+
+        await getattr(self, handler_name)(content)
 
     async def can_subscribe(self, channel: str) -> bool:
         """Check if user can subscribe to a channel."""
         # Allow user's own channels
-        if self.user_id and self.user_id in channel:
+        if channel in self.get_user_channels():
             return True
 
         # Allow account channels the user has access to
@@ -69,8 +72,9 @@ class FinanceConsumer(AuthenticatedConsumer):
 
         return False
 
-    async def _subscribe_to_account(self, account_id: str | None) -> None:
+    async def _subscribe_to_account(self, content: dict[str, Any]) -> None:
         """Subscribe to a specific account's updates."""
+        account_id = content.get("account_id")
         if not account_id:
             await self.send_json({
                 "type": "error",
@@ -88,16 +92,18 @@ class FinanceConsumer(AuthenticatedConsumer):
             "account_id": account_id,
         })
 
-        logger.debug(
-            "Subscribed to account updates",
-            extra={
-                "user_id": self.user_id,
-                "account_id": account_id,
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Subscribed to account updates",
+                extra={
+                    "user_id": self.user_id,
+                    "account_id": account_id,
+                },
+            )
 
-    async def _unsubscribe_from_account(self, account_id: str | None) -> None:
+    async def _unsubscribe_from_account(self, content: dict[str, Any]) -> None:
         """Unsubscribe from a specific account's updates."""
+        account_id = content.get("account_id")
         if not account_id:
             return
 
@@ -111,12 +117,12 @@ class FinanceConsumer(AuthenticatedConsumer):
             "account_id": account_id,
         })
 
-    async def _send_status(self) -> None:
+    async def _send_status(self, _content: dict[str, Any]) -> None:
         """Send current connection status."""
         await self.send_json({
             "type": "status",
             "user_id": self.user_id,
-            "connected_at": self.connected_at.isoformat() if self.connected_at else None,
+            "connected_at": self.connected_at_iso,
             "subscribed_accounts": list(self.subscribed_accounts),
         })
 
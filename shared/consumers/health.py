@@ -7,23 +7,36 @@ including ping/pong heartbeats, connection timeouts, and backpressure handling.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Coroutine
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 if TYPE_CHECKING:
     from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
 logger = logging.getLogger(__name__)
 
+# Connection IDs are a per-process random prefix plus a counter, so accepting
+# a connection does not need a urandom call while IDs stay unique across workers
+_PROCESS_PREFIX = uuid4().hex[:8]
+_connection_counter = itertools.count()
+
+
+def _next_connection_id() -> str:
+    """Generate a process-unique connection ID."""
+    return f"{_PROCESS_PREFIX}-{next(_connection_counter)}"
+
 
 @dataclass
 class ConnectionState:
     """State tracking for a WebSocket connection."""
 
-    connection_id: UUID = field(default_factory=uuid4)
+    connection_id: str = field(default_factory=_next_connection_id)
     user_id: str | None = None
     connected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     last_ping: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
@@ -33,6 +46,9 @@ class ConnectionState:
     bytes_received: int = 0
     is_healthy: bool = True
     missed_pongs: int = 0
+    on_unhealthy: Callable[[], None] | None = field(
+        default=None, repr=False, compare=False
+    )
 
     def record_ping(self) -> None:
         """Record that a ping was sent."""
@@ -52,8 +68,15 @@ class ConnectionState:
             self.bytes_sent += size
 
     def mark_unhealthy(self) -> None:
-        """Mark connection as unhealthy."""
+        """Mark connection as unhealthy.
+
+        Notifies the ``on_unhealthy`` callback on the first transition only.
+        """
+        if not self.is_healthy:
+            return
         self.is_healthy = False
+        if self.on_unhealthy is not None:
+            self.on_unhealthy()
 
     def get_latency_ms(self) -> float | None:
         """Get latency in milliseconds based on last ping/pong."""
@@ -65,7 +88,7 @@ class ConnectionState:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
-            "connection_id": str(self.connection_id),
+            "connection_id": self.connection_id,
             "user_id": self.user_id,
             "connected_at": self.connected_at.isoformat(),
             "last_ping": self.last_ping.isoformat(),
@@ -103,6 +126,8 @@ class HealthMonitor:
         self.max_missed_pongs = max_missed_pongs
         self._connections: dict[str, ConnectionState] = {}
         self._ping_tasks: dict[str, asyncio.Task] = {}
+        # Maintained by ConnectionState.on_unhealthy so lookups are O(unhealthy)
+        self._unhealthy: set[str] = set()
 
     def register_connection(
         self,
@@ -118,15 +143,20 @@ class HealthMonitor:
         Returns:
             The connection state object.
         """
-        state = ConnectionState(user_id=user_id)
-        self._connections[channel_name] = state
-        logger.debug(
-            "Registered connection for health monitoring",
-            extra={
-                "channel_name": channel_name,
-                "connection_id": str(state.connection_id),
-            },
+        state = ConnectionState(
+            user_id=user_id,
+            on_unhealthy=partial(self._unhealthy.add, channel_name),
         )
+        self._connections[channel_name] = state
+        self._unhealthy.discard(channel_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Registered connection for health monitoring",
+                extra={
+                    "channel_name": channel_name,
+                    "connection_id": state.connection_id,
+                },
+            )
         return state
 
     def unregister_connection(self, channel_name: str) -> None:
@@ -140,12 +170,14 @@ class HealthMonitor:
             self._ping_tasks[channel_name].cancel()
             del self._ping_tasks[channel_name]
 
+        self._unhealthy.discard(channel_name)
         if channel_name in self._connections:
             del self._connections[channel_name]
-            logger.debug(
-                "Unregistered connection from health monitoring",
-                extra={"channel_name": channel_name},
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Unregistered connection from health monitoring",
+                    extra={"channel_name": channel_name},
+                )
 
     def get_connection_state(self, channel_name: str) -> ConnectionState | None:
         """Get the state of a connection.
@@ -218,13 +250,14 @@ class HealthMonitor:
                     # Check if pong was received
                     if state.last_pong is None or state.last_pong < state.last_ping:
                         state.missed_pongs += 1
-                        logger.warning(
-                            "Missed pong from connection",
-                            extra={
-                                "channel_name": channel_name,
-                                "missed_count": state.missed_pongs,
-                            },
-                        )
+                        if logger.isEnabledFor(logging.WARNING):
+                            logger.warning(
+                                "Missed pong from connection",
+                                extra={
+                                    "channel_name": channel_name,
+                                    "missed_count": state.missed_pongs,
+                                },
+                            )
 
                         if state.missed_pongs >= self.max_missed_pongs:
                             state.mark_unhealthy()
@@ -270,11 +303,7 @@ class HealthMonitor:
         Returns:
             List of channel names for unhealthy connections.
         """
-        return [
-            channel
-            for channel, state in self._connections.items()
-            if not state.is_healthy
-        ]
+        return list(self._unhealthy)
 
 
 class BackpressureHandler:
@@ -303,6 +332,9 @@ class BackpressureHandler:
         self._queues: dict[str, asyncio.Queue] = {}
         self._backpressure_active: dict[str, bool] = {}
         self._worker_tasks: dict[str, asyncio.Task] = {}
+        # Seconds between repeated drop warnings for the same connection
+        self.drop_log_interval = 1.0
+        self._last_drop_log: dict[str, float] = {}
 
     def register_connection(self, channel_name: str) -> None:
         """Register a connection for backpressure handling.
@@ -325,6 +357,7 @@ class BackpressureHandler:
 
         self._queues.pop(channel_name, None)
         self._backpressure_active.pop(channel_name, None)
+        self._last_drop_log.pop(channel_name, None)
 
     async def queue_message(
         self,
@@ -350,21 +383,44 @@ class BackpressureHandler:
         if queue.qsize() >= self.high_watermark:
             self._backpressure_active[channel_name] = True
             if priority <= 0:
-                logger.warning(
-                    "Dropping low-priority message due to backpressure",
-                    extra={"channel_name": channel_name, "queue_size": queue.qsize()},
-                )
+                if self._should_log_drop(channel_name):
+                    logger.warning(
+                        "Dropping low-priority message due to backpressure",
+                        extra={
+                            "channel_name": channel_name,
+                            "queue_size": queue.qsize(),
+                        },
+                    )
                 return False
 
         try:
             queue.put_nowait((priority, message))
             return True
         except asyncio.QueueFull:
-            logger.warning(
-                "Message queue full, dropping message",
-                extra={"channel_name": channel_name},
-            )
+            if self._should_log_drop(channel_name):
+                logger.warning(
+                    "Message queue full, dropping message",
+                    extra={"channel_name": channel_name},
+                )
+            return False
+
+    def _should_log_drop(self, channel_name: str) -> bool:
+        """Rate-limit drop warnings to one per interval per connection.
+
+        Args:
+            channel_name: The channel name identifying this connection.
+
+        Returns:
+            True if a drop warning should be logged now.
+        """
+        if not logger.isEnabledFor(logging.WARNING):
+            return False
+
+        now = time.monotonic()
+        if now - self._last_drop_log.get(channel_name, 0.0) < self.drop_log_interval:
             return False
+        self._last_drop_log[channel_name] = now
+        return True
 
     async def start_worker(
         self,
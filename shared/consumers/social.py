@@ -3,15 +3,29 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, ClassVar
+from uuid import UUID
 
-from shared.consumers.base import AuthenticatedConsumer
+from channels.db import database_sync_to_async
+
+from shared.consumers.base import AuthenticatedConsumer, ConcurrentDispatchMixin
+from shared.notifications.presence import subscriber_presence
 from shared.notifications.types import NotificationChannel
 
 logger = logging.getLogger(__name__)
 
+_EXPENSE_GROUP_PREFIX = NotificationChannel.EXPENSE_GROUP_UPDATES.format(group_id="")
+
+
+def _parse_group_id(value: Any) -> UUID | None:
+    """Parse a client-supplied expense group ID, or None if it is malformed."""
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
 
-class SocialConsumer(AuthenticatedConsumer):
+class SocialConsumer(ConcurrentDispatchMixin, AuthenticatedConsumer):
     """WebSocket consumer for social finance real-time updates.
 
     Provides real-time updates for:
@@ -23,14 +37,32 @@ class SocialConsumer(AuthenticatedConsumer):
     Connect via: ws://host/ws/social/?token=<jwt_access_token>
     """
 
+    # Client message type -> handler method, each taking the message content
+    _MESSAGE_HANDLERS: ClassVar[dict[str, str]] = {
+        "subscribe_group": "_subscribe_to_group",
+        "unsubscribe_group": "_unsubscribe_from_group",
+        "get_status": "_send_status",
+    }
+
     # Track subscribed expense groups
     subscribed_groups: set[str]
+    # Snapshot of subscribed_groups, refreshed on each subscription change
+    _subscribed_groups_snapshot: tuple[str, ...]
 
     async def connect(self) -> None:
         """Handle WebSocket connection."""
         self.subscribed_groups = set()
+        self._subscribed_groups_snapshot = ()
         await super().connect()
 
+    async def disconnect(self, close_code: int) -> None:
+        """Handle WebSocket disconnection."""
+        for group_id in self._subscribed_groups_snapshot:
+            await subscriber_presence.aremove_group(group_id)
+        self.subscribed_groups.clear()
+        self._subscribed_groups_snapshot = ()
+        await super().disconnect(close_code)
+
     async def get_groups(self) -> list[str]:
         """Get social finance groups to subscribe to."""
         if not self.user_id:
@@ -45,42 +77,79 @@ class SocialConsumer(AuthenticatedConsumer):
 
     async def handle_message(self, content: dict[str, Any]) -> None:
         """Handle incoming messages from client."""
-        message_type = content.get("type", "")
-
-        if message_type == "subscribe_group":
-            await self._subscribe_to_group(content.get("group_id"))
-        elif message_type == "unsubscribe_group":
-            await self._unsubscribe_from_group(content.get("group_id"))
-        elif message_type == "get_status":
-            await self._send_status()
-        else:
+        handler_name = self._MESSAGE_HANDLERS.get(content.get("type", ""))
+        if handler_name is None:
             await super().handle_message(content)
+            return
+
+        await getattr(self, handler_name)(content)
 
     async def can_subscribe(self, channel: str) -> bool:
         """Check if user can subscribe to a channel."""
         # Allow user's own channels
-        if self.user_id and self.user_id in channel:
+        if channel in self.get_user_channels():
             return True
 
-        # Allow expense group channels the user is a member of
-        if channel.startswith("expense_group_"):
-            # In production, verify group membership
-            return True
+        # Allow expense group channels the user is currently a member of
+        if channel.startswith(_EXPENSE_GROUP_PREFIX):
+            group_id = _parse_group_id(channel[len(_EXPENSE_GROUP_PREFIX):])
+            return group_id is not None and await self._is_group_member(group_id)
 
         return False
 
-    async def _subscribe_to_group(self, group_id: str | None) -> None:
+    @database_sync_to_async
+    def _is_group_member(self, group_id: UUID) -> bool:
+        """Check if the user owns or is a member of an expense group.
+
+        Queried on every subscribe, so membership changes apply without
+        reconnecting.
+        """
+        from django.db.models import Q
+
+        from modules.social.infrastructure.models import ExpenseGroup
+
+        if not self.user_id:
+            return False
+
+        return ExpenseGroup.objects.filter(
+            Q(tenant_id=self.tenant_id or self.user_id)
+            | Q(member_contacts__linked_user_id=self.user_id),
+            id=group_id,
+        ).exists()
+
+    async def _subscribe_to_group(self, content: dict[str, Any]) -> None:
         """Subscribe to an expense group's updates."""
-        if not group_id:
+        raw_group_id = content.get("group_id")
+        if not raw_group_id:
             await self.send_json({
                 "type": "error",
                 "message": "group_id is required",
             })
             return
 
+        parsed_group_id = _parse_group_id(raw_group_id)
+        if parsed_group_id is None:
+            await self.send_json({
+                "type": "error",
+                "message": "group_id must be a UUID",
+            })
+            return
+
+        # Canonical form, so presence and channel names match the server's
+        group_id = str(parsed_group_id)
         channel = NotificationChannel.EXPENSE_GROUP_UPDATES.format(group_id=group_id)
+        if not await self.can_subscribe(channel):
+            await self.send_json({
+                "type": "error",
+                "message": f"Not authorized to subscribe to {channel}",
+            })
+            return
+
         await self.channel_layer.group_add(channel, self.channel_name)
+        if group_id not in self.subscribed_groups:
+            await subscriber_presence.aadd_group(group_id)
         self.subscribed_groups.add(group_id)
+        self._subscribed_groups_snapshot = tuple(self.subscribed_groups)
 
         await self.send_json({
             "type": "subscribed",
@@ -88,22 +157,28 @@ class SocialConsumer(AuthenticatedConsumer):
             "group_id": group_id,
         })
 
-        logger.debug(
-            "Subscribed to expense group updates",
-            extra={
-                "user_id": self.user_id,
-                "group_id": group_id,
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Subscribed to expense group updates",
+                extra={
+                    "user_id": self.user_id,
+                    "group_id": group_id,
+                },
+            )
 
-    async def _unsubscribe_from_group(self, group_id: str | None) -> None:
+    async def _unsubscribe_from_group(self, content: dict[str, Any]) -> None:
         """Unsubscribe from an expense group's updates."""
-        if not group_id:
+        parsed_group_id = _parse_group_id(content.get("group_id"))
+        if parsed_group_id is None:
             return
 
+        group_id = str(parsed_group_id)
         channel = NotificationChannel.EXPENSE_GROUP_UPDATES.format(group_id=group_id)
         await self.channel_layer.group_discard(channel, self.channel_name)
+        if group_id in self.subscribed_groups:
+            await subscriber_presence.aremove_group(group_id)
         self.subscribed_groups.discard(group_id)
+        self._subscribed_groups_snapshot = tuple(self.subscribed_groups)
 
         await self.send_json({
             "type": "unsubscribed",
@@ -111,13 +186,13 @@ class SocialConsumer(AuthenticatedConsumer):
             "group_id": group_id,
         })
 
-    async def _send_status(self) -> None:
+    async def _send_status(self, _content: dict[str, Any]) -> None:
         """Send current connection status."""
         await self.send_json({
             "type": "status",
             "user_id": self.user_id,
-            "connected_at": self.connected_at.isoformat() if self.connected_at else None,
-            "subscribed_groups": list(self.subscribed_groups),
+            "connected_at": self.connected_at_iso,
+            "subscribed_groups": self._subscribed_groups_snapshot,
         })
 
     # Channel layer event handlers
@@ -1,13 +1,16 @@
 """Event handling infrastructure for real-time updates."""
 
 from shared.events.handlers import (
-    FinanceEventHandler,
-    SocialEventHandler,
+    FINANCE_HANDLERS,
+    SOCIAL_HANDLERS,
     register_event_handlers,
 )
+from shared.events.signals import EVENT_SIGNALS, emit_event
 
 __all__ = [
-    "FinanceEventHandler",
-    "SocialEventHandler",
+    "EVENT_SIGNALS",
+    "FINANCE_HANDLERS",
+    "SOCIAL_HANDLERS",
+    "emit_event",
     "register_event_handlers",
 ]
@@ -7,382 +7,608 @@ dispatch real-time notifications to connected WebSocket clients.
 from __future__ import annotations
 
 import logging
-from decimal import Decimal
-from typing import Any, Callable
+import sys
+from functools import partial
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from shared.events.signals import EVENT_SIGNALS
+from shared.notifications.dispatcher import notification_dispatcher
 from shared.notifications.service import notification_service
 from shared.notifications.types import NotificationType
 
-logger = logging.getLogger(__name__)
-
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-class FinanceEventHandler:
-    """Handler for finance domain events.
+logger = logging.getLogger(__name__)
 
-    Converts finance domain events into real-time notifications.
+# Bound service methods, looked up once instead of on every event. Domain
+# updates cascade by default to the user's general notification channel, the
+# only one the notification bell listens on.
+_send_finance = notification_service.send_finance_update
+_send_account = notification_service.send_account_update
+_send_social = notification_service.send_social_update
+_send_group = notification_service.send_expense_group_update
+_has_subscribers = notification_service.has_subscribers
+_group_has_subscribers = notification_service.group_has_subscribers
+
+# Notification messages keyed by event, with a suffix for conditional variants
+_MESSAGE_TEMPLATES: dict[str, str] = {
+    "account_created": "New {account_type} account '{name}' has been created.",
+    "account_updated": "Account '{name}' has been updated.",
+    "account_closed": "Account '{name}' has been closed.",
+    "transaction_created": "New {transaction_type} of {amount} {currency_code}",
+    "transaction_posted": "Account balance is now {new_balance} {currency_code}",
+    "transfer_completed": "Transfer of {amount} {currency_code} completed.",
+    "net_worth_updated": "Your net worth is {net_worth} {currency_code}",
+    "peer_debt_created.lent": "You lent {amount} {currency_code} to {contact_name}",
+    "peer_debt_created.borrowed": (
+        "You borrowed {amount} {currency_code} from {contact_name}"
+    ),
+    "peer_debt_settled.full": "Debt with {contact_name} fully settled",
+    "peer_debt_settled.partial": (
+        "Partial settlement of {settlement_amount} {currency_code} with {contact_name}"
+    ),
+    "group_expense_created": (
+        "'{description}' for {total_amount} {currency_code} in {group_name}"
+    ),
+    "expense_group_member_added": "{contact_name} has been added to {group_name}",
+    "settlement_created.paid": "You paid {amount} {currency_code} to {contact_name}",
+    "settlement_created.received": "{contact_name} paid you {amount} {currency_code}",
+    "balance_updated.they_owe_you": (
+        "{contact_name} owes you {net_balance} {currency_code}"
+    ),
+    "balance_updated.you_owe_them": (
+        "You owe {contact_name} {net_balance} {currency_code}"
+    ),
+    "balance_updated.settled": "You are settled up with {contact_name}",
+}
+
+_BALANCE_MESSAGE_KEYS = {
+    "they_owe_you": "balance_updated.they_owe_you",
+    "you_owe_them": "balance_updated.you_owe_them",
+}
+
+
+def _dispatch(send: Callable[..., None], **kwargs: Any) -> None:
+    """Run a notification send off the request thread.
+
+    Inside ``notification_service.batch()`` the send is held by the batch
+    and reaches the dispatcher with the rest of it when the block exits.
     """
-
-    def handle_account_created(
-        self,
-        user_id: UUID,
-        account_id: UUID,
-        name: str,
-        account_type: str,
-        currency_code: str,
-    ) -> None:
-        """Handle account created event."""
-        notification_service.send_finance_update(
-            user_id=user_id,
-            notification_type=NotificationType.ACCOUNT_CREATED,
-            title="Account Created",
-            message=f"New {account_type.lower()} account '{name}' has been created.",
-            data={
-                "account_id": str(account_id),
-                "name": name,
-                "account_type": account_type,
-                "currency_code": currency_code,
-            },
-        )
-
-    def handle_account_updated(
-        self,
-        user_id: UUID,
-        account_id: UUID,
-        name: str,
-        updated_fields: list[str],
-    ) -> None:
-        """Handle account updated event."""
-        notification_service.send_account_update(
-            account_id=account_id,
-            user_id=user_id,
-            notification_type=NotificationType.ACCOUNT_UPDATED,
-            title="Account Updated",
-            message=f"Account '{name}' has been updated.",
-            data={
-                "updated_fields": updated_fields,
-            },
-        )
-
-    def handle_account_closed(
-        self,
-        user_id: UUID,
-        account_id: UUID,
-        name: str,
-        final_balance: str,
-    ) -> None:
-        """Handle account closed event."""
-        notification_service.send_account_update(
-            account_id=account_id,
-            user_id=user_id,
-            notification_type=NotificationType.ACCOUNT_CLOSED,
-            title="Account Closed",
-            message=f"Account '{name}' has been closed.",
-            data={
-                "final_balance": final_balance,
-            },
-        )
-
-    def handle_transaction_created(
-        self,
-        user_id: UUID,
-        account_id: UUID,
-        transaction_id: UUID,
-        transaction_type: str,
-        amount: str,
-        currency_code: str,
-        description: str | None = None,
-    ) -> None:
-        """Handle transaction created event."""
-        notification_service.send_finance_update(
-            user_id=user_id,
-            notification_type=NotificationType.TRANSACTION_CREATED,
-            title="Transaction Created",
-            message=f"New {transaction_type} of {amount} {currency_code}",
-            data={
-                "transaction_id": str(transaction_id),
-                "account_id": str(account_id),
-                "transaction_type": transaction_type,
-                "amount": amount,
-                "currency_code": currency_code,
-                "description": description,
-            },
-        )
-
-    def handle_transaction_posted(
-        self,
-        user_id: UUID,
-        account_id: UUID,
-        transaction_id: UUID,
-        amount: str,
-        new_balance: str,
-        currency_code: str,
-    ) -> None:
-        """Handle transaction posted event."""
-        notification_service.send_account_update(
-            account_id=account_id,
-            user_id=user_id,
-            notification_type=NotificationType.BALANCE_UPDATED,
-            title="Balance Updated",
-            message=f"Account balance is now {new_balance} {currency_code}",
-            data={
-                "transaction_id": str(transaction_id),
-                "amount": amount,
-                "new_balance": new_balance,
-                "currency_code": currency_code,
-            },
-        )
-
-    def handle_transfer_completed(
-        self,
-        user_id: UUID,
-        transfer_id: UUID,
-        from_account_id: UUID,
-        to_account_id: UUID,
-        amount: str,
-        currency_code: str,
-    ) -> None:
-        """Handle transfer completed event."""
-        notification_service.send_finance_update(
-            user_id=user_id,
-            notification_type=NotificationType.TRANSFER_COMPLETED,
-            title="Transfer Completed",
-            message=f"Transfer of {amount} {currency_code} completed.",
-            data={
-                "transfer_id": str(transfer_id),
-                "from_account_id": str(from_account_id),
-                "to_account_id": str(to_account_id),
-                "amount": amount,
-                "currency_code": currency_code,
-            },
-        )
-
-    def handle_net_worth_updated(
-        self,
-        user_id: UUID,
-        total_assets: str,
-        total_liabilities: str,
-        net_worth: str,
-        currency_code: str,
-    ) -> None:
-        """Handle net worth updated event."""
-        notification_service.send_finance_update(
-            user_id=user_id,
-            notification_type=NotificationType.NET_WORTH_UPDATED,
-            title="Net Worth Updated",
-            message=f"Your net worth is {net_worth} {currency_code}",
-            data={
-                "total_assets": total_assets,
-                "total_liabilities": total_liabilities,
-                "net_worth": net_worth,
-                "currency_code": currency_code,
-            },
-        )
-
-
-class SocialEventHandler:
-    """Handler for social finance domain events.
-
-    Converts social domain events into real-time notifications.
+    bound = partial(send, **kwargs)
+    if not notification_service.defer(bound):
+        notification_dispatcher.submit(bound)
+
+
+def _connected_members(member_user_ids: list[UUID]) -> list[UUID]:
+    """Filter group members down to those with an open connection."""
+    return [member_id for member_id in member_user_ids if _has_subscribers(member_id)]
+
+
+def _message(key: str, **values: Any) -> str:
+    """Render a notification message template."""
+    return _MESSAGE_TEMPLATES[key].format_map(values)
+
+
+# =============================================================================
+# Finance Events
+# =============================================================================
+
+
+def handle_account_created(
+    user_id: UUID,
+    account_id: UUID,
+    name: str,
+    account_type: str,
+    currency_code: str,
+) -> None:
+    """Handle account created event."""
+    if not _has_subscribers(user_id):
+        return
+
+    account_type = sys.intern(account_type)
+    currency_code = sys.intern(currency_code)
+
+    _dispatch(
+        _send_finance,
+        user_id=user_id,
+        notification_type=NotificationType.ACCOUNT_CREATED,
+        title="Account Created",
+        message=_message(
+            "account_created", account_type=account_type.lower(), name=name
+        ),
+        data={
+            "account_id": account_id,
+            "name": name,
+            "account_type": account_type,
+            "currency_code": currency_code,
+        },
+    )
+
+
+def handle_account_updated(
+    user_id: UUID,
+    account_id: UUID,
+    name: str,
+    updated_fields: list[str],
+) -> None:
+    """Handle account updated event."""
+    if not _has_subscribers(user_id):
+        return
+
+    _dispatch(
+        _send_account,
+        account_id=account_id,
+        user_id=user_id,
+        notification_type=NotificationType.ACCOUNT_UPDATED,
+        title="Account Updated",
+        message=_message("account_updated", name=name),
+        data={
+            "updated_fields": updated_fields,
+        },
+    )
+
+
+def handle_account_closed(
+    user_id: UUID,
+    account_id: UUID,
+    name: str,
+    final_balance: str,
+) -> None:
+    """Handle account closed event."""
+    if not _has_subscribers(user_id):
+        return
+
+    _dispatch(
+        _send_account,
+        account_id=account_id,
+        user_id=user_id,
+        notification_type=NotificationType.ACCOUNT_CLOSED,
+        title="Account Closed",
+        message=_message("account_closed", name=name),
+        data={
+            "final_balance": final_balance,
+        },
+    )
+
+
+def handle_transaction_created(
+    user_id: UUID,
+    account_id: UUID,
+    transaction_id: UUID,
+    transaction_type: str,
+    amount: str,
+    currency_code: str,
+    description: str | None = None,
+) -> None:
+    """Handle transaction created event."""
+    if not _has_subscribers(user_id):
+        return
+
+    transaction_type = sys.intern(transaction_type)
+    currency_code = sys.intern(currency_code)
+
+    _dispatch(
+        _send_finance,
+        user_id=user_id,
+        notification_type=NotificationType.TRANSACTION_CREATED,
+        title="Transaction Created",
+        message=_message(
+            "transaction_created",
+            transaction_type=transaction_type,
+            amount=amount,
+            currency_code=currency_code,
+        ),
+        data={
+            "transaction_id": transaction_id,
+            "account_id": account_id,
+            "transaction_type": transaction_type,
+            "amount": amount,
+            "currency_code": currency_code,
+            "description": description,
+        },
+    )
+
+
+def handle_transaction_posted(
+    user_id: UUID,
+    account_id: UUID,
+    transaction_id: UUID,
+    amount: str,
+    new_balance: str,
+    currency_code: str,
+) -> None:
+    """Handle transaction posted event."""
+    if not _has_subscribers(user_id):
+        return
+
+    currency_code = sys.intern(currency_code)
+
+    _dispatch(
+        _send_account,
+        account_id=account_id,
+        user_id=user_id,
+        notification_type=NotificationType.BALANCE_UPDATED,
+        title="Balance Updated",
+        message=_message(
+            "transaction_posted",
+            new_balance=new_balance,
+            currency_code=currency_code,
+        ),
+        data={
+            "transaction_id": transaction_id,
+            "amount": amount,
+            "new_balance": new_balance,
+            "currency_code": currency_code,
+        },
+    )
+
+
+def handle_transfer_completed(
+    user_id: UUID,
+    transfer_id: UUID,
+    from_account_id: UUID,
+    to_account_id: UUID,
+    amount: str,
+    currency_code: str,
+) -> None:
+    """Handle transfer completed event."""
+    if not _has_subscribers(user_id):
+        return
+
+    currency_code = sys.intern(currency_code)
+
+    _dispatch(
+        _send_finance,
+        user_id=user_id,
+        notification_type=NotificationType.TRANSFER_COMPLETED,
+        title="Transfer Completed",
+        message=_message(
+            "transfer_completed", amount=amount, currency_code=currency_code
+        ),
+        data={
+            "transfer_id": transfer_id,
+            "from_account_id": from_account_id,
+            "to_account_id": to_account_id,
+            "amount": amount,
+            "currency_code": currency_code,
+        },
+    )
+
+
+def handle_net_worth_updated(
+    user_id: UUID,
+    total_assets: str,
+    total_liabilities: str,
+    net_worth: str,
+    currency_code: str,
+) -> None:
+    """Handle net worth updated event."""
+    if not _has_subscribers(user_id):
+        return
+
+    currency_code = sys.intern(currency_code)
+
+    _dispatch(
+        _send_finance,
+        user_id=user_id,
+        notification_type=NotificationType.NET_WORTH_UPDATED,
+        title="Net Worth Updated",
+        message=_message(
+            "net_worth_updated", net_worth=net_worth, currency_code=currency_code
+        ),
+        data={
+            "total_assets": total_assets,
+            "total_liabilities": total_liabilities,
+            "net_worth": net_worth,
+            "currency_code": currency_code,
+        },
+    )
+
+
+# =============================================================================
+# Social Events
+# =============================================================================
+
+
+def handle_peer_debt_created(
+    user_id: UUID,
+    debt_id: UUID,
+    contact_id: UUID,
+    contact_name: str,
+    direction: str,
+    amount: str,
+    currency_code: str,
+) -> None:
+    """Handle peer debt created event."""
+    if not _has_subscribers(user_id):
+        return
+
+    direction = sys.intern(direction)
+    currency_code = sys.intern(currency_code)
+
+    message = _message(
+        (
+            "peer_debt_created.lent"
+            if direction == "lent"
+            else "peer_debt_created.borrowed"
+        ),
+        amount=amount,
+        currency_code=currency_code,
+        contact_name=contact_name,
+    )
+
+    _dispatch(
+        _send_social,
+        user_id=user_id,
+        notification_type=NotificationType.PEER_DEBT_CREATED,
+        title="Peer Debt Recorded",
+        message=message,
+        data={
+            "debt_id": debt_id,
+            "contact_id": contact_id,
+            "contact_name": contact_name,
+            "direction": direction,
+            "amount": amount,
+            "currency_code": currency_code,
+        },
+    )
+
+
+def handle_peer_debt_settled(
+    user_id: UUID,
+    debt_id: UUID,
+    contact_id: UUID,
+    contact_name: str,
+    settlement_amount: str,
+    remaining_amount: str,
+    is_fully_settled: bool,
+    currency_code: str,
+) -> None:
+    """Handle peer debt settled event."""
+    if not _has_subscribers(user_id):
+        return
+
+    currency_code = sys.intern(currency_code)
+
+    message = _message(
+        "peer_debt_settled.full" if is_fully_settled else "peer_debt_settled.partial",
+        settlement_amount=settlement_amount,
+        currency_code=currency_code,
+        contact_name=contact_name,
+    )
+
+    _dispatch(
+        _send_social,
+        user_id=user_id,
+        notification_type=NotificationType.PEER_DEBT_SETTLED,
+        title="Debt Settled",
+        message=message,
+        data={
+            "debt_id": debt_id,
+            "contact_id": contact_id,
+            "contact_name": contact_name,
+            "settlement_amount": settlement_amount,
+            "remaining_amount": remaining_amount,
+            "is_fully_settled": is_fully_settled,
+            "currency_code": currency_code,
+        },
+    )
+
+
+def handle_group_expense_created(
+    *,
+    user_id: UUID,  # noqa: ARG001
+    group_id: UUID,
+    expense_id: UUID,
+    group_name: str,
+    description: str,
+    total_amount: str,
+    currency_code: str,
+    member_user_ids: list[UUID],
+) -> None:
+    """Handle group expense created event.
+
+    Notifies the group's members, so the emitting user_id is not used.
     """
-
-    def handle_peer_debt_created(
-        self,
-        user_id: UUID,
-        debt_id: UUID,
-        contact_id: UUID,
-        contact_name: str,
-        direction: str,
-        amount: str,
-        currency_code: str,
-    ) -> None:
-        """Handle peer debt created event."""
-        if direction == "lent":
-            message = f"You lent {amount} {currency_code} to {contact_name}"
-        else:
-            message = f"You borrowed {amount} {currency_code} from {contact_name}"
-
-        notification_service.send_social_update(
-            user_id=user_id,
-            notification_type=NotificationType.PEER_DEBT_CREATED,
-            title="Peer Debt Recorded",
-            message=message,
-            data={
-                "debt_id": str(debt_id),
-                "contact_id": str(contact_id),
-                "contact_name": contact_name,
-                "direction": direction,
-                "amount": amount,
-                "currency_code": currency_code,
-            },
-        )
-
-    def handle_peer_debt_settled(
-        self,
-        user_id: UUID,
-        debt_id: UUID,
-        contact_id: UUID,
-        contact_name: str,
-        settlement_amount: str,
-        remaining_amount: str,
-        is_fully_settled: bool,
-        currency_code: str,
-    ) -> None:
-        """Handle peer debt settled event."""
-        if is_fully_settled:
-            message = f"Debt with {contact_name} fully settled"
-        else:
-            message = f"Partial settlement of {settlement_amount} {currency_code} with {contact_name}"
-
-        notification_service.send_social_update(
-            user_id=user_id,
-            notification_type=NotificationType.PEER_DEBT_SETTLED,
-            title="Debt Settled",
-            message=message,
-            data={
-                "debt_id": str(debt_id),
-                "contact_id": str(contact_id),
-                "contact_name": contact_name,
-                "settlement_amount": settlement_amount,
-                "remaining_amount": remaining_amount,
-                "is_fully_settled": is_fully_settled,
-                "currency_code": currency_code,
-            },
-        )
-
-    def handle_group_expense_created(
-        self,
-        user_id: UUID,
-        group_id: UUID,
-        expense_id: UUID,
-        group_name: str,
-        description: str,
-        total_amount: str,
-        currency_code: str,
-        member_user_ids: list[UUID],
-    ) -> None:
-        """Handle group expense created event."""
-        notification_service.send_expense_group_update(
-            group_id=group_id,
-            member_user_ids=member_user_ids,
-            notification_type=NotificationType.GROUP_EXPENSE_CREATED,
-            title="New Group Expense",
-            message=f"'{description}' for {total_amount} {currency_code} in {group_name}",
-            data={
-                "expense_id": str(expense_id),
-                "group_id": str(group_id),
-                "group_name": group_name,
-                "description": description,
-                "total_amount": total_amount,
-                "currency_code": currency_code,
-            },
-        )
-
-    def handle_expense_group_member_added(
-        self,
-        user_id: UUID,
-        group_id: UUID,
-        group_name: str,
-        contact_id: UUID,
-        contact_name: str,
-        member_user_ids: list[UUID],
-    ) -> None:
-        """Handle expense group member added event."""
-        notification_service.send_expense_group_update(
-            group_id=group_id,
-            member_user_ids=member_user_ids,
-            notification_type=NotificationType.GROUP_MEMBER_ADDED,
-            title="New Member",
-            message=f"{contact_name} has been added to {group_name}",
-            data={
-                "group_id": str(group_id),
-                "group_name": group_name,
-                "contact_id": str(contact_id),
-                "contact_name": contact_name,
-            },
-        )
-
-    def handle_settlement_created(
-        self,
-        user_id: UUID,
-        settlement_id: UUID,
-        contact_id: UUID,
-        contact_name: str,
-        amount: str,
-        currency_code: str,
-        from_is_owner: bool,
-    ) -> None:
-        """Handle settlement created event."""
-        if from_is_owner:
-            message = f"You paid {amount} {currency_code} to {contact_name}"
-        else:
-            message = f"{contact_name} paid you {amount} {currency_code}"
-
-        notification_service.send_social_update(
-            user_id=user_id,
-            notification_type=NotificationType.SETTLEMENT_RECORDED,
-            title="Settlement Recorded",
-            message=message,
-            data={
-                "settlement_id": str(settlement_id),
-                "contact_id": str(contact_id),
-                "contact_name": contact_name,
-                "amount": amount,
-                "currency_code": currency_code,
-                "from_is_owner": from_is_owner,
-            },
-        )
-
-    def handle_balance_updated(
-        self,
-        user_id: UUID,
-        contact_id: UUID,
-        contact_name: str,
-        net_balance: str,
-        currency_code: str,
-        balance_direction: str,
-    ) -> None:
-        """Handle balance updated event."""
-        if balance_direction == "they_owe_you":
-            message = f"{contact_name} owes you {net_balance} {currency_code}"
-        elif balance_direction == "you_owe_them":
-            message = f"You owe {contact_name} {net_balance} {currency_code}"
-        else:
-            message = f"You are settled up with {contact_name}"
-
-        notification_service.send_social_update(
-            user_id=user_id,
-            notification_type=NotificationType.BALANCE_UPDATED,
-            title="Balance Changed",
-            message=message,
-            data={
-                "contact_id": str(contact_id),
-                "contact_name": contact_name,
-                "net_balance": net_balance,
-                "currency_code": currency_code,
-                "balance_direction": balance_direction,
-            },
-        )
-
-
-# Singleton instances
-finance_event_handler = FinanceEventHandler()
-social_event_handler = SocialEventHandler()
+    member_user_ids = _connected_members(member_user_ids)
+    if not (member_user_ids or _group_has_subscribers(group_id)):
+        return
+
+    currency_code = sys.intern(currency_code)
+
+    _dispatch(
+        _send_group,
+        group_id=group_id,
+        member_user_ids=member_user_ids,
+        notification_type=NotificationType.GROUP_EXPENSE_CREATED,
+        title="New Group Expense",
+        message=_message(
+            "group_expense_created",
+            description=description,
+            total_amount=total_amount,
+            currency_code=currency_code,
+            group_name=group_name,
+        ),
+        data={
+            "expense_id": expense_id,
+            "group_id": group_id,
+            "group_name": group_name,
+            "description": description,
+            "total_amount": total_amount,
+            "currency_code": currency_code,
+        },
+    )
+
+
+def handle_expense_group_member_added(
+    *,
+    user_id: UUID,  # noqa: ARG001
+    group_id: UUID,
+    group_name: str,
+    contact_id: UUID,
+    contact_name: str,
+    member_user_ids: list[UUID],
+) -> None:
+    """Handle expense group member added event.
+
+    Notifies the group's members, so the emitting user_id is not used.
+    """
+    member_user_ids = _connected_members(member_user_ids)
+    if not (member_user_ids or _group_has_subscribers(group_id)):
+        return
+
+    _dispatch(
+        _send_group,
+        group_id=group_id,
+        member_user_ids=member_user_ids,
+        notification_type=NotificationType.GROUP_MEMBER_ADDED,
+        title="New Member",
+        message=_message(
+            "expense_group_member_added",
+            contact_name=contact_name,
+            group_name=group_name,
+        ),
+        data={
+            "group_id": group_id,
+            "group_name": group_name,
+            "contact_id": contact_id,
+            "contact_name": contact_name,
+        },
+    )
+
+
+def handle_settlement_created(
+    user_id: UUID,
+    settlement_id: UUID,
+    contact_id: UUID,
+    contact_name: str,
+    amount: str,
+    currency_code: str,
+    from_is_owner: bool,
+) -> None:
+    """Handle settlement created event."""
+    if not _has_subscribers(user_id):
+        return
+
+    currency_code = sys.intern(currency_code)
+
+    message = _message(
+        "settlement_created.paid" if from_is_owner else "settlement_created.received",
+        amount=amount,
+        currency_code=currency_code,
+        contact_name=contact_name,
+    )
+
+    _dispatch(
+        _send_social,
+        user_id=user_id,
+        notification_type=NotificationType.SETTLEMENT_RECORDED,
+        title="Settlement Recorded",
+        message=message,
+        data={
+            "settlement_id": settlement_id,
+            "contact_id": contact_id,
+            "contact_name": contact_name,
+            "amount": amount,
+            "currency_code": currency_code,
+            "from_is_owner": from_is_owner,
+        },
+    )
+
+
+def handle_balance_updated(
+    user_id: UUID,
+    contact_id: UUID,
+    contact_name: str,
+    net_balance: str,
+    currency_code: str,
+    balance_direction: str,
+) -> None:
+    """Handle balance updated event."""
+    if not _has_subscribers(user_id):
+        return
+
+    balance_direction = sys.intern(balance_direction)
+    currency_code = sys.intern(currency_code)
+
+    message = _message(
+        _BALANCE_MESSAGE_KEYS.get(balance_direction, "balance_updated.settled"),
+        contact_name=contact_name,
+        net_balance=net_balance,
+        currency_code=currency_code,
+    )
+
+    _dispatch(
+        _send_social,
+        user_id=user_id,
+        notification_type=NotificationType.BALANCE_UPDATED,
+        title="Balance Changed",
+        message=message,
+        data={
+            "contact_id": contact_id,
+            "contact_name": contact_name,
+            "net_balance": net_balance,
+            "currency_code": currency_code,
+            "balance_direction": balance_direction,
+        },
+    )
+
+
+# Event name -> handler, connected to the matching signal in EVENT_SIGNALS
+FINANCE_HANDLERS: dict[str, Callable[..., None]] = {
+    "account_created": handle_account_created,
+    "account_updated": handle_account_updated,
+    "account_closed": handle_account_closed,
+    "transaction_created": handle_transaction_created,
+    "transaction_posted": handle_transaction_posted,
+    "transfer_completed": handle_transfer_completed,
+    "net_worth_updated": handle_net_worth_updated,
+}
+
+SOCIAL_HANDLERS: dict[str, Callable[..., None]] = {
+    "peer_debt_created": handle_peer_debt_created,
+    "peer_debt_settled": handle_peer_debt_settled,
+    "group_expense_created": handle_group_expense_created,
+    "expense_group_member_added": handle_expense_group_member_added,
+    "settlement_created": handle_settlement_created,
+    "balance_updated": handle_balance_updated,
+}
+
+
+def _as_receiver(handler: Callable[..., None]) -> Callable[..., None]:
+    """Adapt a handler to the Django signal receiver signature."""
+
+    def receiver(**payload: Any) -> None:
+        # Signals pass themselves and the sender alongside the event fields
+        del payload["signal"], payload["sender"]
+        handler(**payload)
+
+    return receiver
 
 
 def register_event_handlers() -> None:
-    """Register event handlers with the event bus.
+    """Connect event handlers to their domain event signals.
 
-    This function should be called during application startup
-    to connect domain events to their handlers.
+    Called once during application startup. Each handler is connected to
+    the signal for its event with a strong reference, since the receiver
+    wrappers have no other owner, and a dispatch_uid so repeated calls do
+    not register it twice.
 
-    Note: The actual event bus integration depends on the
-    chosen event infrastructure (Django signals, Celery, etc.)
-
-    Current implementation: Handlers are called directly from use cases
-    and application services. For a more decoupled approach, consider:
-    - Django signals for synchronous in-process events
-    - Celery tasks for async background processing
-    - Redis pub/sub for cross-service events
+    Events reach the handlers either way: emitted by name through
+    shared.events.signals.emit_event, or by calling the handler from
+    FINANCE_HANDLERS / SOCIAL_HANDLERS directly.
     """
+    for prefix, handlers in (
+        ("finance", FINANCE_HANDLERS),
+        ("social", SOCIAL_HANDLERS),
+    ):
+        for name, handler in handlers.items():
+            EVENT_SIGNALS[name].connect(
+                _as_receiver(handler),
+                weak=False,
+                dispatch_uid=f"{prefix}.{name}",
+            )
+
     logger.info("Event handlers registered for real-time notifications")
@@ -0,0 +1,58 @@
+"""Django signals carrying domain events to their handlers.
+
+Each domain event has its own signal, so emitting an event only walks the
+receivers registered for that event.
+
+Code raising an event can either emit it here by name, which decouples it
+from the handlers, or call the handler from
+shared.events.handlers.FINANCE_HANDLERS / SOCIAL_HANDLERS directly, which
+skips the signal dispatch. Both run the same handler with the same fields.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.dispatch import Signal
+
+FINANCE_EVENTS = (
+    "account_created",
+    "account_updated",
+    "account_closed",
+    "transaction_created",
+    "transaction_posted",
+    "transfer_completed",
+    "net_worth_updated",
+)
+
+SOCIAL_EVENTS = (
+    "peer_debt_created",
+    "peer_debt_settled",
+    "group_expense_created",
+    "expense_group_member_added",
+    "settlement_created",
+    "balance_updated",
+)
+
+# Event name -> signal emitted for it
+EVENT_SIGNALS: dict[str, Signal] = {
+    name: Signal() for name in (*FINANCE_EVENTS, *SOCIAL_EVENTS)
+}
+
+
+def emit_event(name: str, sender: Any = None, **payload: Any) -> None:
+    """Emit a domain event to its registered handlers.
+
+    Handlers only queue notification sends, which run and report their own
+    failures on the dispatcher thread, so receivers are called without
+    send_robust's per-receiver error capture.
+
+    Args:
+        name: Event name, e.g. "account_created".
+        sender: Object emitting the event.
+        **payload: Event fields passed to the handler as keyword arguments.
+
+    Raises:
+        KeyError: If no signal exists for the event name.
+    """
+    EVENT_SIGNALS[name].send(sender=sender, **payload)
@@ -8,7 +8,11 @@ This module provides:
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.http import Http404
@@ -17,6 +21,8 @@ from rest_framework.exceptions import APIException
 from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
+from shared.middleware import correlation_id_var
+
 if TYPE_CHECKING:
     from rest_framework.views import Request
 
@@ -33,6 +39,10 @@ class DomainError(Exception):
     within the domain model.
     """
 
+    __slots__ = ("code", "message")
+
+    http_status = status.HTTP_400_BAD_REQUEST
+
     def __init__(self, message: str, code: str = "DOMAIN_ERROR") -> None:
         """Initialize domain error.
 
@@ -48,6 +58,10 @@ class DomainError(Exception):
 class EntityNotFoundError(DomainError):
     """Requested entity was not found."""
 
+    __slots__ = ("entity_id", "entity_type")
+
+    http_status = status.HTTP_404_NOT_FOUND
+
     def __init__(
         self, entity_type: str, entity_id: str, message: str | None = None
     ) -> None:
@@ -69,6 +83,8 @@ class EntityNotFoundError(DomainError):
 class DomainValidationError(DomainError):
     """Domain validation failed."""
 
+    __slots__ = ("details", "field")
+
     def __init__(
         self,
         message: str,
@@ -90,6 +106,10 @@ class DomainValidationError(DomainError):
 class ConflictError(DomainError):
     """Operation conflicts with current state."""
 
+    __slots__ = ()
+
+    http_status = status.HTTP_409_CONFLICT
+
     def __init__(self, message: str) -> None:
         """Initialize conflict error.
 
@@ -102,6 +122,10 @@ class ConflictError(DomainError):
 class AuthorizationError(DomainError):
     """User is not authorized for this action."""
 
+    __slots__ = ()
+
+    http_status = status.HTTP_403_FORBIDDEN
+
     def __init__(self, message: str = "Not authorized for this action") -> None:
         """Initialize authorization error.
 
@@ -123,6 +147,10 @@ class ApplicationError(Exception):
     external service failures, or infrastructure problems.
     """
 
+    __slots__ = ("code", "message")
+
+    http_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+
     def __init__(self, message: str, code: str = "APPLICATION_ERROR") -> None:
         """Initialize application error.
 
@@ -138,6 +166,10 @@ class ApplicationError(Exception):
 class ExternalServiceError(ApplicationError):
     """External service call failed."""
 
+    __slots__ = ("original_error", "service")
+
+    http_status = status.HTTP_503_SERVICE_UNAVAILABLE
+
     def __init__(
         self, service: str, message: str, original_error: Exception | None = None
     ) -> None:
@@ -165,6 +197,8 @@ class APIValidationError(APIException):
     default_code = "VALIDATION_ERROR"
     default_detail = "Validation failed"
 
+    __slots__ = ("field_errors",)
+
     def __init__(
         self,
         detail: str | None = None,
@@ -193,6 +227,23 @@ class TenantAccessError(APIException):
 # =============================================================================
 
 
+# Pre-built error bodies for the codes raised most often. Copying a template
+# is cheaper than building the dict key by key on every error response.
+_ERROR_TEMPLATES: dict[str, dict[str, Any]] = {
+    code: {"code": code, "message": ""}
+    for code in (
+        "NOT_FOUND",
+        "VALIDATION_ERROR",
+        "CONFLICT",
+        "FORBIDDEN",
+        "DOMAIN_ERROR",
+        "EXTERNAL_SERVICE_ERROR",
+        "APPLICATION_ERROR",
+        "API_ERROR",
+    )
+}
+
+
 def format_error_response(
     code: str,
     message: str,
@@ -210,10 +261,12 @@ def format_error_response(
     Returns:
         Standardized error response dictionary.
     """
-    error: dict[str, Any] = {
-        "code": code,
-        "message": message,
-    }
+    template = _ERROR_TEMPLATES.get(code)
+    if template is not None:
+        error = template.copy()
+        error["message"] = message
+    else:
+        error = {"code": code, "message": message}
     if details:
         error["details"] = details
     if correlation_id:
@@ -222,6 +275,147 @@ def format_error_response(
     return {"error": error}
 
 
+@lru_cache(maxsize=128)
+def _format_static(code: str, message: str) -> MappingProxyType[str, str]:
+    """Build a read-only error body for a fixed code and message."""
+    return MappingProxyType({"code": code, "message": message})
+
+
+def _format_static_response(
+    code: str, message: str, correlation_id: str | None
+) -> dict[str, Any]:
+    """Format an error response without details from a cached error body.
+
+    For errors whose message is a class default or otherwise drawn from a
+    small set, e.g. Django's Http404 and PermissionDenied.
+    """
+    error: dict[str, Any] = dict(_format_static(code, message))
+    if correlation_id:
+        error["correlation_id"] = correlation_id
+    return {"error": error}
+
+
+def _handle_domain(exc: DomainError, correlation_id: str | None) -> Response:
+    """Build a response for a domain error using its class HTTP status."""
+    return Response(
+        format_error_response(
+            code=exc.code,
+            message=exc.message,
+            details=getattr(exc, "details", None),
+            correlation_id=correlation_id,
+        ),
+        status=exc.http_status,
+    )
+
+
+def _handle_application(exc: ApplicationError, correlation_id: str | None) -> Response:
+    """Build a response for an application error using its class HTTP status."""
+    return Response(
+        format_error_response(
+            code=exc.code,
+            message=exc.message,
+            correlation_id=correlation_id,
+        ),
+        status=exc.http_status,
+    )
+
+
+def _handle_http404(exc: Http404, correlation_id: str | None) -> Response:
+    """Build a 404 response for Django's Http404."""
+    return Response(
+        _format_static_response(
+            "NOT_FOUND", str(exc) or "Resource not found", correlation_id
+        ),
+        status=status.HTTP_404_NOT_FOUND,
+    )
+
+
+def _handle_permission_denied(
+    exc: PermissionDenied, correlation_id: str | None
+) -> Response:
+    """Build a 403 response for Django's PermissionDenied."""
+    return Response(
+        _format_static_response(
+            "FORBIDDEN", str(exc) or "Permission denied", correlation_id
+        ),
+        status=status.HTTP_403_FORBIDDEN,
+    )
+
+
+def _handle_django_validation(
+    exc: ValidationError, correlation_id: str | None
+) -> Response:
+    """Build a 400 response for Django's ValidationError."""
+    details = (
+        [
+            {"field": field, "message": msg}
+            for field, messages in exc.message_dict.items()
+            for msg in messages
+        ]
+        if hasattr(exc, "message_dict")
+        else []
+    )
+    return Response(
+        format_error_response(
+            code="VALIDATION_ERROR",
+            message="Validation failed",
+            details=details,
+            correlation_id=correlation_id,
+        ),
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+def _handle_api_validation(
+    exc: APIValidationError, correlation_id: str | None
+) -> Response:
+    """Build a response for an APIValidationError."""
+    return Response(
+        format_error_response(
+            code=exc.default_code,
+            message=str(exc.detail),
+            details=exc.field_errors,
+            correlation_id=correlation_id,
+        ),
+        status=exc.status_code,
+    )
+
+
+_ExceptionHandler = Callable[[Any, str | None], Response]
+
+# Exception type -> response builder. Subclasses resolve to the handler of
+# their nearest registered base via _get_handler.
+_HANDLERS: dict[type[Exception], _ExceptionHandler] = {
+    DomainError: _handle_domain,
+    ApplicationError: _handle_application,
+    Http404: _handle_http404,
+    PermissionDenied: _handle_permission_denied,
+    ValidationError: _handle_django_validation,
+    APIValidationError: _handle_api_validation,
+}
+
+# Resolved handler per concrete exception class, None when unhandled
+_resolved_handlers: WeakKeyDictionary[type, _ExceptionHandler | None] = (
+    WeakKeyDictionary()
+)
+
+
+def _get_handler(exc_type: type) -> _ExceptionHandler | None:
+    """Find the handler for an exception type, walking its MRO once."""
+    try:
+        return _resolved_handlers[exc_type]
+    except KeyError:
+        pass
+
+    handler = None
+    for cls in exc_type.__mro__:
+        handler = _HANDLERS.get(cls)
+        if handler is not None:
+            break
+    _resolved_handlers[exc_type] = handler
+    return handler
+
+
 def custom_exception_handler(
     exc: Exception, context: dict[str, Any]
 ) -> Response | None:
@@ -236,131 +430,12 @@ def custom_exception_handler(
     Returns:
         Response with standardized error format, or None to use default handler.
     """
-    from shared.middleware import get_correlation_id
-
-    correlation_id = get_correlation_id()
-
-    # Handle domain exceptions
-    if isinstance(exc, EntityNotFoundError):
-        return Response(
-            format_error_response(
-                code=exc.code,
-                message=exc.message,
-                correlation_id=correlation_id,
-            ),
-            status=status.HTTP_404_NOT_FOUND,
-        )
-
-    if isinstance(exc, DomainValidationError):
-        return Response(
-            format_error_response(
-                code=exc.code,
-                message=exc.message,
-                details=exc.details,
-                correlation_id=correlation_id,
-            ),
-            status=status.HTTP_400_BAD_REQUEST,
-        )
-
-    if isinstance(exc, ConflictError):
-        return Response(
-            format_error_response(
-                code=exc.code,
-                message=exc.message,
-                correlation_id=correlation_id,
-            ),
-            status=status.HTTP_409_CONFLICT,
-        )
-
-    if isinstance(exc, AuthorizationError):
-        return Response(
-            format_error_response(
-                code=exc.code,
-                message=exc.message,
-                correlation_id=correlation_id,
-            ),
-            status=status.HTTP_403_FORBIDDEN,
-        )
+    correlation_id = correlation_id_var.get()
 
-    if isinstance(exc, DomainError):
-        return Response(
-            format_error_response(
-                code=exc.code,
-                message=exc.message,
-                correlation_id=correlation_id,
-            ),
-            status=status.HTTP_400_BAD_REQUEST,
-        )
-
-    # Handle application exceptions
-    if isinstance(exc, ExternalServiceError):
-        return Response(
-            format_error_response(
-                code=exc.code,
-                message=exc.message,
-                correlation_id=correlation_id,
-            ),
-            status=status.HTTP_503_SERVICE_UNAVAILABLE,
-        )
-
-    if isinstance(exc, ApplicationError):
-        return Response(
-            format_error_response(
-                code=exc.code,
-                message=exc.message,
-                correlation_id=correlation_id,
-            ),
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-
-    # Handle Django exceptions
-    if isinstance(exc, Http404):
-        return Response(
-            format_error_response(
-                code="NOT_FOUND",
-                message=str(exc) or "Resource not found",
-                correlation_id=correlation_id,
-            ),
-            status=status.HTTP_404_NOT_FOUND,
-        )
-
-    if isinstance(exc, PermissionDenied):
-        return Response(
-            format_error_response(
-                code="FORBIDDEN",
-                message=str(exc) or "Permission denied",
-                correlation_id=correlation_id,
-            ),
-            status=status.HTTP_403_FORBIDDEN,
-        )
-
-    if isinstance(exc, ValidationError):
-        details = []
-        if hasattr(exc, "message_dict"):
-            for field, messages in exc.message_dict.items():
-                for msg in messages:
-                    details.append({"field": field, "message": msg})
-        return Response(
-            format_error_response(
-                code="VALIDATION_ERROR",
-                message="Validation failed",
-                details=details,
-                correlation_id=correlation_id,
-            ),
-            status=status.HTTP_400_BAD_REQUEST,
-        )
-
-    # Handle API exceptions with custom format
-    if isinstance(exc, APIValidationError):
-        return Response(
-            format_error_response(
-                code=exc.default_code,
-                message=str(exc.detail),
-                details=exc.field_errors,
-                correlation_id=correlation_id,
-            ),
-            status=exc.status_code,
-        )
+    # Handle domain, application, Django and custom API exceptions
+    handler = _get_handler(type(exc))
+    if handler is not None:
+        return handler(exc, correlation_id)
 
     # Call default handler for other DRF exceptions
     response = exception_handler(exc, context)
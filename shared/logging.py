@@ -8,6 +8,8 @@ This module provides:
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import sys
 from typing import Any
@@ -16,11 +18,31 @@ import structlog
 from structlog.types import EventDict, Processor
 
 
+def drop_color_message_key(
+    logger: logging.Logger, method_name: str, event_dict: EventDict
+) -> EventDict:
+    """Remove the color_message key from log events.
+
+    Args:
+        logger: The wrapped logger.
+        method_name: The logging method name.
+        event_dict: The current event dictionary.
+
+    Returns:
+        Event dictionary without color_message.
+    """
+    event_dict.pop("color_message", None)
+    return event_dict
+
+
 def add_correlation_id(
     logger: logging.Logger, method_name: str, event_dict: EventDict
 ) -> EventDict:
     """Add correlation ID to log events.
 
+    Reads the context variable directly, so IDs set outside the middleware,
+    e.g. by tasks or management commands, are logged too.
+
     Args:
         logger: The wrapped logger.
         method_name: The logging method name.
@@ -58,40 +80,52 @@ def add_tenant_id(
     return event_dict
 
 
-def drop_color_message_key(
-    logger: logging.Logger, method_name: str, event_dict: EventDict
-) -> EventDict:
-    """Remove the color_message key from log events.
+# Processors shared by structlog loggers and foreign stdlib records
+_SHARED_PROCESSORS: tuple[Processor, ...] = (
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso", utc=True),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.UnicodeDecoder(),
+    add_correlation_id,
+    add_tenant_id,
+)
 
-    Args:
-        logger: The wrapped logger.
-        method_name: The logging method name.
-        event_dict: The current event dictionary.
+# Root handler installed by configure_structlog and the format it was set up
+# with, so repeated calls reuse the handler instead of stacking new ones
+_handler: logging.StreamHandler | None = None
+_configured_json_format: bool | None = None
 
-    Returns:
-        Event dictionary without color_message.
-    """
-    event_dict.pop("color_message", None)
-    return event_dict
+
+@functools.cache
+def _stdout_isatty() -> bool:
+    """Check once whether stdout is a terminal."""
+    return sys.stdout.isatty()
 
 
 def configure_structlog(json_format: bool = False) -> None:
     """Configure structlog for the application.
 
+    Calling it again with the same format is a no-op. Calling it with a
+    different format reconfigures structlog and swaps the formatter on the
+    existing root handler.
+
     Args:
         json_format: If True, output JSON format; otherwise, use console format.
     """
-    shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso", utc=True),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
-        add_correlation_id,
-        add_tenant_id,
-    ]
+    global _handler, _configured_json_format
+
+    root_logger = logging.getLogger()
+    if (
+        _configured_json_format is json_format
+        and _handler is not None
+        and _handler in root_logger.handlers
+    ):
+        return
+
+    shared_processors = list(_SHARED_PROCESSORS)
 
     if json_format:
         # JSON format for production
@@ -100,7 +134,7 @@ def configure_structlog(json_format: bool = False) -> None:
     else:
         # Console format for development
         renderer = structlog.dev.ConsoleRenderer(
-            colors=sys.stdout.isatty(),
+            colors=_stdout_isatty(),
         )
 
     structlog.configure(
@@ -122,14 +156,45 @@ def configure_structlog(json_format: bool = False) -> None:
         ],
     )
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
+    if _handler is None:
+        _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(formatter)
+    _configured_json_format = json_format
 
-    root_logger = logging.getLogger()
-    root_logger.addHandler(handler)
+    if _handler not in root_logger.handlers:
+        root_logger.addHandler(_handler)
     root_logger.setLevel(logging.INFO)
 
 
+# Standard LogRecord attributes, excluded when copying extras into events
+_RESERVED_RECORD_ATTRS = frozenset(
+    (
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "exc_info",
+        "exc_text",
+        "thread",
+        "threadName",
+        "message",
+        "taskName",
+    )
+)
+
+
 class StructlogFormatter(logging.Formatter):
     """Custom formatter that outputs logs in structlog JSON format.
 
@@ -137,19 +202,43 @@ class StructlogFormatter(logging.Formatter):
     logs from the standard library using structlog's JSON renderer.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Initialize the formatter."""
+    # Processor chain shared by all instances; the processors are stateless
+    _processors: tuple[Processor, ...] = (
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.UnicodeDecoder(),
+    )
+    # Adds values bound in structlog's context and the request IDs held in
+    # the correlation and tenant context variables
+    _context_processors: tuple[Processor, ...] = (
+        structlog.contextvars.merge_contextvars,
+        add_correlation_id,
+        add_tenant_id,
+    )
+
+    # Whether to add correlation and tenant IDs from the request context.
+    # Disable when records already carry them, e.g. when they were added by
+    # an upstream structlog pipeline.
+    inject_context: bool = True
+
+    def __init__(
+        self, *args: Any, inject_context: bool | None = None, **kwargs: Any
+    ) -> None:
+        """Initialize the formatter.
+
+        Args:
+            inject_context: Override the class-level inject_context setting.
+        """
         super().__init__(*args, **kwargs)
-        self._processors: list[Processor] = [
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="iso", utc=True),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.UnicodeDecoder(),
-            add_correlation_id,
-            add_tenant_id,
-            structlog.processors.JSONRenderer(),
-        ]
+        if inject_context is not None:
+            self.inject_context = inject_context
+        self._chain = (
+            self._processors + self._context_processors
+            if self.inject_context
+            else self._processors
+        )
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as JSON.
@@ -160,49 +249,37 @@ class StructlogFormatter(logging.Formatter):
         Returns:
             JSON formatted log string.
         """
+        # Records from loggers set up by configure_structlog carry an event
+        # dict that already went through the shared processors (the same
+        # check structlog's ProcessorFormatter uses), so only render it.
+        if isinstance(record.msg, dict) and hasattr(record, "_logger"):
+            return json.dumps(
+                structlog.processors.format_exc_info(
+                    record, record.levelname.lower(), dict(record.msg)
+                ),
+                default=str,
+            )
+
+        level = record.levelname.lower()
+        attrs = record.__dict__
         event_dict: EventDict = {
             "event": record.getMessage(),
             "_logger": record.name,
-            "_level": record.levelname.lower(),
+            "_level": level,
+            # Extra attributes from the record
+            **{key: attrs[key] for key in attrs.keys() - _RESERVED_RECORD_ATTRS},
         }
 
         # Add exception info if present
         if record.exc_info:
             event_dict["exc_info"] = self.formatException(record.exc_info)
 
-        # Add extra attributes from the record
-        for key, value in record.__dict__.items():
-            if key not in (
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "stack_info",
-                "exc_info",
-                "exc_text",
-                "thread",
-                "threadName",
-                "message",
-                "taskName",
-            ):
-                event_dict[key] = value
-
-        # Process through structlog processors
-        for processor in self._processors:
-            event_dict = processor(None, record.levelname.lower(), event_dict)  # type: ignore[arg-type]
-
-        return str(event_dict)
+        # Process through structlog processors. The record stands in for the
+        # wrapped logger, since add_logger_name reads its name attribute.
+        for processor in self._chain:
+            event_dict = processor(record, level, event_dict)  # type: ignore[arg-type]
+
+        return json.dumps(event_dict, default=str)
 
 
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
@@ -152,10 +152,16 @@ class SoftDeleteQuerySet(TenantQuerySet[T]):
     def delete(self) -> tuple[int, dict[str, int]]:
         """Soft delete records instead of hard delete.
 
+        Records that are already deleted keep their original deleted_at.
+        updated_at is set explicitly because update() skips auto_now.
+
         Returns:
             Tuple of (count, dict of deleted types).
         """
-        count = self.update(is_deleted=True, deleted_at=timezone.now())
+        now = timezone.now()
+        count = self.filter(is_deleted=False).update(
+            is_deleted=True, deleted_at=now, updated_at=now
+        )
         return count, {self.model._meta.label: count}
 
     def hard_delete(self) -> tuple[int, dict[str, int]]:
@@ -197,6 +203,11 @@ class SoftDeleteModel(TenantModel):
     Records are not physically deleted but marked as deleted.
     This allows for recovery and audit trail.
 
+    Active records are indexed by (tenant_id, created_at) with a partial
+    index covering only rows that are not deleted, which serves the default
+    manager's tenant-scoped reads. Subclasses declaring their own Meta should
+    extend SoftDeleteModel.Meta to keep it.
+
     Attributes:
         is_deleted: Whether the record has been soft deleted.
         deleted_at: Timestamp when the record was soft deleted.
@@ -204,7 +215,6 @@ class SoftDeleteModel(TenantModel):
 
     is_deleted = models.BooleanField(
         default=False,
-        db_index=True,
         help_text="Whether this record has been soft deleted.",
     )
     deleted_at = models.DateTimeField(
@@ -216,8 +226,19 @@ class SoftDeleteModel(TenantModel):
     objects: Manager[Any] = SoftDeleteManager()
     all_objects: Manager[Any] = TenantManager()
 
+    # Soft delete and restore write with a single UPDATE; set to True on
+    # subclasses that rely on pre_save/post_save firing for them
+    SEND_SIGNALS_ON_SOFT_DELETE = False
+
     class Meta:
         abstract = True
+        indexes = [
+            models.Index(
+                fields=["tenant_id", "created_at"],
+                name="%(app_label)s_%(class)s_active",
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
 
     def delete(self, using: str | None = None, keep_parents: bool = False) -> None:
         """Soft delete the record.
@@ -226,9 +247,7 @@ class SoftDeleteModel(TenantModel):
             using: Database alias to use.
             keep_parents: Unused, kept for API compatibility.
         """
-        self.is_deleted = True
-        self.deleted_at = timezone.now()
-        self.save(using=using, update_fields=["is_deleted", "deleted_at", "updated_at"])
+        self._set_deleted(True, timezone.now(), using)
 
     def hard_delete(
         self, using: str | None = None, keep_parents: bool = False
@@ -250,6 +269,28 @@ class SoftDeleteModel(TenantModel):
         Args:
             using: Database alias to use.
         """
-        self.is_deleted = False
-        self.deleted_at = None
-        self.save(using=using, update_fields=["is_deleted", "deleted_at", "updated_at"])
+        self._set_deleted(False, None, using)
+
+    def _set_deleted(
+        self, is_deleted: bool, deleted_at: Any, using: str | None
+    ) -> None:
+        """Write the soft delete state of the record.
+
+        Args:
+            is_deleted: Whether the record is deleted.
+            deleted_at: Deletion timestamp, or None when restoring.
+            using: Database alias to use.
+        """
+        self.is_deleted = is_deleted
+        self.deleted_at = deleted_at
+        if self.SEND_SIGNALS_ON_SOFT_DELETE:
+            self.save(
+                using=using, update_fields=["is_deleted", "deleted_at", "updated_at"]
+            )
+            return
+
+        now = deleted_at or timezone.now()
+        type(self).all_objects.db_manager(using).filter(pk=self.pk).update(
+            is_deleted=is_deleted, deleted_at=deleted_at, updated_at=now
+        )
+        self.updated_at = now
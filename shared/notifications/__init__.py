@@ -4,11 +4,17 @@ This module provides a unified notification system that integrates
 with Django Channels for real-time WebSocket updates.
 """
 
+from shared.notifications.batcher import NotificationBatcher
+from shared.notifications.dispatcher import NotificationDispatcher
+from shared.notifications.presence import SubscriberPresence
 from shared.notifications.service import NotificationService
 from shared.notifications.types import NotificationType, NotificationChannel
 
 __all__ = [
+    "NotificationBatcher",
+    "NotificationDispatcher",
     "NotificationService",
+    "SubscriberPresence",
     "NotificationType",
     "NotificationChannel",
 ]
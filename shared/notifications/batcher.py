@@ -0,0 +1,139 @@
+"""Batching of channel layer sends for notification bursts.
+
+Notifications are queued by the caller and sent from a background thread.
+Messages that pile up while a send is in flight are drained together and
+coalesced per channel group, so a burst of events becomes one group_send
+(and one WebSocket frame) per group instead of one per event.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Channel layer message type carrying several coalesced messages
+MULTI_MESSAGE_TYPE = "multi.notify"
+
+
+class NotificationBatcher:
+    """Queues channel layer messages and sends them in per-group batches.
+
+    A single message for a group is sent unchanged. Several messages for the
+    same group are wrapped as ``{"type": "multi.notify", "messages": [...]}``,
+    which consumers unpack and forward to the client as one frame.
+    """
+
+    def __init__(
+        self,
+        send_func: Callable[[str, dict[str, Any]], None],
+        max_batch_size: int = 64,
+        max_queue_size: int = 10_000,
+    ):
+        """Initialize notification batcher.
+
+        Args:
+            send_func: Sync function sending one message to a channel group.
+            max_batch_size: Maximum number of messages drained per flush.
+            max_queue_size: Maximum queued messages before new ones are dropped.
+        """
+        self.send_func = send_func
+        self.max_batch_size = max_batch_size
+        self._queue: queue.Queue[tuple[str, dict[str, Any]]] = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, group_name: str, message: dict[str, Any]) -> bool:
+        """Queue a message for a channel group.
+
+        Args:
+            group_name: The channel group name.
+            message: The channel layer message.
+
+        Returns:
+            True if the message was queued, False if the queue is full.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((group_name, message))
+            return True
+        except queue.Full:
+            logger.warning(
+                "Notification queue full, dropping message",
+                extra={"group": group_name, "message_type": message.get("type")},
+            )
+            return False
+
+    def flush(self) -> None:
+        """Send everything currently queued from the calling thread."""
+        while True:
+            batch = self._drain()
+            if not batch:
+                return
+            self._send_batch(batch)
+
+    def _ensure_started(self) -> None:
+        """Start the background flusher thread on first use."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="notification-batcher",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _drain(
+        self,
+        first: tuple[str, dict[str, Any]] | None = None,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Collect up to ``max_batch_size`` queued messages without blocking."""
+        batch = [first] if first is not None else []
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """Flusher loop: block for one message, then drain what is ready."""
+        while True:
+            self._send_batch(self._drain(self._queue.get()))
+
+    def _send_batch(self, batch: list[tuple[str, dict[str, Any]]]) -> None:
+        """Send a drained batch with one group_send per channel group.
+
+        A failed send is logged and skipped so the other groups still go out.
+        """
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for group_name, message in batch:
+            grouped.setdefault(group_name, []).append(message)
+
+        for group_name, messages in grouped.items():
+            if len(messages) == 1:
+                message = messages[0]
+            else:
+                message = {"type": MULTI_MESSAGE_TYPE, "messages": messages}
+            try:
+                self.send_func(group_name, message)
+            except Exception as e:
+                logger.error(
+                    "Failed to send notification batch",
+                    extra={
+                        "group": group_name,
+                        "batch_size": len(messages),
+                        "error": str(e),
+                    },
+                    exc_info=True,
+                )
@@ -0,0 +1,103 @@
+"""Background dispatch of notification sends.
+
+Event handlers run on the request thread. Submitting their notification
+sends to this dispatcher keeps channel layer latency out of the request
+that triggered the event.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import logging
+import queue
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDispatcher:
+    """Runs submitted notification sends on a background worker thread.
+
+    The queue is bounded. When it is full, new sends are dropped and counted
+    rather than blocking the caller.
+    """
+
+    def __init__(self, max_queue_size: int = 10_000):
+        """Initialize notification dispatcher.
+
+        Args:
+            max_queue_size: Maximum pending sends before new ones are dropped.
+        """
+        self._queue: queue.Queue[Callable[[], None]] = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.dropped_count = 0
+
+    def submit(self, send: Callable[[], None]) -> bool:
+        """Schedule a send on the worker thread.
+
+        The send runs in a copy of the caller's context, so request context
+        such as the correlation ID is kept in anything it logs.
+
+        Args:
+            send: Zero-argument callable performing the send.
+
+        Returns:
+            True if the send was scheduled, False if it was dropped.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(
+                functools.partial(contextvars.copy_context().run, send)
+            )
+            return True
+        except queue.Full:
+            self.dropped_count += 1
+            logger.warning(
+                "Notification dispatch queue full, dropping send",
+                extra={"dropped_count": self.dropped_count},
+            )
+            return False
+
+    def _ensure_started(self) -> None:
+        """Start the worker thread on first use."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="notification-dispatcher",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Worker loop: run sends in submission order."""
+        while True:
+            send = self._queue.get()
+            try:
+                send()
+            except Exception as e:
+                logger.error(
+                    "Notification dispatch failed",
+                    extra={"error": str(e)},
+                    exc_info=True,
+                )
+            finally:
+                self._queue.task_done()
+
+    def join(self) -> None:
+        """Block until every submitted send has been processed."""
+        self._queue.join()
+
+
+# Singleton instance
+notification_dispatcher = NotificationDispatcher()
@@ -0,0 +1,163 @@
+"""In-process tracking of connected WebSocket subscribers.
+
+Consumers record which users and expense groups have open connections in
+this process. The notification service can consult it to skip building and
+sending notifications nobody in this process would receive.
+
+Only enable the check when notifications are sent from the same process
+that serves the WebSocket connections; otherwise this registry is empty and
+every notification would be skipped. Enable sharing to lift that
+restriction: presence is then mirrored to Redis and lookups that miss
+locally are answered from there.
+
+Consumers record presence with the ``a``-prefixed coroutines, which move
+the Redis write off the event loop once sharing is enabled.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from asgiref.sync import sync_to_async
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class SubscriberPresence:
+    """Reference counts of open connections per user and expense group.
+
+    A user or group counts as present while at least one connection holds
+    it, so a user with several tabs open stays present until the last one
+    disconnects.
+    """
+
+    # Redis hashes counting, per user or group, the processes holding it
+    USERS_KEY = "presence:users"
+    GROUPS_KEY = "presence:groups"
+
+    def __init__(self) -> None:
+        """Initialize subscriber presence."""
+        self._users: Counter[str] = Counter()
+        self._groups: Counter[str] = Counter()
+        self._redis: Any = None
+
+    def enable_sharing(self, redis: Any = None) -> None:
+        """Mirror presence to Redis so every process can consult it.
+
+        Redis is only written when this process gains its first or releases
+        its last connection for a user or group, so connection churn within
+        a process costs nothing. Lookups that miss locally read Redis every
+        time, so a user connecting on another process is seen at once. A
+        process that dies without releasing leaves its users present, which
+        only means their notifications are sent as they would be without
+        tracking.
+
+        Enable before consumers accept connections; ones opened earlier are
+        not mirrored.
+
+        Args:
+            redis: Redis client to use. Defaults to the cache's connection.
+        """
+        if redis is None:
+            from django_redis import get_redis_connection
+
+            redis = get_redis_connection("default")
+        self._redis = redis
+
+    def add_user(self, user_id: str) -> None:
+        """Record a connection for a user."""
+        self._acquire(self._users, self.USERS_KEY, user_id)
+
+    def remove_user(self, user_id: str) -> None:
+        """Release a connection for a user."""
+        self._release(self._users, self.USERS_KEY, user_id)
+
+    def add_group(self, group_id: str) -> None:
+        """Record a connection subscribed to an expense group."""
+        self._acquire(self._groups, self.GROUPS_KEY, group_id)
+
+    def remove_group(self, group_id: str) -> None:
+        """Release a connection subscribed to an expense group."""
+        self._release(self._groups, self.GROUPS_KEY, group_id)
+
+    async def aadd_user(self, user_id: str) -> None:
+        """Record a connection for a user from async code."""
+        await self._run_off_loop(self.add_user, user_id)
+
+    async def aremove_user(self, user_id: str) -> None:
+        """Release a connection for a user from async code."""
+        await self._run_off_loop(self.remove_user, user_id)
+
+    async def aadd_group(self, group_id: str) -> None:
+        """Record an expense group subscription from async code."""
+        await self._run_off_loop(self.add_group, group_id)
+
+    async def aremove_group(self, group_id: str) -> None:
+        """Release an expense group subscription from async code."""
+        await self._run_off_loop(self.remove_group, group_id)
+
+    def has_user(self, user_id: str) -> bool:
+        """Check if a user has at least one open connection."""
+        return user_id in self._users or self._shared_has(self.USERS_KEY, user_id)
+
+    def has_group(self, group_id: str) -> bool:
+        """Check if an expense group has at least one subscribed connection."""
+        return group_id in self._groups or self._shared_has(self.GROUPS_KEY, group_id)
+
+    async def _run_off_loop(self, update: Callable[[str], None], key: str) -> None:
+        """Apply an update, in a worker thread when it may write Redis."""
+        if self._redis is None:
+            update(key)
+            return
+        await sync_to_async(update)(key)
+
+    def _acquire(self, counts: Counter[str], hash_key: str, key: str) -> None:
+        """Increment a count, publishing the first local connection."""
+        if key not in counts and self._redis is not None:
+            self._publish(hash_key, key, 1)
+        counts[key] += 1
+
+    def _release(self, counts: Counter[str], hash_key: str, key: str) -> None:
+        """Decrement a count, dropping the key once it reaches zero."""
+        remaining = counts[key] - 1
+        if remaining > 0:
+            counts[key] = remaining
+            return
+        if counts.pop(key, None) is not None and self._redis is not None:
+            self._publish(hash_key, key, -1)
+
+    def _publish(self, hash_key: str, key: str, delta: int) -> None:
+        """Adjust this process's share of a key in Redis."""
+        try:
+            self._redis.hincrby(hash_key, key, delta)
+        except Exception as e:
+            logger.warning(
+                "Failed to update shared presence",
+                extra={"key": key, "error": str(e)},
+            )
+
+    def _shared_has(self, hash_key: str, key: str) -> bool:
+        """Check Redis for a key held by another process."""
+        if self._redis is None:
+            return False
+
+        # Misses are not cached: a stale miss would suppress notifications
+        # for a user who has since connected on another process
+        try:
+            return int(self._redis.hget(hash_key, key) or 0) > 0
+        except Exception as e:
+            # Unknown presence must not suppress notifications
+            logger.warning(
+                "Failed to read shared presence",
+                extra={"key": key, "error": str(e)},
+            )
+            return True
+
+
+# Singleton instance
+subscriber_presence = SubscriberPresence()
@@ -2,50 +2,263 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any
+from datetime import UTC, datetime
+from decimal import Decimal
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
+from django.core.cache import cache
 
+from shared.notifications.batcher import MULTI_MESSAGE_TYPE, NotificationBatcher
+from shared.notifications.dispatcher import notification_dispatcher
+from shared.notifications.layers import BatchingRedisChannelLayer
+from shared.notifications.presence import SubscriberPresence, subscriber_presence
 from shared.notifications.types import NotificationChannel, NotificationType
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def id_to_str(value: UUID | str) -> str:
+    """Convert an ID to its string form.
+
+    Cached because the same user, account and group IDs recur across
+    notifications, and str(UUID) formats the hex digits on every call.
+    """
+    return str(value)
+
+
+def _serialize_value(value: Any) -> Any:
+    """Convert a data value the channel layer cannot encode to a string.
+
+    Lets callers put UUID and Decimal values in notification data as-is;
+    they are stringified once here instead of at every call site.
+    """
+    if isinstance(value, UUID):
+        return id_to_str(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
 @dataclass
 class NotificationPayload:
     """Payload for a notification message."""
 
-    notification_type: NotificationType
+    notification_type: str
     title: str
     message: str
     data: dict[str, Any] = field(default_factory=dict)
     action_url: str | None = None
     notification_id: UUID = field(default_factory=uuid4)
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             "notification_id": str(self.notification_id),
-            "notification_type": self.notification_type.value,
+            "notification_type": self.notification_type,
             "title": self.title,
             "message": self.message,
-            "data": self.data,
+            "data": {key: _serialize_value(value) for key, value in self.data.items()},
             "action_url": self.action_url,
             "timestamp": self.timestamp.isoformat(),
         }
 
 
+def _build_payload(
+    notification_type: str,
+    title: str,
+    message: str,
+    data: dict[str, Any],
+    action_url: str | None = None,
+) -> dict[str, Any]:
+    """Build a serialized notification payload directly.
+
+    Produces the same dict as ``NotificationPayload(...).to_dict()`` without
+    constructing the dataclass first, for the service's send path.
+    """
+    return {
+        "notification_id": str(uuid4()),
+        "notification_type": notification_type,
+        "title": title,
+        "message": message,
+        "data": {key: _serialize_value(value) for key, value in data.items()},
+        "action_url": action_url,
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+
+
 class NotificationService:
     """Service for sending notifications via WebSocket channels."""
 
-    def __init__(self):
+    DEDUP_CACHE_PREFIX = "notif_dedup"
+
+    # Payload fields unique to every notification, left out of the dedup key
+    _DEDUP_IGNORED_FIELDS = frozenset(("notification_id", "timestamp"))
+
+    def __init__(
+        self,
+        batcher: NotificationBatcher | None = None,
+        presence: SubscriberPresence | None = None,
+    ):
         self._channel_layer = None
+        # async_to_sync wrappers, built on first send and reused
+        self._group_send_sync = None
+        self._fanout_sync = None
+        # Per-thread buffer of an active batch() block
+        self._local = threading.local()
+        self._batcher = batcher
+        self._presence = presence
+        self._dedup_ttl: int | None = None
+
+    def enable_batching(self, max_batch_size: int = 64) -> NotificationBatcher:
+        """Send notifications through a background batcher.
+
+        Once enabled, sends are queued and coalesced per channel group
+        instead of being sent synchronously by the caller.
+
+        Args:
+            max_batch_size: Maximum number of messages drained per flush.
+
+        Returns:
+            The batcher now used by this service.
+        """
+        self._batcher = NotificationBatcher(self._group_send, max_batch_size)
+        return self._batcher
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce the notifications sent inside the block per channel group.
+
+        Messages are collected on the calling thread and sent when the block
+        exits: a group with one message gets it unchanged, a group with
+        several gets one ``multi.notify`` carrying them all, so each
+        connection receives a single frame. Nested blocks join the outermost
+        one. With a batcher enabled the messages are queued to it instead.
+
+        Sends handed to ``defer`` inside the block, such as those of the
+        domain event handlers, are held as well and submitted to the
+        notification dispatcher as one work item, which runs them in a batch
+        of their own on the worker thread.
+        """
+        if getattr(self._local, "buffer", None) is not None:
+            yield
+            return
+
+        buffer: dict[str, list[dict[str, Any]]] = {}
+        deferred: list[Callable[[], None]] = []
+        self._local.buffer = buffer
+        self._local.deferred = deferred
+        try:
+            yield
+        finally:
+            self._local.buffer = None
+            self._local.deferred = None
+            self._flush_buffer(buffer)
+            if deferred:
+                notification_dispatcher.submit(partial(self._run_batched, deferred))
+
+    def defer(self, send: Callable[[], None]) -> bool:
+        """Hold a dispatcher send until the calling thread's batch exits.
+
+        Args:
+            send: Zero-argument callable performing the send.
+
+        Returns:
+            True if the send was held, False if no batch is active and the
+            caller should submit it to the dispatcher itself.
+        """
+        deferred = getattr(self._local, "deferred", None)
+        if deferred is None:
+            return False
+        deferred.append(send)
+        return True
+
+    def _run_batched(self, sends: list[Callable[[], None]]) -> None:
+        """Run deferred sends inside one batch on the current thread."""
+        with self.batch():
+            for send in sends:
+                try:
+                    send()
+                except Exception as e:
+                    logger.error(
+                        "Deferred notification send failed",
+                        extra={"error": str(e)},
+                        exc_info=True,
+                    )
+
+    def enable_presence_tracking(
+        self, presence: SubscriberPresence | None = None
+    ) -> SubscriberPresence:
+        """Skip notifications for users and groups with no open connection.
+
+        Presence is tracked per process, so only enable this when
+        notifications are sent from the process that serves the WebSocket
+        connections, or after enabling sharing on the registry.
+
+        Args:
+            presence: Presence registry to consult. Defaults to the registry
+                updated by this process's consumers.
+
+        Returns:
+            The presence registry now used by this service.
+        """
+        self._presence = presence or subscriber_presence
+        return self._presence
+
+    def enable_deduplication(self, ttl: int = 5) -> None:
+        """Drop notifications identical to one sent in the last ``ttl`` seconds.
+
+        A send is identified by its target groups, message types and payload
+        content, ignoring the per-notification ID and timestamp, and claimed
+        with an atomic cache add shared by every process. Meant for events
+        emitted by several handlers at once; payloads naming distinct records
+        (e.g. a transaction_id in data) never collide.
+
+        Args:
+            ttl: Seconds an identical send is suppressed for.
+        """
+        self._dedup_ttl = ttl
+
+    def has_subscribers(self, user_id: UUID | str) -> bool:
+        """Check if a user may have a connection to receive notifications.
+
+        Always True when presence tracking is disabled.
+
+        Args:
+            user_id: The user's ID.
+
+        Returns:
+            False if the user is known to have no open connection.
+        """
+        return self._presence is None or self._presence.has_user(id_to_str(user_id))
+
+    def group_has_subscribers(self, group_id: UUID | str) -> bool:
+        """Check if an expense group may have a subscribed connection.
+
+        Always True when presence tracking is disabled.
+
+        Args:
+            group_id: The expense group's ID.
+
+        Returns:
+            False if the group is known to have no subscribed connection.
+        """
+        return self._presence is None or self._presence.has_group(id_to_str(group_id))
 
     @property
     def channel_layer(self):
@@ -57,7 +270,7 @@ class NotificationService:
     def send_to_user(
         self,
         user_id: UUID,
-        notification_type: NotificationType,
+        notification_type: str,
         title: str,
         message: str,
         data: dict[str, Any] | None = None,
@@ -73,7 +286,7 @@ class NotificationService:
             data: Additional data to include.
             action_url: Optional URL for action.
         """
-        payload = NotificationPayload(
+        payload = _build_payload(
             notification_type=notification_type,
             title=title,
             message=message,
@@ -87,10 +300,11 @@ class NotificationService:
     def send_finance_update(
         self,
         user_id: UUID,
-        notification_type: NotificationType,
+        notification_type: str,
         title: str,
         message: str,
         data: dict[str, Any] | None = None,
+        cascade: bool = True,
     ) -> None:
         """Send a finance-related update to a user.
 
@@ -100,8 +314,11 @@ class NotificationService:
             title: Notification title.
             message: Notification message.
             data: Additional data (e.g., account_id, new_balance).
+            cascade: Also send the update to the user's general notification
+                channel, with the same payload. Pass False to reach only the
+                domain channel.
         """
-        payload = NotificationPayload(
+        payload = _build_payload(
             notification_type=notification_type,
             title=title,
             message=message,
@@ -109,18 +326,29 @@ class NotificationService:
         )
 
         channel_name = NotificationChannel.FINANCE_UPDATES.format(user_id=user_id)
-        self._send_to_group(channel_name, "finance.update", payload)
-
-        # Also send to general notifications
-        self.send_to_user(user_id, notification_type, title, message, data)
+        if not cascade:
+            self._send_to_group(channel_name, "finance.update", payload)
+            return
+
+        self._send_to_groups(
+            [
+                (channel_name, "finance.update"),
+                (
+                    NotificationChannel.USER_NOTIFICATIONS.format(user_id=user_id),
+                    "notification.message",
+                ),
+            ],
+            payload,
+        )
 
     def send_social_update(
         self,
         user_id: UUID,
-        notification_type: NotificationType,
+        notification_type: str,
         title: str,
         message: str,
         data: dict[str, Any] | None = None,
+        cascade: bool = True,
     ) -> None:
         """Send a social finance update to a user.
 
@@ -130,8 +358,11 @@ class NotificationService:
             title: Notification title.
             message: Notification message.
             data: Additional data (e.g., contact_id, debt_id).
+            cascade: Also send the update to the user's general notification
+                channel, with the same payload. Pass False to reach only the
+                domain channel.
         """
-        payload = NotificationPayload(
+        payload = _build_payload(
             notification_type=notification_type,
             title=title,
             message=message,
@@ -139,19 +370,30 @@ class NotificationService:
         )
 
         channel_name = NotificationChannel.SOCIAL_UPDATES.format(user_id=user_id)
-        self._send_to_group(channel_name, "social.update", payload)
-
-        # Also send to general notifications
-        self.send_to_user(user_id, notification_type, title, message, data)
+        if not cascade:
+            self._send_to_group(channel_name, "social.update", payload)
+            return
+
+        self._send_to_groups(
+            [
+                (channel_name, "social.update"),
+                (
+                    NotificationChannel.USER_NOTIFICATIONS.format(user_id=user_id),
+                    "notification.message",
+                ),
+            ],
+            payload,
+        )
 
     def send_account_update(
         self,
         account_id: UUID,
         user_id: UUID,
-        notification_type: NotificationType,
+        notification_type: str,
         title: str,
         message: str,
         data: dict[str, Any] | None = None,
+        cascade: bool = True,
     ) -> None:
         """Send an update for a specific account.
 
@@ -162,26 +404,42 @@ class NotificationService:
             title: Notification title.
             message: Notification message.
             data: Additional data.
+            cascade: Also send the update to the owner's general notification
+                channel. Pass False to reach only the account and finance
+                channels.
         """
-        payload = NotificationPayload(
+        payload = _build_payload(
             notification_type=notification_type,
             title=title,
             message=message,
-            data={**(data or {}), "account_id": str(account_id)},
+            data={**(data or {}), "account_id": id_to_str(account_id)},
         )
 
-        # Send to account-specific channel
-        channel_name = NotificationChannel.ACCOUNT_UPDATES.format(account_id=account_id)
-        self._send_to_group(channel_name, "account.update", payload)
-
-        # Also send to user's finance channel
-        self.send_finance_update(user_id, notification_type, title, message, payload.data)
+        # Account channel and the owner's finance channel, sent together
+        sends = [
+            (
+                NotificationChannel.ACCOUNT_UPDATES.format(account_id=account_id),
+                "account.update",
+            ),
+            (
+                NotificationChannel.FINANCE_UPDATES.format(user_id=user_id),
+                "finance.update",
+            ),
+        ]
+        if cascade:
+            sends.append(
+                (
+                    NotificationChannel.USER_NOTIFICATIONS.format(user_id=user_id),
+                    "notification.message",
+                )
+            )
+        self._send_to_groups(sends, payload)
 
     def send_expense_group_update(
         self,
         group_id: UUID,
         member_user_ids: list[UUID],
-        notification_type: NotificationType,
+        notification_type: str,
         title: str,
         message: str,
         data: dict[str, Any] | None = None,
@@ -196,20 +454,35 @@ class NotificationService:
             message: Notification message.
             data: Additional data.
         """
-        payload = NotificationPayload(
+        payload = _build_payload(
             notification_type=notification_type,
             title=title,
             message=message,
-            data={**(data or {}), "group_id": str(group_id)},
+            data={**(data or {}), "group_id": id_to_str(group_id)},
         )
 
-        # Send to group-specific channel
-        channel_name = NotificationChannel.EXPENSE_GROUP_UPDATES.format(group_id=group_id)
-        self._send_to_group(channel_name, "expense_group.update", payload)
-
-        # Also send to each member's social channel
+        # Group channel, plus each member's social and general notification
+        # channels, sent together
+        sends = [
+            (
+                NotificationChannel.EXPENSE_GROUP_UPDATES.format(group_id=group_id),
+                "expense_group.update",
+            )
+        ]
         for user_id in member_user_ids:
-            self.send_social_update(user_id, notification_type, title, message, payload.data)
+            sends.append(
+                (
+                    NotificationChannel.SOCIAL_UPDATES.format(user_id=user_id),
+                    "social.update",
+                )
+            )
+            sends.append(
+                (
+                    NotificationChannel.USER_NOTIFICATIONS.format(user_id=user_id),
+                    "notification.message",
+                )
+            )
+        self._send_to_groups(sends, payload)
 
     def send_system_status(
         self,
@@ -224,7 +497,7 @@ class NotificationService:
             message: Status message.
             data: Additional data.
         """
-        payload = NotificationPayload(
+        payload = _build_payload(
             notification_type=NotificationType.INFO,
             title="System Status",
             message=message,
@@ -241,42 +514,232 @@ class NotificationService:
         self,
         group_name: str,
         message_type: str,
-        payload: NotificationPayload,
+        payload_dict: dict[str, Any],
     ) -> None:
         """Send a message to a channel group.
 
+        The payload is built for this send alone, so it becomes the message
+        itself instead of being copied into a new dict.
+
         Args:
             group_name: The channel group name.
             message_type: The message type for the consumer.
-            payload: The notification payload.
+            payload_dict: The serialized notification payload. Taken over
+                as the message.
         """
+        if self._is_duplicate([(group_name, message_type)], payload_dict):
+            return
+        message = payload_dict
+        message["type"] = message_type
+        if self._buffer_messages([(group_name, message)]):
+            return
+        if self._batcher is not None:
+            self._batcher.enqueue(group_name, message)
+            return
+
         try:
-            async_to_sync(self.channel_layer.group_send)(
-                group_name,
-                {
-                    "type": message_type,
-                    **payload.to_dict(),
-                },
-            )
-            logger.debug(
-                "Sent notification to group",
+            self._group_send(group_name, message)
+            # Skip building the extra dict when debug logging is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Sent notification to group",
+                    extra={
+                        "group": group_name,
+                        "message_type": message_type,
+                        "notification_id": payload_dict["notification_id"],
+                    },
+                )
+        except Exception as e:
+            logger.error(
+                "Failed to send notification",
                 extra={
                     "group": group_name,
                     "message_type": message_type,
-                    "notification_id": str(payload.notification_id),
+                    "error": str(e),
                 },
+                exc_info=True,
             )
+
+    def _send_to_groups(
+        self,
+        sends: list[tuple[str, str]],
+        payload_dict: dict[str, Any],
+    ) -> None:
+        """Send one payload to several channel groups at once.
+
+        Without a batcher all sends go out concurrently from a single
+        sync-to-async hop.
+
+        Args:
+            sends: (group name, message type) pairs to send to.
+            payload_dict: The serialized payload shared by every group.
+        """
+        if self._is_duplicate(sends, payload_dict):
+            return
+        messages = [
+            (group_name, {"type": message_type, **payload_dict})
+            for group_name, message_type in sends
+        ]
+        if self._buffer_messages(messages):
+            return
+        if self._batcher is not None:
+            for group_name, message in messages:
+                self._batcher.enqueue(group_name, message)
+            return
+
+        try:
+            self._group_send_many(messages)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Sent notification to groups",
+                    extra={
+                        "group_count": len(messages),
+                        "notification_id": payload_dict["notification_id"],
+                    },
+                )
         except Exception as e:
             logger.error(
                 "Failed to send notification",
                 extra={
-                    "group": group_name,
-                    "message_type": message_type,
+                    "groups": [group_name for group_name, _ in messages],
                     "error": str(e),
                 },
                 exc_info=True,
             )
 
+    def _is_duplicate(
+        self, sends: list[tuple[str, str]], payload_dict: dict[str, Any]
+    ) -> bool:
+        """Check if an identical send was made within the dedup TTL.
+
+        Always False when deduplication is disabled, or if the cache cannot
+        be reached, so a cache outage never suppresses notifications.
+
+        Args:
+            sends: (group name, message type) pairs being sent to.
+            payload_dict: The serialized notification payload.
+
+        Returns:
+            True if the send should be skipped.
+        """
+        if self._dedup_ttl is None:
+            return False
+
+        content = json.dumps(
+            [
+                sends,
+                {
+                    key: value
+                    for key, value in payload_dict.items()
+                    if key not in self._DEDUP_IGNORED_FIELDS
+                },
+            ],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        digest = hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()
+        try:
+            return not cache.add(
+                f"{self.DEDUP_CACHE_PREFIX}:{digest}", 1, self._dedup_ttl
+            )
+        except Exception as e:
+            logger.warning(
+                "Notification dedup check failed",
+                extra={"error": str(e)},
+            )
+            return False
+
+    def _buffer_messages(self, messages: list[tuple[str, dict[str, Any]]]) -> bool:
+        """Add messages to the calling thread's batch, if one is active.
+
+        Returns:
+            True if the messages were buffered, False if no batch is active.
+        """
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return False
+        for group_name, message in messages:
+            buffer.setdefault(group_name, []).append(message)
+        return True
+
+    def _flush_buffer(self, buffer: dict[str, list[dict[str, Any]]]) -> None:
+        """Send a finished batch with one message per channel group."""
+        if self._batcher is not None:
+            for group_name, messages in buffer.items():
+                for message in messages:
+                    self._batcher.enqueue(group_name, message)
+            return
+        if not buffer:
+            return
+
+        batched = [
+            (
+                group_name,
+                (
+                    messages[0]
+                    if len(messages) == 1
+                    else {"type": MULTI_MESSAGE_TYPE, "messages": messages}
+                ),
+            )
+            for group_name, messages in buffer.items()
+        ]
+        try:
+            self._group_send_many(batched)
+        except Exception as e:
+            logger.error(
+                "Failed to send notification batch",
+                extra={"group_count": len(batched), "error": str(e)},
+                exc_info=True,
+            )
+
+    def _group_send(self, group_name: str, message: dict[str, Any]) -> None:
+        """Send a message to a channel group from sync code."""
+        if self._group_send_sync is None:
+            self._group_send_sync = async_to_sync(self.channel_layer.group_send)
+        self._group_send_sync(group_name, message)
+
+    def _group_send_many(self, messages: list[tuple[str, dict[str, Any]]]) -> None:
+        """Send messages to their channel groups concurrently from sync code."""
+        if self._fanout_sync is None:
+            self._fanout_sync = async_to_sync(self._fanout)
+        self._fanout_sync(messages)
+
+    async def _fanout(self, messages: list[tuple[str, dict[str, Any]]]) -> None:
+        """Send every message in one batch, or await every group_send together."""
+        channel_layer = self.channel_layer
+        if isinstance(channel_layer, BatchingRedisChannelLayer):
+            await channel_layer.group_send_multi(messages)
+            return
+        await asyncio.gather(
+            *(
+                channel_layer.group_send(group_name, message)
+                for group_name, message in messages
+            )
+        )
+
 
 # Singleton instance
 notification_service = NotificationService()
+
+
+def configure_notifications(
+    options: Mapping[str, Any],
+    service: NotificationService | None = None,
+) -> None:
+    """Enable the opt-in notification features named in a settings mapping.
+
+    Args:
+        options: The ``REALTIME_NOTIFICATIONS`` setting. Features whose key
+            is missing or false stay disabled.
+        service: Service to configure. Defaults to the singleton.
+    """
+    service = service or notification_service
+    if options.get("SHARE_PRESENCE"):
+        subscriber_presence.enable_sharing()
+    if options.get("PRESENCE_TRACKING"):
+        service.enable_presence_tracking()
+    if options.get("BATCHING"):
+        service.enable_batching()
+    if options.get("DEDUP_TTL"):
+        service.enable_deduplication(ttl=options["DEDUP_TTL"])
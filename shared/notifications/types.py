@@ -3,49 +3,58 @@
 from __future__ import annotations
 
 from enum import Enum
+from string import Formatter
+from typing import Final
 
 
-class NotificationType(str, Enum):
-    """Types of notifications that can be sent."""
+class NotificationType:
+    """Types of notifications that can be sent.
+
+    Plain string constants rather than an Enum: the values are only ever
+    written into payloads, so sends use them as they are.
+    """
 
     # System notifications
-    INFO = "info"
-    SUCCESS = "success"
-    WARNING = "warning"
-    ERROR = "error"
+    INFO: Final = "info"
+    SUCCESS: Final = "success"
+    WARNING: Final = "warning"
+    ERROR: Final = "error"
 
     # Finance notifications
-    TRANSACTION_CREATED = "transaction.created"
-    TRANSACTION_POSTED = "transaction.posted"
-    TRANSACTION_VOIDED = "transaction.voided"
-    BALANCE_UPDATED = "balance.updated"
-    TRANSFER_COMPLETED = "transfer.completed"
-    ACCOUNT_CREATED = "account.created"
-    ACCOUNT_UPDATED = "account.updated"
-    ACCOUNT_CLOSED = "account.closed"
-    NET_WORTH_UPDATED = "net_worth.updated"
-    NET_WORTH_CHANGED = "net_worth.changed"
+    TRANSACTION_CREATED: Final = "transaction.created"
+    TRANSACTION_POSTED: Final = "transaction.posted"
+    TRANSACTION_VOIDED: Final = "transaction.voided"
+    BALANCE_UPDATED: Final = "balance.updated"
+    TRANSFER_COMPLETED: Final = "transfer.completed"
+    ACCOUNT_CREATED: Final = "account.created"
+    ACCOUNT_UPDATED: Final = "account.updated"
+    ACCOUNT_CLOSED: Final = "account.closed"
+    NET_WORTH_UPDATED: Final = "net_worth.updated"
+    NET_WORTH_CHANGED: Final = "net_worth.changed"
 
     # Social finance notifications
-    CONTACT_CREATED = "contact.created"
-    CONTACT_LINKED = "contact.linked"
-    PEER_DEBT_CREATED = "peer_debt.created"
-    PEER_DEBT_SETTLED = "peer_debt.settled"
-    PEER_DEBT_CANCELLED = "peer_debt.cancelled"
-    GROUP_EXPENSE_CREATED = "group_expense.created"
-    GROUP_EXPENSE_UPDATED = "group_expense.updated"
-    GROUP_MEMBER_ADDED = "group.member_added"
-    GROUP_MEMBER_REMOVED = "group.member_removed"
-    EXPENSE_SPLIT_SETTLED = "expense_split.settled"
-    SETTLEMENT_CREATED = "settlement.created"
-    SETTLEMENT_RECORDED = "settlement.recorded"
-    BALANCE_WITH_CONTACT_CHANGED = "balance.contact_changed"
-    GROUP_BALANCE_CHANGED = "balance.group_changed"
+    CONTACT_CREATED: Final = "contact.created"
+    CONTACT_LINKED: Final = "contact.linked"
+    PEER_DEBT_CREATED: Final = "peer_debt.created"
+    PEER_DEBT_SETTLED: Final = "peer_debt.settled"
+    PEER_DEBT_CANCELLED: Final = "peer_debt.cancelled"
+    GROUP_EXPENSE_CREATED: Final = "group_expense.created"
+    GROUP_EXPENSE_UPDATED: Final = "group_expense.updated"
+    GROUP_MEMBER_ADDED: Final = "group.member_added"
+    GROUP_MEMBER_REMOVED: Final = "group.member_removed"
+    EXPENSE_SPLIT_SETTLED: Final = "expense_split.settled"
+    SETTLEMENT_CREATED: Final = "settlement.created"
+    SETTLEMENT_RECORDED: Final = "settlement.recorded"
+    BALANCE_WITH_CONTACT_CHANGED: Final = "balance.contact_changed"
+    GROUP_BALANCE_CHANGED: Final = "balance.group_changed"
 
 
 class NotificationChannel(str, Enum):
     """WebSocket channels for notifications."""
 
+    # (prefix, placeholder name or None, suffix), set below for every member
+    _template: tuple[str, str | None, str]
+
     # User-specific notifications
     USER_NOTIFICATIONS = "notifications_{user_id}"
 
@@ -63,4 +72,24 @@ class NotificationChannel(str, Enum):
 
     def format(self, **kwargs) -> str:
         """Format the channel name with provided values."""
-        return self.value.format(**kwargs)
+        prefix, field_name, suffix = self._template
+        if field_name is None:
+            return prefix
+        return f"{prefix}{kwargs[field_name]}{suffix}"
+
+
+def _split_template(value: str) -> tuple[str, str | None, str]:
+    """Split a channel name template around its single placeholder.
+
+    Returns:
+        Tuple of (prefix, field name or None, suffix).
+    """
+    parts = list(Formatter().parse(value))
+    prefix, field_name = parts[0][0], parts[0][1]
+    suffix = "".join(literal for literal, *_ in parts[1:])
+    return prefix, field_name, suffix
+
+
+# Templates are parsed once here instead of by str.format on every call
+for _channel in NotificationChannel:
+    _channel._template = _split_template(_channel.value)
@@ -7,12 +7,58 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from django.core.cache import cache
 from rest_framework import permissions
 
+from modules.subscriptions.domain.enums import FeatureCode
+from modules.subscriptions.domain.services import PermissionService, UsageLimitService
+from shared.middleware import get_subscription_context
+
 if TYPE_CHECKING:
     from rest_framework.request import Request
     from rest_framework.views import APIView
 
+# Seconds a tenant's account count is cached for CanCreateAccount; account
+# creation and deletion invalidate it sooner
+ACCOUNT_COUNT_CACHE_TTL = 60
+
+
+def _account_count_key(tenant_id: Any) -> str:
+    """Cache key for a tenant's account count."""
+    return f"acct_count:{tenant_id}"
+
+
+def _count_accounts(tenant_id: Any) -> int:
+    """Count a tenant's accounts in the database."""
+    from modules.finance.infrastructure.models import Account
+
+    return Account.objects.filter(tenant_id=tenant_id).count()
+
+
+def invalidate_account_count(tenant_id: Any) -> None:
+    """Drop a tenant's cached account count.
+
+    Args:
+        tenant_id: The tenant whose accounts changed.
+    """
+    cache.delete(_account_count_key(tenant_id))
+
+
+def _tenant_eq(a: Any, b: Any) -> bool:
+    """Check whether two tenant IDs refer to the same tenant.
+
+    UUIDs are compared by their integer value without formatting either
+    side. Anything else, including a UUID against its string form, falls
+    back to comparing string representations.
+    """
+    if a is None or b is None:
+        return False
+    a_int = getattr(a, "int", None)
+    b_int = getattr(b, "int", None)
+    if a_int is not None and b_int is not None:
+        return a_int == b_int
+    return a == b or str(a) == str(b)
+
 
 class IsActiveUser(permissions.BasePermission):
     """Permission to check if user is active and verified.
@@ -27,20 +73,14 @@ class IsActiveUser(permissions.BasePermission):
 
     def has_permission(self, request: Request, view: APIView) -> bool:
         """Check if user is active and verified."""
-        if not request.user or not request.user.is_authenticated:
-            return False
-
-        # Check user status
-        if hasattr(request.user, "status"):
-            if request.user.status != "active":
-                return False
-
-        # Check email verification
-        if hasattr(request.user, "is_email_verified"):
-            if not request.user.is_email_verified:
-                return False
-
-        return True
+        user = request.user
+        # Users without a status or verification flag pass that check
+        return bool(
+            user
+            and user.is_authenticated
+            and getattr(user, "status", "active") == "active"
+            and getattr(user, "is_email_verified", True)
+        )
 
 
 class IsPremiumUser(permissions.BasePermission):
@@ -55,13 +95,12 @@ class IsPremiumUser(permissions.BasePermission):
 
     def has_permission(self, request: Request, view: APIView) -> bool:
         """Check if user has premium role."""
-        if not request.user or not request.user.is_authenticated:
-            return False
-
-        if hasattr(request.user, "role"):
-            return request.user.role in ("premium", "superadmin")
-
-        return False
+        user = request.user
+        return bool(
+            user
+            and user.is_authenticated
+            and getattr(user, "role", None) in ("premium", "superadmin")
+        )
 
 
 class IsSuperAdmin(permissions.BasePermission):
@@ -76,13 +115,12 @@ class IsSuperAdmin(permissions.BasePermission):
 
     def has_permission(self, request: Request, view: APIView) -> bool:
         """Check if user is superadmin."""
-        if not request.user or not request.user.is_authenticated:
-            return False
-
-        if hasattr(request.user, "role"):
-            return request.user.role == "superadmin"
-
-        return False
+        user = request.user
+        return bool(
+            user
+            and user.is_authenticated
+            and getattr(user, "role", None) == "superadmin"
+        )
 
 
 class IsOwner(permissions.BasePermission):
@@ -112,7 +150,7 @@ class IsOwner(permissions.BasePermission):
             # Object doesn't have tenant_id, allow access
             return True
 
-        return str(user_tenant_id) == str(obj_tenant_id)
+        return _tenant_eq(user_tenant_id, obj_tenant_id)
 
 
 class ReadOnly(permissions.BasePermission):
@@ -152,7 +190,7 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         if not user_tenant_id or not obj_tenant_id:
             return False
 
-        return str(user_tenant_id) == str(obj_tenant_id)
+        return _tenant_eq(user_tenant_id, obj_tenant_id)
 
 
 class HasRole(permissions.BasePermission):
@@ -173,7 +211,7 @@ class HasRole(permissions.BasePermission):
         Args:
             allowed_roles: List of role names that are allowed access.
         """
-        self.allowed_roles = allowed_roles or []
+        self.allowed_roles = frozenset(allowed_roles or ())
 
     def has_permission(self, request: Request, view: APIView) -> bool:
         """Check if user has one of the allowed roles."""
@@ -214,13 +252,15 @@ class CanCreateAccount(permissions.BasePermission):
         if user_role in ("premium", "superadmin"):
             return True
 
-        # Count existing accounts
-        from modules.finance.infrastructure.models import Account
-
         if not user_tenant_id:
             return False
 
-        account_count = Account.objects.filter(tenant_id=user_tenant_id).count()
+        # Count existing accounts, cached per tenant
+        account_count = cache.get_or_set(
+            _account_count_key(user_tenant_id),
+            lambda: _count_accounts(user_tenant_id),
+            timeout=ACCOUNT_COUNT_CACHE_TTL,
+        )
         limit = 3  # User role limit
 
         if account_count >= limit:
@@ -260,7 +300,7 @@ class TenantIsolation(permissions.BasePermission):
         if not user_tenant_id:
             return False
 
-        return str(user_tenant_id) == str(obj_tenant_id)
+        return _tenant_eq(user_tenant_id, obj_tenant_id)
 
 
 # =============================================================================
@@ -268,6 +308,21 @@ class TenantIsolation(permissions.BasePermission):
 # =============================================================================
 
 
+def _user_has_feature(user: Any, feature_code: str) -> bool:
+    """Check a feature against the request's subscription context.
+
+    The context loaded by the middleware is the same PermissionService
+    context, so when it belongs to this user it answers the check without
+    another service lookup. Requests authenticated after the middleware ran,
+    such as JWT requests, have no context and use the service.
+    """
+    context = get_subscription_context()
+    if context is not None and context.user_id == user.id:
+        return context.has_feature(feature_code)
+
+    return PermissionService.has_feature(user, feature_code)
+
+
 class HasFeature(permissions.BasePermission):
     """Permission that checks if subscription tier includes a feature.
 
@@ -305,17 +360,7 @@ class HasFeature(permissions.BasePermission):
             # No feature code specified, allow access
             return True
 
-        # Check subscription context
-        from shared.middleware import get_subscription_context
-
-        context = get_subscription_context()
-        if context and context.has_feature(feature_code):
-            return True
-
-        # Fallback to service check
-        from modules.subscriptions.domain.services import PermissionService
-
-        return PermissionService.has_feature(request.user, feature_code)
+        return _user_has_feature(request.user, feature_code)
 
 
 class WithinUsageLimit(permissions.BasePermission):
@@ -360,8 +405,6 @@ class WithinUsageLimit(permissions.BasePermission):
             return True
 
         # Check usage limit
-        from modules.subscriptions.domain.services import UsageLimitService
-
         allowed, error_message = UsageLimitService.can_perform_action(
             request.user, limit_key
         )
@@ -392,12 +435,7 @@ class HasApiAccess(permissions.BasePermission):
             return True
 
         # JWT-authenticated requests require API access feature
-        from modules.subscriptions.domain.enums import FeatureCode
-        from modules.subscriptions.domain.services import PermissionService
-
-        return PermissionService.has_feature(
-            request.user, FeatureCode.API_ACCESS.value
-        )
+        return _user_has_feature(request.user, FeatureCode.API_ACCESS.value)
 
 
 class CanExport(permissions.BasePermission):
@@ -446,6 +484,4 @@ class CanExport(permissions.BasePermission):
             return True
 
         # Other formats require the feature
-        from modules.subscriptions.domain.services import PermissionService
-
-        return PermissionService.has_feature(request.user, feature_code)
+        return _user_has_feature(request.user, feature_code)
@@ -12,6 +12,9 @@ from typing import Any, ClassVar
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from modules.subscriptions.domain.services import PermissionService
+from shared.middleware import get_tenant_id
+
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """Custom JWT token serializer that includes tenant claims.
@@ -93,8 +96,6 @@ class TenantModelSerializer(BaseModelSerializer):
         Returns:
             Created model instance.
         """
-        from shared.middleware import get_tenant_id
-
         tenant_id = get_tenant_id()
         if tenant_id:
             validated_data["tenant_id"] = tenant_id
@@ -145,40 +146,62 @@ class FieldPermissionMixin:
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the serializer and filter fields based on permissions."""
         super().__init__(*args, **kwargs)
+        # (user pk, feature code) -> access, shared by every instance this
+        # serializer represents, including each item of a many=True list
+        self._has_feature_cache: dict[tuple[Any, str], bool] = {}
+        # Masks applied to each representation, resolved on first use
+        self._fields_to_mask: list[tuple[str, Any]] | None = None
         self._filter_premium_fields()
 
+    def _check_feature(self, user: Any, feature_code: str) -> bool:
+        """Check a user's access to a feature, once per serializer.
+
+        Args:
+            user: The authenticated user.
+            feature_code: The feature code to check.
+
+        Returns:
+            True if the user has access to the feature.
+        """
+        key = (user.pk, feature_code)
+        has_access = self._has_feature_cache.get(key)
+        if has_access is None:
+            has_access = PermissionService.has_feature(user, feature_code)
+            self._has_feature_cache[key] = has_access
+        return has_access
+
     def _filter_premium_fields(self) -> None:
         """Filter out premium fields the user doesn't have access to."""
-        if not self.premium_fields:
+        # Without hiding, fields stay and to_representation masks them
+        if not self.premium_fields or not self.hide_premium_fields:
             return
 
-        # Get user from context
-        request = self.context.get("request")
-        if not request or not hasattr(request, "user"):
-            return
-
-        user = request.user
-        if not user or not user.is_authenticated:
-            # For unauthenticated users, hide all premium fields
-            if self.hide_premium_fields:
-                for field_name in self.premium_fields:
-                    self.fields.pop(field_name, None)
+        request_user = self._get_request_user()
+        if request_user is None:
             return
 
-        # Check each premium field
-        from modules.subscriptions.domain.services import PermissionService
-
+        user, is_authenticated = request_user
+        fields = self.fields
         for field_name, feature_code in self.premium_fields.items():
-            if field_name not in self.fields:
+            if field_name not in fields:
                 continue
+            # Unauthenticated users lose every premium field
+            if not is_authenticated or not self._check_feature(user, feature_code):
+                fields.pop(field_name, None)
 
-            has_access = PermissionService.has_feature(user, feature_code)
+    def _get_request_user(self) -> tuple[Any, bool] | None:
+        """Get the request user from context, resolving it once per call.
 
-            if not has_access:
-                if self.hide_premium_fields:
-                    # Completely remove the field
-                    self.fields.pop(field_name, None)
-                # If not hiding, the to_representation will handle masking
+        Returns:
+            None if there is no request in context, otherwise the user and
+            whether they are authenticated.
+        """
+        request = self.context.get("request")
+        if not request or not hasattr(request, "user"):
+            return None
+
+        user = request.user
+        return user, bool(user and user.is_authenticated)
 
     def to_representation(self, instance: Any) -> dict[str, Any]:
         """Convert instance to representation, masking premium fields if needed.
@@ -191,35 +214,51 @@ class FieldPermissionMixin:
         """
         data = super().to_representation(instance)  # type: ignore[misc]
 
-        if self.hide_premium_fields or not self.masked_fields:
-            return data
+        fields_to_mask = self._fields_to_mask
+        if fields_to_mask is None:
+            fields_to_mask = self._fields_to_mask = self._resolve_fields_to_mask(data)
 
-        # Get user from context
-        request = self.context.get("request")
-        if not request or not hasattr(request, "user"):
-            return data
+        for field_name, mask_value in fields_to_mask:
+            data[field_name] = mask_value
 
-        user = request.user
-        if not user or not user.is_authenticated:
-            # Mask all premium fields for unauthenticated users
-            for field_name, mask_value in self.masked_fields.items():
-                if field_name in data:
-                    data[field_name] = mask_value
-            return data
+        return data
 
-        # Check and mask each premium field
-        from modules.subscriptions.domain.services import PermissionService
+    def _resolve_fields_to_mask(self, data: dict[str, Any]) -> list[tuple[str, Any]]:
+        """Decide which fields to mask for this serializer's user.
 
-        for field_name, feature_code in self.premium_fields.items():
-            if field_name not in data:
-                continue
+        The user and the serialized fields are the same for every instance
+        this serializer represents, so this runs once, on the first one.
 
-            has_access = PermissionService.has_feature(user, feature_code)
+        Args:
+            data: The first representation, naming the serialized fields.
 
-            if not has_access and field_name in self.masked_fields:
-                data[field_name] = self.masked_fields[field_name]
+        Returns:
+            (field name, masked value) pairs to apply to each representation.
+        """
+        if self.hide_premium_fields or not self.masked_fields:
+            return []
 
-        return data
+        request_user = self._get_request_user()
+        if request_user is None:
+            return []
+
+        user, is_authenticated = request_user
+        if not is_authenticated:
+            # Mask all premium fields for unauthenticated users
+            return [
+                (field_name, mask_value)
+                for field_name, mask_value in self.masked_fields.items()
+                if field_name in data
+            ]
+
+        # Mask each premium field the user lacks the feature for
+        return [
+            (field_name, self.masked_fields[field_name])
+            for field_name, feature_code in self.premium_fields.items()
+            if field_name in data
+            and field_name in self.masked_fields
+            and not self._check_feature(user, feature_code)
+        ]
 
 
 class ErrorDetailSerializer(serializers.Serializer):
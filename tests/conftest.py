@@ -99,6 +99,20 @@ def mock_correlation_context(
         correlation_id_var.reset(token)
 
 
+@pytest.fixture(autouse=True)
+def clear_permission_cache() -> Generator[None, None, None]:
+    """Keep permission contexts cached in this process from leaking between tests.
+
+    Yields:
+        Nothing; the per-process cache is cleared around the test.
+    """
+    from modules.subscriptions.domain.services import PermissionService
+
+    PermissionService.clear_local_cache()
+    yield
+    PermissionService.clear_local_cache()
+
+
 # Mark for database access
 @pytest.fixture
 def db_access(db: Any) -> None:
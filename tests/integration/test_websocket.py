@@ -6,17 +6,25 @@ the channel layer and authentication.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import sys
+import threading
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import fakeredis
 import pytest
+from channels.consumer import AsyncConsumer
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from channels.testing import WebsocketCommunicator
 from rest_framework_simplejwt.tokens import AccessToken
 
-from shared.consumers.base import AuthenticatedConsumer
+from modules.demo.interfaces.consumers import NotificationConsumer
+from shared.consumers.base import AuthenticatedConsumer, ConcurrentDispatchMixin
 from shared.consumers.finance import FinanceConsumer
 from shared.consumers.health import (
     BackpressureHandler,
@@ -24,7 +32,24 @@ from shared.consumers.health import (
     HealthMonitor,
 )
 from shared.consumers.social import SocialConsumer
-from shared.notifications.service import NotificationPayload, NotificationService
+from shared.events.handlers import (
+    FINANCE_HANDLERS,
+    SOCIAL_HANDLERS,
+    register_event_handlers,
+)
+from shared.events.signals import EVENT_SIGNALS, emit_event
+from shared.middleware import correlation_id_var, get_correlation_id
+from shared.notifications.batcher import MULTI_MESSAGE_TYPE, NotificationBatcher
+from shared.notifications.dispatcher import NotificationDispatcher
+from shared.notifications.layers import BatchingRedisChannelLayer
+from shared.notifications.presence import SubscriberPresence
+from shared.notifications.service import (
+    NotificationPayload,
+    NotificationService,
+    _build_payload,
+    configure_notifications,
+    notification_service,
+)
 from shared.notifications.types import NotificationChannel, NotificationType
 
 
@@ -163,6 +188,16 @@ class TestHealthMonitor:
         assert len(unhealthy) == 1
         assert "channel-2" in unhealthy
 
+    def test_unregister_clears_unhealthy(self):
+        """Test unregistering removes a connection from the unhealthy set."""
+        monitor = HealthMonitor()
+        state = monitor.register_connection("channel-1")
+        state.mark_unhealthy()
+
+        monitor.unregister_connection("channel-1")
+
+        assert monitor.get_unhealthy_connections() == []
+
 
 class TestBackpressureHandler:
     """Tests for BackpressureHandler class."""
@@ -239,10 +274,49 @@ class TestNotificationPayload:
         result = payload.to_dict()
 
         assert result["notification_type"] == "info"
+        assert type(result["notification_type"]) is str
         assert result["title"] == "Test"
         assert "notification_id" in result
         assert "timestamp" in result
 
+    def test_to_dict_serializes_data_values(self):
+        """Test UUID and Decimal data values are converted to strings."""
+        account_id = uuid4()
+        payload = NotificationPayload(
+            notification_type=NotificationType.BALANCE_UPDATED,
+            title="Test",
+            message="Message",
+            data={"account_id": account_id, "amount": Decimal("12.50"), "count": 2},
+        )
+
+        result = payload.to_dict()
+
+        assert result["data"] == {
+            "account_id": str(account_id),
+            "amount": "12.50",
+            "count": 2,
+        }
+        json.dumps(result)
+
+    def test_build_payload_matches_to_dict(self):
+        """Test the service's direct builder produces the to_dict shape."""
+        fields = {
+            "notification_type": NotificationType.BALANCE_UPDATED,
+            "title": "Test",
+            "message": "Message",
+            "data": {"account_id": uuid4(), "amount": Decimal("12.50")},
+            "action_url": "/accounts/",
+        }
+
+        built = _build_payload(**fields)
+        expected = NotificationPayload(**fields).to_dict()
+
+        assert built.keys() == expected.keys()
+        for key in ("notification_id", "timestamp"):
+            assert isinstance(built.pop(key), str)
+            expected.pop(key)
+        assert built == expected
+
 
 class TestNotificationChannel:
     """Tests for NotificationChannel enum."""
@@ -279,6 +353,19 @@ class TestNotificationChannel:
 
         assert channel == f"expense_group_{group_id}"
 
+    def test_format_without_placeholder(self):
+        """Test a channel without a placeholder formats to its value."""
+        assert NotificationChannel.SYSTEM_STATUS.format() == "system_status"
+
+    @pytest.mark.parametrize("channel", list(NotificationChannel))
+    def test_format_matches_str_format(self, channel):
+        """Test the precompiled format gives the same name as str.format."""
+        ids = dict.fromkeys(
+            ("user_id", "account_id", "contact_id", "group_id"), uuid4()
+        )
+
+        assert channel.format(**ids) == channel.value.format(**ids)
+
 
 class TestNotificationService:
     """Tests for NotificationService class."""
@@ -320,17 +407,41 @@ class TestNotificationService:
         user_id = uuid4()
 
         with patch("shared.notifications.service.async_to_sync") as mock_async_to_sync:
-            mock_async_to_sync.return_value = lambda *args: None
+            send_sync = mock_async_to_sync.return_value
             service.send_finance_update(
                 user_id=user_id,
                 notification_type=NotificationType.BALANCE_UPDATED,
                 title="Balance Updated",
                 message="Your balance changed",
                 data={"new_balance": "1000.00"},
+                cascade=False,
+            )
+
+        # Sent to the finance channel only
+        mock_async_to_sync.assert_called_once_with(mock_channel_layer.group_send)
+        send_sync.assert_called_once()
+        group, finance = send_sync.call_args.args
+        assert group == f"finance_{user_id}"
+        assert finance["type"] == "finance.update"
+        assert finance["data"] == {"new_balance": "1000.00"}
+
+    def test_send_finance_update_cascade_shares_payload(self):
+        """Test the default cascade to user notifications reuses the payload."""
+        service = NotificationService()
+        user_id = uuid4()
+
+        with patch.object(service, "_group_send_many") as mock_send_many:
+            service.send_finance_update(
+                user_id=user_id,
+                notification_type=NotificationType.BALANCE_UPDATED,
+                title="Balance Updated",
+                message="Your balance changed",
             )
 
-        # Should be called twice (finance channel + user notification)
-        assert mock_async_to_sync.call_count == 2
+        (_, finance), (_, notification) = mock_send_many.call_args[0][0]
+        assert finance["type"] == "finance.update"
+        assert notification["type"] == "notification.message"
+        assert finance["notification_id"] == notification["notification_id"]
 
     @patch("shared.notifications.service.get_channel_layer")
     def test_send_social_update(self, mock_get_channel_layer):
@@ -342,7 +453,27 @@ class TestNotificationService:
         user_id = uuid4()
 
         with patch("shared.notifications.service.async_to_sync") as mock_async_to_sync:
-            mock_async_to_sync.return_value = lambda *args: None
+            send_sync = mock_async_to_sync.return_value
+            service.send_social_update(
+                user_id=user_id,
+                notification_type=NotificationType.PEER_DEBT_CREATED,
+                title="Debt Recorded",
+                message="New peer debt",
+                cascade=False,
+            )
+
+        # Sent to the social channel only
+        mock_async_to_sync.assert_called_once_with(mock_channel_layer.group_send)
+        assert send_sync.call_args.args[0] == f"social_{user_id}"
+        send_sync.assert_called_once()
+
+
+    def test_send_social_update_cascades_by_default(self):
+        """Test social updates also reach the general notification channel."""
+        service = NotificationService()
+        user_id = uuid4()
+
+        with patch.object(service, "_group_send_many") as mock_send_many:
             service.send_social_update(
                 user_id=user_id,
                 notification_type=NotificationType.PEER_DEBT_CREATED,
@@ -350,8 +481,730 @@ class TestNotificationService:
                 message="New peer debt",
             )
 
-        # Should be called twice (social channel + user notification)
-        assert mock_async_to_sync.call_count == 2
+        messages = mock_send_many.call_args[0][0]
+        assert [(group, m["type"]) for group, m in messages] == [
+            (f"social_{user_id}", "social.update"),
+            (f"notifications_{user_id}", "notification.message"),
+        ]
+
+    def test_send_expense_group_update_shares_payload(self):
+        """Test group fan-out sends one payload to every group in one batch."""
+        service = NotificationService()
+        service._channel_layer = MagicMock(group_send=AsyncMock())
+        member_ids = [uuid4(), uuid4()]
+
+        service.send_expense_group_update(
+            group_id=uuid4(),
+            member_user_ids=member_ids,
+            notification_type=NotificationType.GROUP_EXPENSE_CREATED,
+            title="New Group Expense",
+            message="Dinner",
+        )
+
+        group_send = service._channel_layer.group_send
+        messages = [call.args[1] for call in group_send.await_args_list]
+        assert len(messages) == 1 + 2 * len(member_ids)
+        assert len({m["notification_id"] for m in messages}) == 1
+
+    @pytest.mark.parametrize("cascade", [False, True])
+    def test_send_account_update_fans_out_once(self, cascade):
+        """Test account updates reach their channels together."""
+        service = NotificationService()
+        account_id, user_id = uuid4(), uuid4()
+
+        with patch.object(service, "_group_send_many") as mock_send_many:
+            service.send_account_update(
+                account_id=account_id,
+                user_id=user_id,
+                notification_type=NotificationType.ACCOUNT_UPDATED,
+                title="Account Updated",
+                message="Renamed",
+                cascade=cascade,
+            )
+
+        mock_send_many.assert_called_once()
+        messages = mock_send_many.call_args[0][0]
+        expected = [
+            (f"account_{account_id}", "account.update"),
+            (f"finance_{user_id}", "finance.update"),
+        ]
+        if cascade:
+            expected.append((f"notifications_{user_id}", "notification.message"))
+        assert [(group, m["type"]) for group, m in messages] == expected
+        assert messages[0][1]["data"]["account_id"] == str(account_id)
+
+    def test_batch_coalesces_messages_per_group(self):
+        """Test a batch block sends one message per channel group on exit."""
+        service = NotificationService()
+        service._channel_layer = MagicMock(group_send=AsyncMock())
+        user_id = uuid4()
+
+        with service.batch():
+            for _ in range(2):
+                service.send_finance_update(
+                    user_id=user_id,
+                    notification_type=NotificationType.BALANCE_UPDATED,
+                    title="Balance Updated",
+                    message="Your balance changed",
+                    cascade=True,
+                )
+            with service.batch():
+                service.send_to_user(
+                    user_id=user_id,
+                    notification_type=NotificationType.INFO,
+                    title="Test",
+                    message="Test message",
+                )
+            service._channel_layer.group_send.assert_not_awaited()
+
+        sent = {
+            call.args[0]: call.args[1]
+            for call in service._channel_layer.group_send.await_args_list
+        }
+        assert set(sent) == {f"finance_{user_id}", f"notifications_{user_id}"}
+        assert sent[f"finance_{user_id}"]["type"] == "multi.notify"
+        assert len(sent[f"finance_{user_id}"]["messages"]) == 2
+        assert sent[f"notifications_{user_id}"]["type"] == "multi.notify"
+        assert len(sent[f"notifications_{user_id}"]["messages"]) == 3
+
+    def test_batch_sends_single_message_unwrapped(self):
+        """Test a group with one message in a batch gets it unchanged."""
+        service = NotificationService()
+        user_id = uuid4()
+
+        with (
+            patch.object(service, "_group_send_many") as mock_send_many,
+            service.batch(),
+        ):
+            service.send_to_user(
+                user_id=user_id,
+                notification_type=NotificationType.INFO,
+                title="Test",
+                message="Test message",
+            )
+
+        [(group, message)] = mock_send_many.call_args[0][0]
+        assert group == f"notifications_{user_id}"
+        assert message["type"] == "notification.message"
+
+    def test_deduplication_skips_identical_send(self):
+        """Test an identical send within the TTL is claimed once and skipped."""
+        service = NotificationService()
+        service.enable_deduplication(ttl=5)
+        user_id = uuid4()
+
+        with (
+            patch("shared.notifications.service.cache") as mock_cache,
+            patch.object(service, "_group_send") as mock_group_send,
+        ):
+            mock_cache.add.side_effect = [True, False]
+            for _ in range(2):
+                service.send_to_user(
+                    user_id=user_id,
+                    notification_type=NotificationType.INFO,
+                    title="Test",
+                    message="Test message",
+                )
+
+        mock_group_send.assert_called_once()
+        first_key, second_key = (c.args[0] for c in mock_cache.add.call_args_list)
+        assert first_key == second_key
+        assert first_key.startswith("notif_dedup:")
+        assert mock_cache.add.call_args.args[2] == 5
+
+    def test_deduplication_sends_when_cache_fails(self):
+        """Test a cache error never suppresses a notification."""
+        service = NotificationService()
+        service.enable_deduplication()
+
+        with (
+            patch("shared.notifications.service.cache") as mock_cache,
+            patch.object(service, "_group_send") as mock_group_send,
+        ):
+            mock_cache.add.side_effect = ConnectionError("redis down")
+            service.send_to_user(
+                user_id=uuid4(),
+                notification_type=NotificationType.INFO,
+                title="Test",
+                message="Test message",
+            )
+
+        mock_group_send.assert_called_once()
+
+
+class TestBatchingRedisChannelLayer:
+    """Tests for BatchingRedisChannelLayer class."""
+
+    @pytest.mark.asyncio
+    async def test_group_send_multi_batches_redis_calls(self):
+        """Test groups are read in one pipeline and pushed in one script call."""
+        layer = BatchingRedisChannelLayer(hosts=["redis://localhost:6379"])
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(
+            return_value=[0, [b"specific.a!1", b"specific.a!2"], 0, [b"plain"]]
+        )
+        connection = MagicMock(eval=AsyncMock(return_value=0))
+        connection.pipeline.return_value = pipe
+
+        with patch.object(layer, "connection", return_value=connection):
+            await layer.group_send_multi(
+                [
+                    ("finance_1", {"type": "finance.update", "n": 1}),
+                    ("notifications_1", {"type": "notification.message", "n": 2}),
+                ]
+            )
+
+        assert [c.args[0] for c in pipe.zrange.call_args_list] == [
+            b"asgi:group:finance_1",
+            b"asgi:group:notifications_1",
+        ]
+        connection.eval.assert_awaited_once()
+        args = connection.eval.await_args.args
+        assert args[1] == 2
+        assert args[2:4] == ("asgispecific.a!", "asgiplain")
+        first, second = (layer.deserialize(message) for message in args[4:6])
+        assert first["type"] == "finance.update"
+        assert first["__asgi_channel__"] == ["specific.a!1", "specific.a!2"]
+        assert second == {
+            "type": "notification.message",
+            "n": 2,
+            "__asgi_channel__": ["plain"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_group_send_multi_keeps_send_order(self):
+        """Test a channel receives a batch, and the next one, in send order."""
+        layer = BatchingRedisChannelLayer(hosts=["redis://localhost:6379"])
+        redis = fakeredis.FakeAsyncRedis()
+
+        with patch.object(layer, "connection", return_value=redis):
+            await layer.group_add("finance_1", "plain")
+            await layer.group_send_multi(
+                [("finance_1", {"type": "finance.update", "n": n}) for n in range(20)]
+            )
+            await layer.group_send_multi(
+                [("finance_1", {"type": "finance.update", "n": 20})]
+            )
+            received = [await layer.receive("plain") for _ in range(21)]
+
+        assert [message["n"] for message in received] == list(range(21))
+
+    @pytest.mark.asyncio
+    async def test_fanout_uses_group_send_multi(self):
+        """Test the service hands fan-out to the batching layer in one call."""
+        layer = BatchingRedisChannelLayer(hosts=["redis://localhost:6379"])
+        service = NotificationService()
+        service._channel_layer = layer
+        messages = [("finance_1", {"type": "finance.update"})]
+
+        with patch.object(
+            layer, "group_send_multi", new_callable=AsyncMock
+        ) as mock_send_multi:
+            await service._fanout(messages)
+
+        mock_send_multi.assert_awaited_once_with(messages)
+
+
+class TestNotificationBatcher:
+    """Tests for NotificationBatcher class."""
+
+    def test_flush_coalesces_messages_per_group(self):
+        """Test queued messages are sent as one batch per group."""
+        sent: list[tuple[str, dict[str, Any]]] = []
+        batcher = NotificationBatcher(lambda group, message: sent.append((group, message)))
+
+        # Keep the flusher thread stopped and flush manually instead
+        with patch.object(batcher, "_ensure_started"):
+            batcher.enqueue("finance_1", {"type": "finance.update", "n": 1})
+            batcher.enqueue("finance_1", {"type": "finance.update", "n": 2})
+            batcher.enqueue("social_1", {"type": "social.update", "n": 3})
+        batcher.flush()
+
+        assert sent == [
+            (
+                "finance_1",
+                {
+                    "type": MULTI_MESSAGE_TYPE,
+                    "messages": [
+                        {"type": "finance.update", "n": 1},
+                        {"type": "finance.update", "n": 2},
+                    ],
+                },
+            ),
+            ("social_1", {"type": "social.update", "n": 3}),
+        ]
+
+    def test_flush_keeps_sending_after_a_group_fails(self):
+        """Test one failing group does not drop the rest of the batch."""
+        sent: list[str] = []
+
+        def send(group: str, _message: dict[str, Any]) -> None:
+            if group == "finance_1":
+                raise ConnectionError("redis down")
+            sent.append(group)
+
+        batcher = NotificationBatcher(send)
+        with patch.object(batcher, "_ensure_started"):
+            for group in ("finance_1", "social_1", "notifications_1"):
+                batcher.enqueue(group, {"type": "notification.message"})
+        batcher.flush()
+
+        assert sent == ["social_1", "notifications_1"]
+
+    def test_service_enqueues_when_batching_enabled(self):
+        """Test service sends go through the batcher once enabled."""
+        service = NotificationService()
+        batcher = service.enable_batching()
+
+        with patch.object(batcher, "enqueue") as mock_enqueue:
+            service.send_to_user(
+                user_id=uuid4(),
+                notification_type=NotificationType.INFO,
+                title="Test",
+                message="Test message",
+            )
+
+        mock_enqueue.assert_called_once()
+        assert mock_enqueue.call_args[0][1]["type"] == "notification.message"
+
+
+class TestNotificationDispatcher:
+    """Tests for NotificationDispatcher class."""
+
+    def test_submit_runs_send_in_background(self):
+        """Test submitted sends run on the worker thread."""
+        dispatcher = NotificationDispatcher()
+        sent = []
+
+        assert dispatcher.submit(lambda: sent.append("sent")) is True
+        dispatcher.join()
+
+        assert sent == ["sent"]
+
+    def test_send_runs_in_submitter_context(self):
+        """Test sends see the request context they were submitted from."""
+        dispatcher = NotificationDispatcher()
+        seen = []
+
+        token = correlation_id_var.set("cid-1")
+        try:
+            dispatcher.submit(lambda: seen.append(get_correlation_id()))
+        finally:
+            correlation_id_var.reset(token)
+        dispatcher.join()
+
+        assert seen == ["cid-1"]
+
+    def test_submit_drops_when_queue_full(self):
+        """Test sends are dropped and counted once the queue is full."""
+        dispatcher = NotificationDispatcher(max_queue_size=1)
+
+        # Keep the worker stopped so the queue stays full
+        with patch.object(dispatcher, "_ensure_started"):
+            assert dispatcher.submit(lambda: None) is True
+            assert dispatcher.submit(lambda: None) is False
+
+        assert dispatcher.dropped_count == 1
+
+
+class TestSubscriberPresence:
+    """Tests for SubscriberPresence and presence-aware notification checks."""
+
+    def test_user_present_until_last_connection_closes(self):
+        """Test users stay present while any connection is open."""
+        presence = SubscriberPresence()
+        presence.add_user("user-1")
+        presence.add_user("user-1")
+
+        presence.remove_user("user-1")
+        assert presence.has_user("user-1") is True
+
+        presence.remove_user("user-1")
+        assert presence.has_user("user-1") is False
+
+    def test_group_presence(self):
+        """Test expense group subscriptions are tracked."""
+        presence = SubscriberPresence()
+        presence.add_group("group-1")
+
+        assert presence.has_group("group-1") is True
+        presence.remove_group("group-1")
+        assert presence.has_group("group-1") is False
+
+    def test_service_assumes_subscribers_without_tracking(self):
+        """Test every user counts as subscribed when tracking is disabled."""
+        service = NotificationService()
+
+        assert service.has_subscribers(uuid4()) is True
+        assert service.group_has_subscribers(uuid4()) is True
+
+    def test_service_checks_presence_when_tracking(self):
+        """Test the service consults presence once tracking is enabled."""
+        user_id = uuid4()
+        group_id = uuid4()
+        presence = SubscriberPresence()
+        service = NotificationService()
+        service.enable_presence_tracking(presence)
+
+        assert service.has_subscribers(user_id) is False
+        presence.add_user(str(user_id))
+        presence.add_group(str(group_id))
+        assert service.has_subscribers(user_id) is True
+        assert service.group_has_subscribers(group_id) is True
+
+    def test_sharing_publishes_first_and_last_local_connection(self):
+        """Test Redis is only written when a process gains or loses a key."""
+        redis = MagicMock()
+        presence = SubscriberPresence()
+        presence.enable_sharing(redis)
+
+        presence.add_user("user-1")
+        presence.add_user("user-1")
+        presence.remove_user("user-1")
+        presence.remove_user("user-1")
+        presence.add_group("group-1")
+
+        assert [c.args for c in redis.hincrby.call_args_list] == [
+            ("presence:users", "user-1", 1),
+            ("presence:users", "user-1", -1),
+            ("presence:groups", "group-1", 1),
+        ]
+
+    def test_sharing_rechecks_redis_after_miss(self):
+        """Test a Redis miss is not cached, so new remote users are seen."""
+        shared = {"user-2": b"1"}
+        redis = MagicMock()
+        redis.hget.side_effect = lambda _key, member: shared.get(member)
+        presence = SubscriberPresence()
+        presence.enable_sharing(redis)
+
+        assert presence.has_user("user-2") is True
+        assert presence.has_user("user-3") is False
+
+        # user-3 connects on another process
+        shared["user-3"] = b"1"
+        assert presence.has_user("user-3") is True
+
+    @pytest.mark.asyncio
+    async def test_async_updates_write_redis_off_the_event_loop(self):
+        """Test consumers' presence updates never block the loop on Redis."""
+        loop_thread = threading.get_ident()
+        writer_threads = []
+        redis = MagicMock()
+        redis.hincrby.side_effect = lambda *_: writer_threads.append(
+            threading.get_ident()
+        )
+        redis.hget.return_value = None
+        presence = SubscriberPresence()
+        presence.enable_sharing(redis)
+
+        await presence.aadd_user("user-1")
+        await presence.aadd_group("group-1")
+        assert presence.has_user("user-1") is True
+        await presence.aremove_user("user-1")
+        await presence.aremove_group("group-1")
+
+        assert presence.has_user("user-1") is False
+        assert len(writer_threads) == 4
+        assert loop_thread not in writer_threads
+
+    def test_sharing_assumes_present_when_redis_fails(self):
+        """Test a Redis error never suppresses notifications."""
+        redis = MagicMock()
+        redis.hget.side_effect = ConnectionError("redis down")
+        presence = SubscriberPresence()
+        presence.enable_sharing(redis)
+
+        assert presence.has_user("user-1") is True
+
+    def test_configure_notifications_enables_batching_and_dedup(self):
+        """Test the settings flags route sends through dedup and the batcher."""
+        service = NotificationService()
+        service._channel_layer = MagicMock(group_send=AsyncMock())
+        user_id = uuid4()
+
+        configure_notifications({"BATCHING": True, "DEDUP_TTL": 5}, service)
+        # Keep the flusher thread stopped and flush manually instead
+        with patch.object(NotificationBatcher, "_ensure_started"):
+            for title in ("Paid", "Paid", "Refunded"):
+                service.send_to_user(
+                    user_id=user_id,
+                    notification_type=NotificationType.INFO,
+                    title=title,
+                    message="Rent",
+                )
+            service._batcher.flush()
+
+        service._channel_layer.group_send.assert_awaited_once()
+        group_name, message = service._channel_layer.group_send.await_args.args
+        assert group_name == f"notifications_{user_id}"
+        assert message["type"] == MULTI_MESSAGE_TYPE
+        assert [m["title"] for m in message["messages"]] == ["Paid", "Refunded"]
+
+    @pytest.mark.asyncio
+    async def test_demo_consumer_registers_presence(self):
+        """Test the notification bell's connection counts as presence."""
+        presence = SubscriberPresence()
+        user = MagicMock(is_authenticated=True, id=uuid4(), tenant_id=uuid4())
+        communicator = WebsocketCommunicator(
+            NotificationConsumer.as_asgi(), "/ws/notifications/"
+        )
+        communicator.scope["user"] = user
+
+        with patch("modules.demo.interfaces.consumers.subscriber_presence", presence):
+            connected, _ = await communicator.connect()
+            assert connected
+            assert presence.has_user(str(user.id)) is True
+
+            await communicator.disconnect()
+            assert presence.has_user(str(user.id)) is False
+
+    def test_configure_notifications_enables_presence_options(self):
+        """Test the settings flags turn on presence tracking and sharing."""
+        with (
+            patch.object(notification_service, "enable_presence_tracking") as track,
+            patch(
+                "shared.notifications.service.subscriber_presence.enable_sharing"
+            ) as share,
+        ):
+            configure_notifications({})
+            track.assert_not_called()
+            share.assert_not_called()
+
+            configure_notifications(
+                {"PRESENCE_TRACKING": True, "SHARE_PRESENCE": True}
+            )
+
+        track.assert_called_once_with()
+        share.assert_called_once_with()
+
+
+class TestEventHandlers:
+    """Tests for event handler dispatch tables."""
+
+    def test_finance_handler_dispatches_send(self):
+        """Test a finance handler looked up by event name submits its send."""
+        user_id = uuid4()
+        account_id = uuid4()
+
+        with (
+            patch("shared.events.handlers.notification_dispatcher") as dispatcher,
+            patch("shared.events.handlers._send_finance") as send_finance,
+        ):
+            FINANCE_HANDLERS["account_created"](
+                user_id=user_id,
+                account_id=account_id,
+                name="Checking",
+                account_type="CHECKING",
+                currency_code="USD",
+            )
+            send = dispatcher.submit.call_args[0][0]
+            send()
+
+        kwargs = send_finance.call_args.kwargs
+        assert kwargs["user_id"] == user_id
+        assert kwargs["notification_type"] == NotificationType.ACCOUNT_CREATED
+        assert kwargs["message"] == "New checking account 'Checking' has been created."
+        assert kwargs["data"]["account_id"] == account_id
+
+    def test_domain_handlers_cascade_to_user_notifications(self):
+        """Test handler sends also reach the general notification channel."""
+        user_id, account_id = uuid4(), uuid4()
+
+        with (
+            patch("shared.events.handlers.notification_dispatcher") as dispatcher,
+            patch("shared.events.handlers._has_subscribers", return_value=True),
+            patch.object(notification_service, "_group_send_many") as send_many,
+        ):
+            FINANCE_HANDLERS["account_closed"](
+                user_id=user_id,
+                account_id=account_id,
+                name="Savings",
+                final_balance="0.00",
+            )
+            dispatcher.submit.call_args[0][0]()
+
+        groups = [group for group, _ in send_many.call_args[0][0]]
+        assert groups == [
+            f"account_{account_id}",
+            f"finance_{user_id}",
+            f"notifications_{user_id}",
+        ]
+
+    def test_batch_carries_handler_sends_across_dispatcher(self):
+        """Test handler sends in a batch reach the worker thread as one batch."""
+        user_id, account_id = uuid4(), uuid4()
+        dispatcher = NotificationDispatcher()
+
+        with (
+            patch("shared.notifications.service.notification_dispatcher", dispatcher),
+            patch("shared.events.handlers.notification_dispatcher") as direct,
+            patch("shared.events.handlers._has_subscribers", return_value=True),
+            patch.object(notification_service, "_group_send_many") as send_many,
+        ):
+            with notification_service.batch():
+                for name in ("Savings", "Checking"):
+                    FINANCE_HANDLERS["account_updated"](
+                        user_id=user_id,
+                        account_id=account_id,
+                        name=name,
+                        updated_fields=["name"],
+                    )
+            dispatcher.join()
+
+        direct.submit.assert_not_called()
+        send_many.assert_called_once()
+        batched = dict(send_many.call_args[0][0])
+        assert list(batched) == [
+            f"account_{account_id}",
+            f"finance_{user_id}",
+            f"notifications_{user_id}",
+        ]
+        assert all(
+            message["type"] == MULTI_MESSAGE_TYPE and len(message["messages"]) == 2
+            for message in batched.values()
+        )
+
+    def test_social_handler_dispatches_send(self):
+        """Test a social handler looked up by event name submits its send."""
+        with (
+            patch("shared.events.handlers.notification_dispatcher") as dispatcher,
+            patch("shared.events.handlers._send_social") as send_social,
+        ):
+            SOCIAL_HANDLERS["balance_updated"](
+                user_id=uuid4(),
+                contact_id=uuid4(),
+                contact_name="Alice",
+                net_balance="25.00",
+                currency_code="EUR",
+                balance_direction="they_owe_you",
+            )
+            dispatcher.submit.call_args[0][0]()
+
+        kwargs = send_social.call_args.kwargs
+        assert kwargs["message"] == "Alice owes you 25.00 EUR"
+
+    def test_handler_skips_users_without_subscribers(self):
+        """Test nothing is dispatched when the user has no connection."""
+        with (
+            patch("shared.events.handlers.notification_dispatcher") as dispatcher,
+            patch("shared.events.handlers._has_subscribers", return_value=False),
+        ):
+            FINANCE_HANDLERS["account_closed"](
+                user_id=uuid4(),
+                account_id=uuid4(),
+                name="Savings",
+                final_balance="0.00",
+            )
+
+        dispatcher.submit.assert_not_called()
+
+    def test_group_handler_filters_members(self):
+        """Test group updates only fan out to connected members."""
+        connected = uuid4()
+        offline = uuid4()
+
+        with (
+            patch("shared.events.handlers.notification_dispatcher") as dispatcher,
+            patch(
+                "shared.events.handlers._has_subscribers",
+                side_effect=lambda user_id: user_id == connected,
+            ),
+            patch("shared.events.handlers._send_group") as send_group,
+        ):
+            SOCIAL_HANDLERS["expense_group_member_added"](
+                user_id=uuid4(),
+                group_id=uuid4(),
+                group_name="Trip",
+                contact_id=uuid4(),
+                contact_name="Bob",
+                member_user_ids=[connected, offline],
+            )
+            dispatcher.submit.call_args[0][0]()
+
+        kwargs = send_group.call_args.kwargs
+        assert kwargs["member_user_ids"] == [connected]
+
+    def test_group_handler_skips_unwatched_group(self):
+        """Test nothing is dispatched when no member or group is connected."""
+        with (
+            patch("shared.events.handlers.notification_dispatcher") as dispatcher,
+            patch("shared.events.handlers._has_subscribers", return_value=False),
+            patch(
+                "shared.events.handlers._group_has_subscribers", return_value=False
+            ),
+        ):
+            SOCIAL_HANDLERS["expense_group_member_added"](
+                user_id=uuid4(),
+                group_id=uuid4(),
+                group_name="Trip",
+                contact_id=uuid4(),
+                contact_name="Bob",
+                member_user_ids=[uuid4()],
+            )
+
+        dispatcher.submit.assert_not_called()
+
+    def test_group_handler_rejects_unknown_fields(self):
+        """Test misspelled event fields raise instead of being ignored."""
+        with pytest.raises(TypeError, match="group_nam"):
+            SOCIAL_HANDLERS["expense_group_member_added"](
+                user_id=uuid4(),
+                group_id=uuid4(),
+                group_nam="Trip",
+                contact_id=uuid4(),
+                contact_name="Bob",
+                member_user_ids=[uuid4()],
+            )
+
+    def test_handler_interns_enum_like_values(self):
+        """Test currency codes are interned before building the payload."""
+        currency_code = "".join(["U", "S", "D"])
+
+        with (
+            patch("shared.events.handlers.notification_dispatcher") as dispatcher,
+            patch("shared.events.handlers._send_finance") as send_finance,
+        ):
+            FINANCE_HANDLERS["transfer_completed"](
+                user_id=uuid4(),
+                transfer_id=uuid4(),
+                from_account_id=uuid4(),
+                to_account_id=uuid4(),
+                amount="10.00",
+                currency_code=currency_code,
+            )
+            dispatcher.submit.call_args[0][0]()
+
+        data = send_finance.call_args.kwargs["data"]
+        assert data["currency_code"] is sys.intern("USD")
+
+    def test_every_handler_has_a_signal(self):
+        """Test each handler table entry has a matching event signal."""
+        assert set(FINANCE_HANDLERS) | set(SOCIAL_HANDLERS) == set(EVENT_SIGNALS)
+
+    def test_emit_event_reaches_handler(self):
+        """Test emitting an event runs its registered handler once."""
+        register_event_handlers()
+        register_event_handlers()
+        user_id = uuid4()
+
+        with (
+            patch("shared.events.handlers.notification_dispatcher") as dispatcher,
+            patch("shared.events.handlers._send_finance") as send_finance,
+        ):
+            emit_event(
+                "net_worth_updated",
+                sender=self,
+                user_id=user_id,
+                total_assets="100.00",
+                total_liabilities="40.00",
+                net_worth="60.00",
+                currency_code="USD",
+            )
+            dispatcher.submit.assert_called_once()
+            dispatcher.submit.call_args[0][0]()
+
+        assert send_finance.call_args.kwargs["user_id"] == user_id
 
 
 @pytest.fixture
@@ -393,6 +1246,172 @@ class TestAuthenticatedConsumerBase:
             call_args = mock_send.call_args[0][0]
             assert call_args["type"] == "pong"
 
+    @pytest.mark.asyncio
+    async def test_encode_json_is_compact(self):
+        """Test frames are encoded without padding or ASCII escapes."""
+        frame = {"type": "notification", "title": "Café", "data": {"n": 1}}
+
+        encoded = await AuthenticatedConsumer.encode_json(frame)
+
+        assert encoded == '{"type":"notification","title":"Café","data":{"n":1}}'
+        assert json.loads(encoded) == frame
+
+    @pytest.mark.asyncio
+    async def test_can_subscribe_matches_exact_user_channels(self):
+        """Test default subscription check does not match user ID substrings."""
+        consumer = AuthenticatedConsumer()
+        consumer.user_id = "42"
+
+        assert await consumer.can_subscribe("notifications_42") is True
+        assert await consumer.can_subscribe("finance_42") is True
+        assert await consumer.can_subscribe("expense_group_42") is False
+        assert await consumer.can_subscribe("notifications_421") is False
+
+
+    @pytest.mark.asyncio
+    async def test_multi_notify_sends_single_frame(self):
+        """Test coalesced channel layer messages reach the client as one frame."""
+        consumer = FinanceConsumer()
+        consumer.subscribed_accounts = set()
+
+        with patch.object(
+            AsyncJsonWebsocketConsumer, "send_json", new_callable=AsyncMock
+        ) as mock_send:
+            await consumer.multi_notify({
+                "type": "multi.notify",
+                "messages": [
+                    {"type": "finance.update", "title": "A"},
+                    {"type": "notification.message", "title": "B"},
+                ],
+            })
+
+            mock_send.assert_called_once()
+            frame = mock_send.call_args[0][0]
+            assert frame["type"] == "multi"
+            assert [f["type"] for f in frame["payload"]] == [
+                "finance_update",
+                "notification",
+            ]
+
+
+class TestNotificationDedup:
+    """Tests for per-connection notification deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_notification_is_dropped(self):
+        """Test a notification reaching several groups is delivered once per type."""
+        consumer = AuthenticatedConsumer()
+        event = {"notification_id": "n-1", "title": "A"}
+
+        with (
+            patch("channels.consumer.aclose_old_connections", new=AsyncMock()),
+            patch.object(
+                AsyncJsonWebsocketConsumer, "send_json", new_callable=AsyncMock
+            ) as mock_send,
+        ):
+            await consumer.dispatch({"type": "notification.message", **event})
+            await consumer.dispatch({"type": "status.update", **event})
+            await consumer.multi_notify({
+                "type": "multi.notify",
+                "messages": [
+                    {"type": "notification.message", **event},
+                    {"type": "notification.message", "notification_id": "n-2"},
+                ],
+            })
+
+        frames = [c.args[0] for c in mock_send.call_args_list]
+        # Distinct frame types sharing an ID are all delivered
+        assert [f["type"] for f in frames] == ["notification", "status", "multi"]
+        assert [f["notification_id"] for f in frames[2]["payload"]] == ["n-2"]
+
+    def test_seen_ids_are_bounded(self):
+        """Test only the most recent notifications are remembered."""
+        consumer = AuthenticatedConsumer()
+        consumer.max_seen_notifications = 2
+
+        def message(notification_id):
+            return {"type": "finance.update", "notification_id": notification_id}
+
+        for notification_id in ("a", "b", "c"):
+            assert not consumer._is_repeat_notification(message(notification_id))
+
+        assert consumer._is_repeat_notification(message("c"))
+        assert not consumer._is_repeat_notification(message("a"))
+
+
+class _LaneConsumer(ConcurrentDispatchMixin, AsyncConsumer):
+    """Consumer recording handled messages, with a client handler to hold."""
+
+    def __init__(self):
+        super().__init__()
+        self.handled: list[str] = []
+        self.release_client = asyncio.Event()
+
+    async def websocket_receive(self, message):
+        await self.release_client.wait()
+        self.handled.append(message["text"])
+
+    async def finance_update(self, message):
+        self.handled.append(message["title"])
+
+    async def websocket_disconnect(self, message):
+        self.handled.append("disconnect")
+
+
+class TestConcurrentDispatch:
+    """Tests for ConcurrentDispatchMixin."""
+
+    @pytest.fixture(autouse=True)
+    def no_db_cleanup(self):
+        """Skip closing old database connections on each dispatch."""
+        with patch("channels.consumer.aclose_old_connections", new=AsyncMock()):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_slow_client_message_does_not_block_layer(self):
+        """Test channel layer messages are handled while a client one waits."""
+        consumer = _LaneConsumer()
+
+        await consumer.dispatch({"type": "websocket.receive", "text": "first"})
+        await consumer.dispatch({"type": "websocket.receive", "text": "second"})
+        await consumer.dispatch({"type": "finance.update", "title": "update"})
+        await asyncio.sleep(0)
+
+        assert consumer.handled == ["update"]
+
+        consumer.release_client.set()
+        await asyncio.gather(*consumer._dispatch_tasks)
+
+        # Client messages keep their order within their lane
+        assert consumer.handled == ["update", "first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_messages_in_flight(self):
+        """Test pending handlers are cancelled before disconnect is handled."""
+        consumer = _LaneConsumer()
+
+        await consumer.dispatch({"type": "websocket.receive", "text": "pending"})
+        await asyncio.sleep(0)
+        tasks = set(consumer._dispatch_tasks)
+
+        await consumer.dispatch({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert consumer.handled == ["disconnect"]
+        assert all(task.cancelled() for task in tasks)
+        assert consumer._dispatch_slots._value == consumer.max_concurrent_dispatch
+
+    @pytest.mark.asyncio
+    async def test_handler_failure_is_logged(self):
+        """Test a failing handler is logged instead of stopping the consumer."""
+        consumer = _LaneConsumer()
+
+        with patch("shared.consumers.base.logger") as mock_logger:
+            await consumer.dispatch({"type": "unknown.event"})
+            await asyncio.gather(*consumer._dispatch_tasks)
+
+        mock_logger.error.assert_called_once()
+
 
 class TestFinanceConsumerHandlers:
     """Tests for FinanceConsumer message handlers."""
@@ -464,6 +1483,72 @@ class TestFinanceConsumerHandlers:
 class TestSocialConsumerHandlers:
     """Tests for SocialConsumer message handlers."""
 
+    @pytest.mark.asyncio
+    async def test_subscribe_group_rejects_non_member(self):
+        """Test subscribe_group checks membership before joining the group."""
+        consumer = SocialConsumer()
+        consumer.user_id = str(uuid4())
+        consumer.channel_name = "test-channel"
+        consumer.channel_layer = AsyncMock()
+        consumer.subscribed_groups = set()
+        consumer._subscribed_groups_snapshot = ()
+        member_group = uuid4()
+
+        with (
+            patch.object(consumer, "send_json", new_callable=AsyncMock) as mock_send,
+            patch.object(
+                consumer,
+                "_is_group_member",
+                new_callable=AsyncMock,
+                side_effect=lambda group_id: group_id == member_group,
+            ),
+        ):
+            await consumer.handle_message(
+                {"type": "subscribe_group", "group_id": str(uuid4())}
+            )
+            await consumer.handle_message(
+                {"type": "subscribe_group", "group_id": str(member_group)}
+            )
+
+        consumer.channel_layer.group_add.assert_awaited_once_with(
+            f"expense_group_{member_group}", "test-channel"
+        )
+        assert [c.args[0]["type"] for c in mock_send.await_args_list] == [
+            "error",
+            "subscribed",
+        ]
+        assert consumer.subscribed_groups == {str(member_group)}
+
+    @pytest.mark.asyncio
+    async def test_subscribe_group_normalizes_group_id(self):
+        """Test uppercase or undashed UUIDs subscribe under the canonical ID."""
+        consumer = SocialConsumer()
+        consumer.user_id = str(uuid4())
+        consumer.channel_name = "test-channel"
+        consumer.channel_layer = AsyncMock()
+        consumer.subscribed_groups = set()
+        consumer._subscribed_groups_snapshot = ()
+        group_id = uuid4()
+
+        with (
+            patch.object(consumer, "send_json", new_callable=AsyncMock) as mock_send,
+            patch.object(
+                consumer, "_is_group_member", new_callable=AsyncMock, return_value=True
+            ) as mock_member,
+        ):
+            for raw in (str(group_id).upper(), group_id.hex, "not-a-uuid"):
+                await consumer.handle_message(
+                    {"type": "subscribe_group", "group_id": raw}
+                )
+
+        assert [c.args[0]["type"] for c in mock_send.await_args_list] == [
+            "subscribed",
+            "subscribed",
+            "error",
+        ]
+        assert consumer.subscribed_groups == {str(group_id)}
+        mock_member.assert_awaited_with(group_id)
+
     @pytest.mark.asyncio
     async def test_social_update_handler(self):
         """Test social update event handler."""
@@ -576,3 +1661,73 @@ class TestSocialConsumerHandlers:
             call_args = mock_send.call_args[0][0]
             assert call_args["type"] == "expense_group_update"
             assert call_args["group_id"] == group_id
+
+    @pytest.mark.asyncio
+    async def test_handle_message_dispatches_subscribe_group(self):
+        """Test client messages are dispatched to the matching handler."""
+        consumer = SocialConsumer()
+        consumer.subscribed_groups = set()
+        consumer.channel_layer = AsyncMock()
+        consumer.channel_name = "test-channel"
+
+        with (
+            patch.object(consumer, "send_json", new_callable=AsyncMock) as mock_send,
+            patch.object(
+                consumer, "_is_group_member", new_callable=AsyncMock, return_value=True
+            ),
+        ):
+            group_id = str(uuid4())
+
+            await consumer.handle_message({"type": "subscribe_group", "group_id": group_id})
+
+            consumer.channel_layer.group_add.assert_called_once()
+            assert group_id in consumer.subscribed_groups
+            assert mock_send.call_args[0][0]["type"] == "subscribed"
+
+    @pytest.mark.asyncio
+    async def test_group_presence_released_on_disconnect(self):
+        """Test expense group presence follows subscribe and disconnect."""
+        consumer = SocialConsumer()
+        consumer.subscribed_groups = set()
+        consumer._subscribed_groups_snapshot = ()
+        consumer.channel_layer = AsyncMock()
+        consumer.channel_name = "test-channel"
+        group_id = str(uuid4())
+        presence = SubscriberPresence()
+
+        with (
+            patch("shared.consumers.social.subscriber_presence", presence),
+            patch.object(consumer, "send_json", new_callable=AsyncMock),
+            patch.object(
+                consumer, "_is_group_member", new_callable=AsyncMock, return_value=True
+            ),
+        ):
+            await consumer.handle_message({"type": "subscribe_group", "group_id": group_id})
+            await consumer.handle_message({"type": "subscribe_group", "group_id": group_id})
+            assert presence.has_group(group_id) is True
+            await consumer.disconnect(1000)
+
+        # Subscribing twice holds the group once
+        assert presence.has_group(group_id) is False
+        assert consumer.subscribed_groups == set()
+
+    @pytest.mark.asyncio
+    async def test_can_subscribe_rechecks_group_membership(self):
+        """Test expense group access follows membership changes immediately."""
+        consumer = SocialConsumer()
+        consumer.user_id = str(uuid4())
+        group_id = uuid4()
+        channel = f"expense_group_{group_id}"
+
+        with patch.object(
+            consumer,
+            "_is_group_member",
+            new_callable=AsyncMock,
+            side_effect=[True, False],
+        ) as mock_member:
+            assert await consumer.can_subscribe(channel) is True
+            # Removed from the group while still connected
+            assert await consumer.can_subscribe(channel) is False
+            assert await consumer.can_subscribe("expense_group_not-a-uuid") is False
+
+        assert mock_member.await_count == 2
@@ -0,0 +1,186 @@
+"""Unit tests for the standardized DRF exception handler."""
+
+from __future__ import annotations
+
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.http import Http404
+from rest_framework.exceptions import NotAuthenticated
+
+import pytest
+
+from shared.exceptions import (
+    APIValidationError,
+    ApplicationError,
+    AuthorizationError,
+    ConflictError,
+    DomainError,
+    DomainValidationError,
+    EntityNotFoundError,
+    ExternalServiceError,
+    custom_exception_handler,
+    format_error_response,
+)
+from shared.middleware import correlation_id_var
+
+
+class CustomDomainError(DomainError):
+    """Domain error subclass without its own handler."""
+
+
+class TestExceptionAttributes:
+    """Tests for exception class attributes."""
+
+    def test_entity_not_found_attributes(self):
+        """Test slotted attributes are set on initialization."""
+        exc = EntityNotFoundError("Account", "42")
+
+        assert exc.entity_type == "Account"
+        assert exc.entity_id == "42"
+        assert exc.code == "NOT_FOUND"
+        assert exc.message == "Account with id '42' not found"
+
+    def test_subclass_can_override_code(self):
+        """Test subclasses can still reassign slotted attributes."""
+        exc = CustomDomainError("Custom")
+        exc.code = "OVERRIDDEN"
+
+        assert exc.code == "OVERRIDDEN"
+
+    def test_external_service_attributes(self):
+        """Test external service error keeps the original error."""
+        original = RuntimeError("timeout")
+        exc = ExternalServiceError("bank", "down", original_error=original)
+
+        assert exc.service == "bank"
+        assert exc.original_error is original
+        assert exc.message == "bank: down"
+
+
+class TestFormatErrorResponse:
+    """Tests for format_error_response."""
+
+    def test_minimal_response(self):
+        """Test response without details or correlation ID."""
+        assert format_error_response("NOT_FOUND", "Missing") == {
+            "error": {"code": "NOT_FOUND", "message": "Missing"},
+        }
+
+    def test_full_response(self):
+        """Test response with details and correlation ID."""
+        details = [{"field": "name", "message": "Required"}]
+
+        result = format_error_response("VALIDATION_ERROR", "Bad", details, "cid-1")
+
+        assert result == {
+            "error": {
+                "code": "VALIDATION_ERROR",
+                "message": "Bad",
+                "details": details,
+                "correlation_id": "cid-1",
+            },
+        }
+
+    def test_repeated_code_does_not_share_state(self):
+        """Test responses for the same code are independent dicts."""
+        first = format_error_response("FORBIDDEN", "First", correlation_id="cid-1")
+        second = format_error_response("FORBIDDEN", "Second")
+
+        assert first["error"]["message"] == "First"
+        assert second == {"error": {"code": "FORBIDDEN", "message": "Second"}}
+
+    def test_unknown_code(self):
+        """Test codes without a template are formatted the same way."""
+        assert format_error_response("TENANT_ACCESS_DENIED", "Denied") == {
+            "error": {"code": "TENANT_ACCESS_DENIED", "message": "Denied"},
+        }
+
+
+class TestCustomExceptionHandler:
+    """Tests for custom_exception_handler."""
+
+    @pytest.mark.parametrize(
+        ("exc", "status_code", "code"),
+        [
+            (EntityNotFoundError("Account", "1"), 404, "NOT_FOUND"),
+            (DomainValidationError("Invalid"), 400, "VALIDATION_ERROR"),
+            (ConflictError("Conflict"), 409, "CONFLICT"),
+            (AuthorizationError(), 403, "FORBIDDEN"),
+            (DomainError("Broken"), 400, "DOMAIN_ERROR"),
+            (CustomDomainError("Custom", code="CUSTOM"), 400, "CUSTOM"),
+            (ExternalServiceError("bank", "down"), 503, "EXTERNAL_SERVICE_ERROR"),
+            (ApplicationError("Failed"), 500, "APPLICATION_ERROR"),
+            (Http404(), 404, "NOT_FOUND"),
+            (PermissionDenied(), 403, "FORBIDDEN"),
+            (ValidationError({"name": ["Required"]}), 400, "VALIDATION_ERROR"),
+            (APIValidationError(), 400, "VALIDATION_ERROR"),
+            (NotAuthenticated(), 401, "NOT_AUTHENTICATED"),
+        ],
+    )
+    def test_status_and_code(self, exc, status_code, code):
+        """Test each exception type maps to its status and error code."""
+        response = custom_exception_handler(exc, {})
+
+        assert response is not None
+        assert response.status_code == status_code
+        assert response.data["error"]["code"] == code
+
+    def test_domain_validation_details(self):
+        """Test domain validation details are included."""
+        details = [{"field": "amount", "message": "Must be positive"}]
+
+        response = custom_exception_handler(
+            DomainValidationError("Invalid", details=details), {}
+        )
+
+        assert response.data["error"]["details"] == details
+
+    def test_django_validation_details(self):
+        """Test Django validation errors are flattened per message."""
+        exc = ValidationError({"name": ["Required", "Too short"], "email": ["Bad"]})
+
+        response = custom_exception_handler(exc, {})
+
+        assert response.data["error"]["details"] == [
+            {"field": "name", "message": "Required"},
+            {"field": "name", "message": "Too short"},
+            {"field": "email", "message": "Bad"},
+        ]
+
+    def test_default_messages(self):
+        """Test Django exceptions without a message get a default one."""
+        assert (
+            custom_exception_handler(Http404(), {}).data["error"]["message"]
+            == "Resource not found"
+        )
+        assert (
+            custom_exception_handler(PermissionDenied(), {}).data["error"]["message"]
+            == "Permission denied"
+        )
+
+    def test_includes_correlation_id(self):
+        """Test the current request's correlation ID is included."""
+        token = correlation_id_var.set("cid-123")
+        try:
+            response = custom_exception_handler(ConflictError("Conflict"), {})
+        finally:
+            correlation_id_var.reset(token)
+
+        assert response.data["error"]["correlation_id"] == "cid-123"
+
+    def test_cached_body_does_not_leak_correlation_id(self):
+        """Test repeated Http404 responses do not share mutable state."""
+        token = correlation_id_var.set("cid-1")
+        try:
+            first = custom_exception_handler(Http404(), {})
+        finally:
+            correlation_id_var.reset(token)
+        second = custom_exception_handler(Http404(), {})
+
+        assert first.data["error"]["correlation_id"] == "cid-1"
+        assert second.data == {
+            "error": {"code": "NOT_FOUND", "message": "Resource not found"},
+        }
+
+    def test_unhandled_exception_returns_none(self):
+        """Test non-API exceptions fall through to Django."""
+        assert custom_exception_handler(RuntimeError("boom"), {}) is None
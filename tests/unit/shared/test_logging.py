@@ -0,0 +1,169 @@
+"""Unit tests for structured logging utilities."""
+
+from __future__ import annotations
+
+import json
+import logging
+from uuid import uuid4
+
+import pytest
+import structlog
+
+import shared.logging
+from shared.logging import StructlogFormatter, configure_structlog
+from shared.middleware import correlation_id_var, tenant_id_var
+
+
+def make_record(msg: str = "hello", **extra: object) -> logging.LogRecord:
+    """Build a log record with extra attributes."""
+    record = logging.LogRecord(
+        name="tests.logger",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg=msg,
+        args=None,
+        exc_info=None,
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+class TestStructlogFormatter:
+    """Tests for StructlogFormatter."""
+
+    def test_formats_record_as_json(self):
+        """Test records are rendered as a JSON event."""
+        output = json.loads(StructlogFormatter().format(make_record()))
+
+        assert output["event"] == "hello"
+        assert output["_logger"] == "tests.logger"
+        assert output["_level"] == "info"
+        assert "timestamp" in output
+
+    def test_includes_extras_only(self):
+        """Test extra attributes are included and LogRecord internals are not."""
+        output = json.loads(
+            StructlogFormatter().format(make_record(account_id="acc-1"))
+        )
+
+        assert output["account_id"] == "acc-1"
+        for reserved in ("msg", "args", "lineno", "pathname", "threadName"):
+            assert reserved not in output
+
+    def test_instances_share_processor_chain(self):
+        """Test formatters reuse one processor chain instead of building their own."""
+        assert StructlogFormatter()._processors is StructlogFormatter()._processors
+
+    def test_non_json_extras_are_stringified(self):
+        """Test extras that JSON cannot encode are rendered as strings."""
+        account_id = uuid4()
+
+        output = json.loads(
+            StructlogFormatter().format(make_record(account_id=account_id))
+        )
+
+        assert output["account_id"] == str(account_id)
+
+    def test_structlog_records_are_only_rendered(self):
+        """Test event dicts from structlog loggers skip the processor chain."""
+        event = {"event": "user_created", "timestamp": "t", "account_id": uuid4()}
+        record = make_record(_logger=object(), _name="info")
+        record.msg = event
+
+        output = json.loads(StructlogFormatter().format(record))
+
+        assert output == {**event, "account_id": str(event["account_id"])}
+        assert record.msg is event
+
+    def test_injects_correlation_id(self):
+        """Test the bound request correlation ID is added by default."""
+        with structlog.contextvars.bound_contextvars(correlation_id="cid-1"):
+            output = json.loads(StructlogFormatter().format(make_record()))
+
+        assert output["correlation_id"] == "cid-1"
+
+    def test_injects_ids_set_on_context_variables(self):
+        """Test IDs set directly on the context variables are added too."""
+        tenant_id = uuid4()
+        correlation_token = correlation_id_var.set("cid-1")
+        tenant_token = tenant_id_var.set(tenant_id)
+        try:
+            output = json.loads(StructlogFormatter().format(make_record()))
+        finally:
+            correlation_id_var.reset(correlation_token)
+            tenant_id_var.reset(tenant_token)
+
+        assert output["correlation_id"] == "cid-1"
+        assert output["tenant_id"] == str(tenant_id)
+
+    def test_record_correlation_id_wins(self):
+        """Test an ID already on the record is kept."""
+        with structlog.contextvars.bound_contextvars(correlation_id="cid-1"):
+            output = json.loads(
+                StructlogFormatter().format(make_record(correlation_id="cid-2"))
+            )
+
+        assert output["correlation_id"] == "cid-2"
+
+    def test_context_injection_can_be_disabled(self):
+        """Test context IDs are not added when inject_context is False."""
+        with structlog.contextvars.bound_contextvars(correlation_id="cid-1"):
+            output = json.loads(
+                StructlogFormatter(inject_context=False).format(make_record())
+            )
+
+        assert "correlation_id" not in output
+
+
+class TestConfigureStructlog:
+    """Tests for configure_structlog."""
+
+    @pytest.fixture(autouse=True)
+    def restore_logging(self, monkeypatch):
+        """Restore root logging and structlog configuration after each test."""
+        root_logger = logging.getLogger()
+        handlers = list(root_logger.handlers)
+        level = root_logger.level
+        previous = structlog.get_config()
+        monkeypatch.setattr(shared.logging, "_handler", None)
+        monkeypatch.setattr(shared.logging, "_configured_json_format", None)
+        yield
+        root_logger.handlers[:] = handlers
+        root_logger.setLevel(level)
+        structlog.configure(**previous)
+
+    def test_repeated_calls_install_one_handler(self):
+        """Test calling twice does not attach a second root handler."""
+        root_logger = logging.getLogger()
+        before = len(root_logger.handlers)
+
+        configure_structlog(json_format=True)
+        configure_structlog(json_format=True)
+
+        assert len(root_logger.handlers) == before + 1
+
+    def test_switching_format_reuses_handler(self):
+        """Test changing format swaps the formatter on the same handler."""
+        configure_structlog(json_format=True)
+        handler = shared.logging._handler
+        json_formatter = handler.formatter
+
+        configure_structlog(json_format=False)
+
+        assert shared.logging._handler is handler
+        assert handler.formatter is not json_formatter
+        assert logging.getLogger().handlers.count(handler) == 1
+
+    def test_adds_ids_set_on_context_variables(self, capsys):
+        """Test configured loggers log IDs set without the middleware."""
+        configure_structlog(json_format=True)
+        token = correlation_id_var.set("cid-1")
+        try:
+            structlog.get_logger("tests.logger").info("task_started")
+        finally:
+            correlation_id_var.reset(token)
+
+        output = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert output["event"] == "task_started"
+        assert output["correlation_id"] == "cid-1"
@@ -0,0 +1,522 @@
+"""Unit tests for shared request middleware."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock, patch
+from uuid import UUID, uuid4
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+import pytest
+import structlog
+from structlog.testing import LogCapture
+
+from shared.audit import AuditAction
+from shared.middleware import (
+    AuditLoggingMiddleware,
+    CorrelationIdMiddleware,
+    RequestContextMiddleware,
+    RequestLoggingMiddleware,
+    TenantContextMiddleware,
+    UsageTrackingMiddleware,
+    _coerce_uuid,
+    _IdPool,
+    get_correlation_id,
+    get_subscription_context,
+    get_tenant_id,
+)
+
+
+@pytest.fixture
+def rf():
+    """Provide a Django request factory."""
+    return RequestFactory()
+
+
+@pytest.fixture
+def logs():
+    """Capture structlog events with context variables merged in."""
+    capture = LogCapture()
+    previous = structlog.get_config()
+    structlog.configure(processors=[structlog.contextvars.merge_contextvars, capture])
+    try:
+        yield capture.entries
+    finally:
+        structlog.configure(**previous)
+
+
+class TestIdPool:
+    """Tests for the correlation ID pool."""
+
+    def test_ids_are_valid_uuid4(self):
+        """Test pooled IDs parse as version 4 UUIDs in canonical form."""
+        pool = _IdPool(size=4)
+
+        for _ in range(10):
+            value = pool.next()
+            parsed = UUID(value)
+            assert parsed.version == 4
+            assert str(parsed) == value
+
+    def test_ids_are_unique_across_refills(self):
+        """Test IDs do not repeat within or across refills."""
+        pool = _IdPool(size=8)
+
+        ids = [pool.next() for _ in range(50)]
+
+        assert len(set(ids)) == 50
+
+
+class TestCorrelationIdMiddleware:
+    """Tests for CorrelationIdMiddleware."""
+
+    def test_uses_header_value(self, rf):
+        """Test an incoming correlation ID is propagated."""
+        seen = []
+
+        def get_response(request):
+            seen.append(get_correlation_id())
+            return HttpResponse()
+
+        middleware = CorrelationIdMiddleware(get_response)
+        response = middleware(rf.get("/", HTTP_X_CORRELATION_ID="abc-123"))
+
+        assert seen == ["abc-123"]
+        assert response["X-Correlation-ID"] == "abc-123"
+        assert get_correlation_id() is None
+
+    def test_binds_correlation_id_for_logging(self, rf, logs):
+        """Test the correlation ID is bound for events logged by the view."""
+
+        def get_response(request):
+            structlog.get_logger().info("view_event")
+            return HttpResponse()
+
+        CorrelationIdMiddleware(get_response)(
+            rf.get("/", HTTP_X_CORRELATION_ID="abc-123")
+        )
+
+        assert logs[0]["correlation_id"] == "abc-123"
+        assert "correlation_id" not in structlog.contextvars.get_contextvars()
+
+    def test_reads_overridden_header_name(self, rf):
+        """Test subclasses can read the ID from a different header."""
+
+        class RequestIdMiddleware(CorrelationIdMiddleware):
+            HEADER_NAME = "X-Request-ID"
+
+        middleware = RequestIdMiddleware(lambda *_: HttpResponse())
+        response = middleware(rf.get("/", HTTP_X_REQUEST_ID="req-1"))
+
+        assert response["X-Request-ID"] == "req-1"
+
+    def test_does_not_generate_id_when_header_present(self, rf):
+        """Test no ID is generated for requests that carry one."""
+        middleware = CorrelationIdMiddleware(lambda *_: HttpResponse())
+
+        with patch("shared.middleware._next_correlation_id") as next_id:
+            middleware(rf.get("/", HTTP_X_CORRELATION_ID="abc-123"))
+
+        next_id.assert_not_called()
+
+    def test_generates_id_when_missing(self, rf):
+        """Test a new UUID is generated when the header is missing."""
+        middleware = CorrelationIdMiddleware(lambda *_: HttpResponse())
+
+        response = middleware(rf.get("/"))
+
+        assert UUID(response["X-Correlation-ID"]).version == 4
+
+
+class TestCoerceUuid:
+    """Tests for _coerce_uuid."""
+
+    def test_uuid_returned_as_is(self):
+        """Test UUID instances are not re-parsed."""
+        value = uuid4()
+
+        assert _coerce_uuid(value) is value
+
+    @pytest.mark.parametrize("form", [str, lambda value: value.hex])
+    def test_parses_strings(self, form):
+        """Test dashed and hex string forms are parsed."""
+        value = uuid4()
+
+        assert _coerce_uuid(form(value)) == value
+
+    def test_rejects_invalid_string(self):
+        """Test invalid strings raise ValueError."""
+        with pytest.raises(ValueError, match="badly formed"):
+            _coerce_uuid("not-a-uuid")
+
+
+class TestTenantContextMiddleware:
+    """Tests for TenantContextMiddleware."""
+
+    def test_anonymous_request(self, rf):
+        """Test anonymous requests get no tenant and leave the context alone."""
+        request = rf.get("/")
+        request.user = MagicMock(is_authenticated=False)
+
+        with patch("shared.middleware.tenant_id_var") as var:
+            var.get.return_value = None
+            TenantContextMiddleware(lambda *_: HttpResponse())(request)
+
+        var.set.assert_not_called()
+        var.reset.assert_not_called()
+        assert request.tenant_id is None
+
+    def test_sets_tenant_from_jwt_claims(self, rf):
+        """Test the tenant from JWT claims is set for the request only."""
+        tenant_id = uuid4()
+        seen = []
+
+        def get_response(request):
+            seen.append(get_tenant_id())
+            return HttpResponse()
+
+        request = rf.get("/")
+        request.user = MagicMock(is_authenticated=True)
+        request.auth = {"tenant_id": str(tenant_id)}
+
+        TenantContextMiddleware(get_response)(request)
+
+        assert seen == [tenant_id]
+        assert request.tenant_id == tenant_id
+        assert get_tenant_id() is None
+
+    def test_binds_tenant_id_for_logging(self, rf, logs):
+        """Test the tenant ID is bound as a string for events logged by the view."""
+        tenant_id = uuid4()
+
+        def get_response(request):
+            structlog.get_logger().info("view_event")
+            return HttpResponse()
+
+        request = rf.get("/")
+        request.user = MagicMock(is_authenticated=True, tenant_id=tenant_id)
+
+        TenantContextMiddleware(get_response)(request)
+
+        assert logs[0]["tenant_id"] == str(tenant_id)
+        assert "tenant_id" not in structlog.contextvars.get_contextvars()
+
+    def test_session_tenant_used_when_claim_invalid(self, rf):
+        """Test an unparseable claim falls through to the session."""
+        tenant_id = uuid4()
+        request = rf.get("/")
+        request.user = MagicMock(is_authenticated=True)
+        request.auth = {"tenant_id": "not-a-uuid"}
+        request.session = {"tenant_id": str(tenant_id)}
+
+        TenantContextMiddleware(lambda *_: HttpResponse())(request)
+
+        assert request.tenant_id == tenant_id
+
+    def test_auth_without_get_is_ignored(self, rf):
+        """Test auth objects without a get method are skipped."""
+        request = rf.get("/")
+        request.user = MagicMock(is_authenticated=True, tenant_id=None)
+        request.auth = object()
+
+        TenantContextMiddleware(lambda *_: HttpResponse())(request)
+
+        assert request.tenant_id is None
+
+    def test_falls_back_to_user_tenant(self, rf):
+        """Test the user's tenant_id is used when no claim or session has one."""
+        tenant_id = uuid4()
+        request = rf.get("/")
+        request.user = MagicMock(is_authenticated=True, tenant_id=tenant_id)
+
+        TenantContextMiddleware(lambda *_: HttpResponse())(request)
+
+        assert request.tenant_id == tenant_id
+
+
+class TestRequestLoggingMiddleware:
+    """Tests for RequestLoggingMiddleware."""
+
+    @pytest.fixture
+    def info_enabled(self):
+        """Enable INFO for the middleware's level check."""
+        with patch("shared.middleware._stdlib_logger") as stdlib_logger:
+            stdlib_logger.isEnabledFor.return_value = True
+            yield stdlib_logger
+
+    def test_logs_start_and_completion(self, rf, logs, info_enabled):
+        """Test request start and completion events are logged."""
+        middleware = RequestLoggingMiddleware(lambda *_: HttpResponse(status=201))
+
+        response = middleware(rf.get("/api/v1/accounts/"))
+
+        assert response.status_code == 201
+        assert [log["event"] for log in logs] == [
+            "request_started",
+            "request_completed",
+        ]
+        assert logs[1]["status_code"] == 201
+        assert logs[1]["path"] == "/api/v1/accounts/"
+
+    def test_duration_in_milliseconds(self, rf, logs, info_enabled):
+        """Test the request duration is logged in milliseconds."""
+        middleware = RequestLoggingMiddleware(lambda *_: HttpResponse())
+
+        with patch.object(middleware, "_clock_ns", side_effect=[1_000_000, 13_456_789]):
+            middleware(rf.get("/api/v1/accounts/"))
+
+        assert logs[1]["duration_ms"] == 12.45
+
+    def test_skips_logging_when_info_disabled(self, rf, logs):
+        """Test no events are built when INFO is disabled."""
+        get_response = MagicMock(return_value=HttpResponse())
+        middleware = RequestLoggingMiddleware(get_response)
+
+        with patch("shared.middleware._stdlib_logger") as stdlib_logger:
+            stdlib_logger.isEnabledFor.return_value = False
+            middleware(rf.get("/api/v1/accounts/"))
+
+        stdlib_logger.isEnabledFor.assert_called_once_with(logging.INFO)
+        get_response.assert_called_once()
+        assert logs == []
+
+    @pytest.mark.parametrize(
+        "path", ["/health/", "/healthz", "/favicon.ico", "/static/app.css"]
+    )
+    def test_skips_health_checks_and_assets(self, rf, logs, info_enabled, path):
+        """Test health check and static asset requests are not logged."""
+        middleware = RequestLoggingMiddleware(lambda *_: HttpResponse())
+
+        middleware(rf.get(path))
+
+        assert logs == []
+
+
+class TestUsageTrackingMiddleware:
+    """Tests for UsageTrackingMiddleware."""
+
+    @pytest.mark.parametrize(
+        ("path", "auth", "tracked"),
+        [
+            ("/api/v1/accounts/", {"user_id": 1}, True),
+            ("/api/v1/accounts/", None, False),
+            ("/api/v1/auth/token/refresh/", {"user_id": 1}, False),
+            ("/api/v1/subscriptions/plans/", {"user_id": 1}, False),
+            ("/admin/", {"user_id": 1}, False),
+        ],
+    )
+    def test_should_track(self, rf, path, auth, tracked):
+        """Test only JWT-authenticated API requests outside exclusions count."""
+        request = rf.get(path)
+        request.user = MagicMock(is_authenticated=True)
+        request.auth = auth
+        middleware = UsageTrackingMiddleware(lambda *_: HttpResponse())
+
+        assert middleware._should_track(request) is tracked
+
+    def test_tracking_failure_is_logged(self, rf, logs):
+        """Test a failing usage service is logged without failing the request."""
+        request = rf.get("/api/v1/accounts/")
+        request.user = MagicMock(id=7)
+        usage_buffer = MagicMock()
+        usage_buffer.add.side_effect = RuntimeError("buffer broken")
+        middleware = UsageTrackingMiddleware(lambda *_: HttpResponse())
+
+        with patch(
+            "shared.middleware._subscription_services",
+            return_value=(MagicMock(), usage_buffer, "api_calls_daily"),
+        ):
+            middleware._track_usage(request)
+
+        usage_buffer.add.assert_called_once_with(7, "api_calls_daily")
+        assert logs[0]["event"] == "usage_tracking_failed"
+        assert logs[0]["user_id"] == "7"
+
+
+class TestAuditLoggingMiddleware:
+    """Tests for AuditLoggingMiddleware."""
+
+    @pytest.mark.parametrize(
+        ("method", "path", "audited"),
+        [
+            ("post", "/api/v1/finance/transfers/", True),
+            ("delete", "/api/v1/accounts/1/", True),
+            ("get", "/api/v1/accounts/", False),
+            ("post", "/api/v1/reports/", False),
+        ],
+    )
+    def test_should_audit(self, rf, method, path, audited):
+        """Test only write requests to auditable paths are audited."""
+        middleware = AuditLoggingMiddleware(lambda *_: HttpResponse())
+
+        assert middleware.should_audit(getattr(rf, method)(path)) is audited
+
+    @pytest.mark.parametrize(
+        ("method", "path", "action"),
+        [
+            ("post", "/api/v1/accounts/", AuditAction.ACCOUNT_CREATE),
+            ("post", "/api/v1/accounts/123/close/", AuditAction.ACCOUNT_CLOSE),
+            ("patch", "/api/v1/accounts/123/", AuditAction.ACCOUNT_UPDATE),
+            ("delete", "/api/v1/Accounts/123/", AuditAction.ACCOUNT_DELETE),
+            ("post", "/api/v1/transactions/1/void/", AuditAction.TRANSACTION_VOID),
+            ("post", "/api/v1/transfers/", AuditAction.TRANSFER_CREATE),
+            ("post", "/api/v1/assets/1/update-value/", AuditAction.ASSET_VALUE_UPDATE),
+            ("put", "/api/v1/liabilities/1/", AuditAction.LIABILITY_UPDATE),
+            ("post", "/api/v1/loans/1/record-payment/", AuditAction.LOAN_PAYMENT),
+            ("post", "/api/v1/auth/token/", AuditAction.USER_LOGIN),
+            ("post", "/api/v1/auth/password/reset/", AuditAction.USER_PASSWORD_RESET),
+            ("post", "/api/v1/accounts/1/reopen/", AuditAction.ACCOUNT_REOPEN),
+            ("patch", "/api/v1/accounts/1/close/", AuditAction.ACCOUNT_UPDATE),
+            ("post", "/api/v1/transactions/1/post/", AuditAction.TRANSACTION_POST),
+            ("post", "/api/v1/transactions/1/close/", AuditAction.TRANSACTION_CREATE),
+            ("post", "/api/v1/auth/token/refresh/", AuditAction.USER_LOGIN),
+            ("post", "/api/v1/auth/logout/", AuditAction.USER_LOGOUT),
+            ("post", "/api/v1/auth/verify-email/", AuditAction.USER_EMAIL_VERIFY),
+            ("post", "/api/v1/auth/password/change/", AuditAction.USER_PASSWORD_CHANGE),
+            (
+                "post",
+                "/api/v1/auth/password/reset/request/",
+                AuditAction.USER_PASSWORD_RESET,
+            ),
+            ("post", "/api/v1/auth/register/", None),
+            ("put", "/api/v1/transactions/1/", None),
+            ("post", "/api/v1/accountsx/", None),
+            ("post", "/api/v1/subscriptions/", None),
+        ],
+    )
+    def test_determine_action(self, rf, method, path, action):
+        """Test requests map to the expected audit action."""
+        middleware = AuditLoggingMiddleware(lambda *_: HttpResponse())
+
+        assert middleware._determine_action(getattr(rf, method)(path)) == action
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            (
+                "/api/v1/accounts/0b9e4d8a-52c1-4f2e-9d3b-6a7c8e9f0a1b/close/",
+                ("account", "0b9e4d8a-52c1-4f2e-9d3b-6a7c8e9f0a1b"),
+            ),
+            (
+                "/api/v1/loans/0B9E4D8A52C14F2E9D3B6A7C8E9F0A1B/",
+                ("loan", "0B9E4D8A52C14F2E9D3B6A7C8E9F0A1B"),
+            ),
+            ("/api/v1/transactions/not-a-uuid/", ("transaction", None)),
+            (
+                "/api/v1/assets/0b9e4d8a-52c1-4f2e-9d3b-6a7c8e9f0a1bff/",
+                ("asset", None),
+            ),
+            ("/api/v1/accountsx/categories/", ("categorie", None)),
+            ("/api/v1/transfers/", ("transfer", None)),
+            ("/api/v1/reports/", ("unknown", None)),
+        ],
+    )
+    def test_extract_resource_info(self, path, expected):
+        """Test the resource type and UUID are read from the path."""
+        middleware = AuditLoggingMiddleware(lambda *_: HttpResponse())
+
+        assert middleware._extract_resource_info(path) == expected
+
+
+class TestRequestContextMiddleware:
+    """Tests for RequestContextMiddleware."""
+
+    @pytest.fixture
+    def subscription_context(self):
+        """Patch subscription context loading."""
+        with patch("shared.middleware._subscription_context_for_user") as load_context:
+            load_context.return_value = MagicMock(name="PermissionContext")
+            yield load_context
+
+    def make_request(self, rf, method="get", path="/", **user_attrs):
+        """Build a request for an authenticated user."""
+        request = getattr(rf, method)(path, HTTP_X_CORRELATION_ID="cid-1")
+        request.user = MagicMock(is_authenticated=True, **user_attrs)
+        return request
+
+    def test_sets_request_context_for_the_view(self, rf, subscription_context):
+        """Test all three context variables are set for the request only."""
+        tenant_id = uuid4()
+        seen = []
+
+        def get_response(request):
+            seen.append(
+                (get_correlation_id(), get_tenant_id(), get_subscription_context())
+            )
+            return HttpResponse()
+
+        request = self.make_request(rf, tenant_id=tenant_id)
+        response = RequestContextMiddleware(get_response)(request)
+
+        assert seen == [("cid-1", tenant_id, subscription_context.return_value)]
+        assert response["X-Correlation-ID"] == "cid-1"
+        assert request.tenant_id == tenant_id
+        assert request.subscription_context is subscription_context.return_value
+        assert get_correlation_id() is None
+        assert get_tenant_id() is None
+        assert get_subscription_context() is None
+
+    def test_subscription_context_loaded_inside_request_context(
+        self, rf, subscription_context
+    ):
+        """Test the subscription lookup sees the correlation and tenant IDs."""
+        tenant_id = uuid4()
+        seen = []
+        subscription_context.side_effect = lambda _user: seen.append(
+            (get_correlation_id(), get_tenant_id())
+        )
+
+        request = self.make_request(rf, tenant_id=tenant_id)
+        RequestContextMiddleware(lambda *_: HttpResponse())(request)
+
+        assert seen == [("cid-1", tenant_id)]
+
+    def test_anonymous_request(self, rf, subscription_context):
+        """Test anonymous requests get a correlation ID but no tenant context."""
+        request = rf.get("/")
+        request.user = MagicMock(is_authenticated=False)
+
+        response = RequestContextMiddleware(lambda *_: HttpResponse())(request)
+
+        assert UUID(response["X-Correlation-ID"]).version == 4
+        assert request.tenant_id is None
+        assert request.subscription_context is None
+        subscription_context.assert_not_called()
+
+    def test_audits_and_tracks_in_request_context(self, rf, subscription_context):
+        """Test post-processing runs inside the request context."""
+        seen = []
+        request = self.make_request(rf, "post", "/api/v1/accounts/", tenant_id=uuid4())
+        request.auth = {"tenant_id": None}
+
+        with (
+            patch.object(
+                AuditLoggingMiddleware,
+                "_log_audit_event",
+                side_effect=lambda *_: seen.append(("audit", get_correlation_id())),
+            ),
+            patch.object(
+                UsageTrackingMiddleware,
+                "_track_usage",
+                side_effect=lambda *_: seen.append(("usage", get_correlation_id())),
+            ),
+        ):
+            RequestContextMiddleware(lambda *_: HttpResponse(status=201))(request)
+
+        assert seen == [("audit", "cid-1"), ("usage", "cid-1")]
+
+    def test_failed_requests_are_not_post_processed(self, rf, subscription_context):
+        """Test error responses are neither audited nor tracked."""
+        request = self.make_request(rf, "post", "/api/v1/accounts/")
+        request.auth = {"tenant_id": None}
+
+        with (
+            patch.object(AuditLoggingMiddleware, "_log_audit_event") as log_audit_event,
+            patch.object(UsageTrackingMiddleware, "_track_usage") as track_usage,
+        ):
+            RequestContextMiddleware(lambda *_: HttpResponse(status=400))(request)
+
+        log_audit_event.assert_not_called()
+        track_usage.assert_not_called()
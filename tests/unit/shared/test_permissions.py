@@ -0,0 +1,177 @@
+"""Unit tests for DRF permission classes."""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.db.models.signals import post_delete
+
+import pytest
+
+from modules.finance.infrastructure.models import Account
+from shared.permissions import (
+    CanCreateAccount,
+    IsActiveUser,
+    IsOwner,
+    IsOwnerOrReadOnly,
+    IsPremiumUser,
+    IsSuperAdmin,
+    TenantIsolation,
+    invalidate_account_count,
+)
+
+
+def make_request(**user_attrs):
+    """Create a request whose user has exactly the given attributes."""
+    user_attrs.setdefault("is_authenticated", True)
+    return SimpleNamespace(user=SimpleNamespace(**user_attrs))
+
+
+class TestRolePermissions:
+    """Tests for IsActiveUser, IsPremiumUser and IsSuperAdmin."""
+
+    @pytest.mark.parametrize(
+        ("user_attrs", "expected"),
+        [
+            ({"status": "active", "is_email_verified": True}, True),
+            ({"status": "suspended", "is_email_verified": True}, False),
+            ({"status": "active", "is_email_verified": False}, False),
+            ({}, True),
+            ({"is_authenticated": False}, False),
+        ],
+    )
+    def test_is_active_user(self, user_attrs, expected):
+        """Test status and email verification are checked when present."""
+        request = make_request(**user_attrs)
+
+        assert IsActiveUser().has_permission(request, MagicMock()) is expected
+
+    @pytest.mark.parametrize(
+        ("user_attrs", "premium", "superadmin"),
+        [
+            ({"role": "user"}, False, False),
+            ({"role": "premium"}, True, False),
+            ({"role": "superadmin"}, True, True),
+            ({}, False, False),
+            ({"role": "superadmin", "is_authenticated": False}, False, False),
+        ],
+    )
+    def test_role_checks(self, user_attrs, premium, superadmin):
+        """Test role permissions read the user's role once."""
+        request = make_request(**user_attrs)
+
+        assert IsPremiumUser().has_permission(request, MagicMock()) is premium
+        assert IsSuperAdmin().has_permission(request, MagicMock()) is superadmin
+
+    def test_no_user(self):
+        """Test a request without a user is denied."""
+        request = SimpleNamespace(user=None)
+
+        assert IsActiveUser().has_permission(request, MagicMock()) is False
+        assert IsPremiumUser().has_permission(request, MagicMock()) is False
+
+
+class TestCanCreateAccount:
+    """Tests for CanCreateAccount permission class."""
+
+    @pytest.fixture
+    def view(self):
+        """Create a view performing the create action."""
+        return SimpleNamespace(action="create")
+
+    def test_uses_cached_account_count(self, view):
+        """Test the tenant's account count is read through the cache."""
+        request = make_request(role="user", tenant_id="tenant-1")
+
+        with patch("shared.permissions.cache") as mock_cache:
+            mock_cache.get_or_set.return_value = 2
+            assert CanCreateAccount().has_permission(request, view) is True
+
+            mock_cache.get_or_set.return_value = 3
+            assert CanCreateAccount().has_permission(request, view) is False
+
+        key = mock_cache.get_or_set.call_args.args[0]
+        assert key == "acct_count:tenant-1"
+        assert mock_cache.get_or_set.call_args.kwargs["timeout"] == 60
+
+    def test_counts_accounts_on_cache_miss(self, view):
+        """Test a cache miss falls back to counting accounts."""
+        request = make_request(role="user", tenant_id="tenant-1")
+
+        with (
+            patch("shared.permissions.cache") as mock_cache,
+            patch("shared.permissions._count_accounts", return_value=1) as count,
+        ):
+            mock_cache.get_or_set.side_effect = lambda _key, default, **_: default()
+            assert CanCreateAccount().has_permission(request, view) is True
+
+        count.assert_called_once_with("tenant-1")
+
+    def test_premium_skips_count(self, view):
+        """Test premium users are not limited."""
+        request = make_request(role="premium", tenant_id="tenant-1")
+
+        with patch("shared.permissions.cache") as mock_cache:
+            assert CanCreateAccount().has_permission(request, view) is True
+
+        mock_cache.get_or_set.assert_not_called()
+
+    def test_account_delete_invalidates_cached_count(self, view):
+        """Test deleting an account drops the count cached for the tenant."""
+        tenant_id = str(uuid.uuid4())
+        request = make_request(role="user", tenant_id=tenant_id)
+
+        with patch("shared.permissions._count_accounts", return_value=3):
+            assert CanCreateAccount().has_permission(request, view) is False
+
+        post_delete.send(sender=Account, instance=SimpleNamespace(tenant_id=tenant_id))
+
+        with patch("shared.permissions._count_accounts", return_value=2) as count:
+            assert CanCreateAccount().has_permission(request, view) is True
+
+        count.assert_called_once_with(tenant_id)
+
+    def test_invalidate_account_count(self):
+        """Test invalidation deletes the tenant's cached count."""
+        with patch("shared.permissions.cache") as mock_cache:
+            invalidate_account_count("tenant-1")
+
+        mock_cache.delete.assert_called_once_with("acct_count:tenant-1")
+
+
+class TestTenantOwnership:
+    """Tests for IsOwner, IsOwnerOrReadOnly and TenantIsolation."""
+
+    TENANT = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    OTHER = uuid.UUID("87654321-4321-8765-4321-876543218765")
+
+    @pytest.mark.parametrize(
+        ("user_tenant", "obj_tenant", "expected"),
+        [
+            (TENANT, uuid.UUID(str(TENANT)), True),
+            (TENANT, OTHER, False),
+            (TENANT, str(TENANT), True),
+            (str(TENANT), TENANT, True),
+            (str(TENANT), str(OTHER), False),
+        ],
+    )
+    def test_tenant_comparison(self, user_tenant, obj_tenant, expected):
+        """Test UUID and string tenant IDs compare by value."""
+        request = make_request(tenant_id=user_tenant)
+        request.method = "PATCH"
+        obj = SimpleNamespace(tenant_id=obj_tenant)
+
+        for permission in (IsOwner(), IsOwnerOrReadOnly(), TenantIsolation()):
+            assert permission.has_object_permission(request, None, obj) is expected
+
+    def test_object_without_tenant(self):
+        """Test objects without a tenant keep each class's behavior."""
+        request = make_request(tenant_id=self.TENANT)
+        request.method = "PATCH"
+        obj = SimpleNamespace(tenant_id=None)
+
+        assert IsOwner().has_object_permission(request, None, obj) is True
+        assert IsOwnerOrReadOnly().has_object_permission(request, None, obj) is False
+        assert TenantIsolation().has_object_permission(request, None, obj) is True
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from modules.subscriptions.domain.services import PermissionContext
 from shared.permissions import (
     CanExport,
     HasApiAccess,
@@ -46,7 +47,7 @@ class TestHasFeature:
     def test_denies_access_without_feature(self, mock_request, mock_view):
         """Test that access is denied when user lacks the feature."""
         with (
-            patch("shared.middleware.get_subscription_context", return_value=None),
+            patch("shared.permissions.get_subscription_context", return_value=None),
             patch(
                 "modules.subscriptions.domain.services.PermissionService.has_feature",
                 return_value=False,
@@ -71,7 +72,7 @@ class TestHasFeature:
         mock_view.feature_code = "reports.advanced"
 
         with (
-            patch("shared.middleware.get_subscription_context", return_value=None),
+            patch("shared.permissions.get_subscription_context", return_value=None),
             patch(
                 "modules.subscriptions.domain.services.PermissionService.has_feature",
                 return_value=True,
@@ -84,6 +85,49 @@ class TestHasFeature:
                 mock_request.user, "reports.advanced"
             )
 
+    def test_uses_request_context_without_service(self, mock_request, mock_view):
+        """Test that the user's request context answers the check alone."""
+        context = PermissionContext(
+            user_id=mock_request.user.id,
+            tenant_id=uuid.uuid4(),
+            features=["export.csv"],
+        )
+
+        with (
+            patch("shared.permissions.get_subscription_context", return_value=context),
+            patch(
+                "modules.subscriptions.domain.services.PermissionService.has_feature",
+            ) as mock_has_feature,
+        ):
+            assert HasFeature("export.csv").has_permission(mock_request, mock_view)
+            assert not HasFeature("reports.advanced").has_permission(
+                mock_request, mock_view
+            )
+
+            mock_has_feature.assert_not_called()
+
+    def test_ignores_context_of_another_user(self, mock_request, mock_view):
+        """Test that a context for a different user falls back to the service."""
+        context = PermissionContext(
+            user_id=uuid.uuid4(),
+            tenant_id=uuid.uuid4(),
+            features=["reports.advanced"],
+        )
+
+        with (
+            patch("shared.permissions.get_subscription_context", return_value=context),
+            patch(
+                "modules.subscriptions.domain.services.PermissionService.has_feature",
+                return_value=False,
+            ) as mock_has_feature,
+        ):
+            permission = HasFeature("reports.advanced")
+
+            assert permission.has_permission(mock_request, mock_view) is False
+            mock_has_feature.assert_called_once_with(
+                mock_request.user, "reports.advanced"
+            )
+
     def test_denies_unauthenticated_users(self, mock_view):
         """Test that unauthenticated users are denied."""
         request = MagicMock()
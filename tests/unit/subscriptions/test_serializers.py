@@ -205,3 +205,70 @@ class TestFieldPermissionMixin:
             assert result["name"] == "Test Item"
             assert result["secret_field"] == "****"  # No premium feature
             assert result["notes"] == "Some notes"  # Has notes feature
+
+    def test_feature_checks_cached_across_list_items(self, mock_request):
+        """Test each feature is checked once for a whole many=True list."""
+        items = [
+            {
+                "id": uuid.uuid4(),
+                "name": f"Item {i}",
+                "secret_field": "secret123",
+                "notes": "Some notes",
+            }
+            for i in range(5)
+        ]
+
+        with patch(
+            "modules.subscriptions.domain.services.PermissionService.has_feature",
+            return_value=False,
+        ) as mock_has_feature:
+            serializer = SampleSerializer(
+                items, many=True, context={"request": mock_request}
+            )
+            result = serializer.data
+
+        assert [item["secret_field"] for item in result] == ["****"] * 5
+        # Only the masked field is checked, once for the whole list
+        mock_has_feature.assert_called_once_with(mock_request.user, "feature.premium")
+
+    def test_mask_decision_resolved_once_per_list(self):
+        """Test the fields to mask are worked out on the first item only."""
+        request = MagicMock()
+        request.user = MagicMock()
+        request.user.is_authenticated = False
+        items = [
+            {"id": uuid.uuid4(), "name": f"Item {i}", "secret_field": "secret123"}
+            for i in range(3)
+        ]
+
+        with patch.object(
+            SampleSerializer,
+            "_resolve_fields_to_mask",
+            autospec=True,
+            side_effect=SampleSerializer._resolve_fields_to_mask,
+        ) as mock_resolve:
+            serializer = SampleSerializer(
+                items, many=True, context={"request": request}
+            )
+            result = serializer.data
+
+        assert [item["secret_field"] for item in result] == ["****"] * 3
+        mock_resolve.assert_called_once()
+
+    def test_hidden_fields_not_visible_to_unauthenticated_user(self):
+        """Test hidden premium fields are removed without any feature check."""
+        request = MagicMock()
+        request.user = MagicMock()
+        request.user.is_authenticated = False
+
+        with patch(
+            "modules.subscriptions.domain.services.PermissionService.has_feature",
+        ) as mock_has_feature:
+            serializer = HiddenFieldSerializer(
+                {"id": uuid.uuid4(), "name": "Test Item", "secret_field": "x"},
+                context={"request": request},
+            )
+            result = serializer.data
+
+        assert "secret_field" not in result
+        mock_has_feature.assert_not_called()
@@ -15,6 +15,7 @@ from modules.subscriptions.domain.enums import (
     LimitKey,
     SubscriptionStatus,
     TierCode,
+    UsageType,
 )
 from modules.subscriptions.domain.services import (
     PermissionContext,
@@ -259,6 +260,64 @@ class TestPermissionService:
 
             assert result is True
 
+    def test_context_reused_from_process_cache(self, mock_user):
+        """Test repeated lookups skip the shared cache within the local TTL."""
+        context = PermissionContext(user_id=mock_user.id, tenant_id=mock_user.tenant_id)
+
+        with patch("modules.subscriptions.domain.services.cache") as mock_cache:
+            mock_cache.get.return_value = context
+
+            first = PermissionService.get_user_context(mock_user)
+            second = PermissionService.get_user_context(mock_user)
+
+        assert first is context
+        assert second is context
+        mock_cache.get.assert_called_once()
+
+    def test_process_cache_expires(self, mock_user):
+        """Test the shared cache is consulted again after the local TTL."""
+        context = PermissionContext(user_id=mock_user.id, tenant_id=mock_user.tenant_id)
+
+        with (
+            patch("modules.subscriptions.domain.services.cache") as mock_cache,
+            patch("modules.subscriptions.domain.services.time") as mock_time,
+        ):
+            mock_cache.get.return_value = context
+            mock_time.monotonic.side_effect = [
+                100.0,
+                100.0 + PermissionService.LOCAL_CACHE_TTL,
+            ]
+
+            PermissionService.get_user_context(mock_user)
+            PermissionService.get_user_context(mock_user)
+
+        assert mock_cache.get.call_count == 2
+
+    def test_invalidation_clears_process_cache(self, mock_user):
+        """Test invalidate_cache drops the per-process copy too."""
+        context = PermissionContext(user_id=mock_user.id, tenant_id=mock_user.tenant_id)
+
+        with patch("modules.subscriptions.domain.services.cache") as mock_cache:
+            mock_cache.get.return_value = context
+            PermissionService.get_user_context(mock_user)
+            PermissionService.invalidate_cache(mock_user.id)
+            PermissionService.get_user_context(mock_user)
+
+        assert mock_cache.get.call_count == 2
+
+    def test_clear_local_cache(self, mock_user):
+        """Test clearing the per-process cache sends lookups to the shared cache."""
+        context = PermissionContext(user_id=mock_user.id, tenant_id=mock_user.tenant_id)
+
+        with patch("modules.subscriptions.domain.services.cache") as mock_cache:
+            mock_cache.get.return_value = context
+            PermissionService.get_user_context(mock_user)
+            PermissionService.clear_local_cache()
+            PermissionService.get_user_context(mock_user)
+
+        assert mock_cache.get.call_count == 2
+        mock_cache.delete.assert_not_called()
+
     def test_cache_invalidation(self, mock_user):
         """Test that cache invalidation works."""
         with patch.object(
@@ -395,3 +454,73 @@ class TestUsageLimitService:
 
             assert allowed is True
             assert message is None
+
+    def test_get_current_usage_includes_buffered_increments(self, mock_user):
+        """Test periodic usage adds increments not yet flushed to the database."""
+        with (
+            patch(
+                "modules.subscriptions.infrastructure.models.UsageRecord.objects"
+            ) as mock_qs,
+            patch(
+                "modules.subscriptions.infrastructure.usage_buffer.usage_buffer"
+            ) as mock_buffer,
+        ):
+            mock_qs.get.return_value.count = 4
+            mock_buffer.pending.return_value = 2
+
+            usage = UsageLimitService.get_current_usage(
+                mock_user, UsageType.API_CALLS_DAILY.value
+            )
+
+            assert usage == 6
+            mock_buffer.pending.assert_called_once_with(
+                mock_user.id, UsageType.API_CALLS_DAILY.value
+            )
+
+    def test_bulk_increment_updates_existing_record(self, mock_user):
+        """Test buffered counts are added to an existing record in place."""
+        with patch(
+            "modules.subscriptions.infrastructure.models.UsageRecord.objects"
+        ) as mock_qs:
+            mock_qs.filter.return_value.update.return_value = 1
+
+            UsageLimitService.bulk_increment(
+                {(mock_user.id, UsageType.API_CALLS_DAILY.value): 5}
+            )
+
+            mock_qs.filter.assert_called_once_with(
+                user_id=mock_user.id,
+                usage_type=UsageType.API_CALLS_DAILY.value,
+                period_start=timezone.now().date(),
+            )
+            mock_qs.get_or_create.assert_not_called()
+
+    def test_bulk_increment_creates_missing_record(self, mock_user):
+        """Test a record is created with the buffered count when none exists."""
+        today = timezone.now().date()
+        with patch(
+            "modules.subscriptions.infrastructure.models.UsageRecord.objects"
+        ) as mock_qs:
+            mock_qs.filter.return_value.update.return_value = 0
+            mock_qs.get_or_create.return_value = (MagicMock(), True)
+
+            UsageLimitService.bulk_increment(
+                {(mock_user.id, UsageType.API_CALLS_DAILY.value): 3}
+            )
+
+            mock_qs.get_or_create.assert_called_once_with(
+                user_id=mock_user.id,
+                usage_type=UsageType.API_CALLS_DAILY.value,
+                period_start=today,
+                defaults={"count": 3, "period_end": today},
+            )
+            mock_qs.filter.return_value.update.assert_called_once()
+
+    def test_bulk_increment_skips_lifetime_usage(self, mock_user):
+        """Test usage types without a tracking period are not written."""
+        with patch(
+            "modules.subscriptions.infrastructure.models.UsageRecord.objects"
+        ) as mock_qs:
+            UsageLimitService.bulk_increment({(mock_user.id, "accounts"): 1})
+
+            mock_qs.filter.assert_not_called()
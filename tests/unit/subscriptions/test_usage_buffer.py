@@ -0,0 +1,81 @@
+"""Unit tests for buffered usage tracking."""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+from modules.subscriptions.infrastructure.usage_buffer import UsageBuffer
+
+
+class TestUsageBuffer:
+    """Tests for UsageBuffer."""
+
+    def make_buffer(self) -> tuple[UsageBuffer, MagicMock]:
+        """Create a buffer that flushes only when the test asks it to."""
+        flush_func = MagicMock()
+        buffer = UsageBuffer(flush_func)
+        # Mark the worker as started so no thread is spawned
+        buffer._thread = MagicMock()
+        return buffer, flush_func
+
+    def test_flush_sums_increments_per_user_and_type(self):
+        """Test increments are summed and written in one flush."""
+        buffer, flush_func = self.make_buffer()
+        user_id = uuid.uuid4()
+        other_user_id = uuid.uuid4()
+
+        buffer.add(user_id, "api_calls_daily")
+        buffer.add(user_id, "api_calls_daily", 2)
+        buffer.add(other_user_id, "api_calls_daily")
+        buffer.flush()
+
+        flush_func.assert_called_once_with(
+            {
+                (user_id, "api_calls_daily"): 3,
+                (other_user_id, "api_calls_daily"): 1,
+            }
+        )
+
+    def test_flush_resets_buffer(self):
+        """Test flushed increments are not written again."""
+        buffer, flush_func = self.make_buffer()
+        buffer.add(uuid.uuid4(), "api_calls_daily")
+
+        buffer.flush()
+        buffer.flush()
+
+        flush_func.assert_called_once()
+
+    def test_pending_counts_buffered_and_in_flight_increments(self):
+        """Test pending usage stays visible until the flush has written it."""
+        user_id = uuid.uuid4()
+        seen: list[int] = []
+        buffer = UsageBuffer(
+            lambda _counts: seen.append(buffer.pending(user_id, "api_calls_daily"))
+        )
+        buffer._thread = MagicMock()
+
+        buffer.add(user_id, "api_calls_daily", 2)
+        assert buffer.pending(user_id, "api_calls_daily") == 2
+
+        buffer.flush()
+
+        assert seen == [2]
+        assert buffer.pending(user_id, "api_calls_daily") == 0
+
+    def test_add_starts_worker(self):
+        """Test the flusher thread is started on first use."""
+        buffer = UsageBuffer(MagicMock())
+
+        with (
+            patch(
+                "modules.subscriptions.infrastructure.usage_buffer.threading.Thread"
+            ) as thread,
+            patch("modules.subscriptions.infrastructure.usage_buffer.atexit") as atexit,
+        ):
+            buffer.add(uuid.uuid4(), "api_calls_daily")
+            buffer.add(uuid.uuid4(), "api_calls_daily")
+
+        thread.return_value.start.assert_called_once()
+        atexit.register.assert_called_once_with(buffer.flush)